@@ -8,7 +8,7 @@ from typing import Set
 
 from doorstop import common, server
 from doorstop.cli import utilities
-from doorstop.core import editor, exporter, importer, publisher
+from doorstop.core import cache, editor, exporter, importer, publisher, vcs
 from doorstop.core.builder import build
 
 log = common.logger(__name__)
@@ -501,6 +501,8 @@ def run_export(args, cwd, error, catch=True, auto=False, _tree=None):
 
     """
     whole_tree = args.prefix == "all"
+    if getattr(args, "traceability", False):  # not set by `doorstop edit`
+        return _export_traceability(args, cwd, error, catch, _tree)
     ext = utilities.get_ext(args, error, ".yml", ".csv", whole_tree=whole_tree)
 
     # Get the tree or document
@@ -570,7 +572,13 @@ def run_publish(args, cwd, error, catch=True):
             msg = "publishing tree to '{}'...".format(path)
             utilities.show(msg, flush=True)
             published_path = publisher.publish(
-                tree, path, ext, template=args.template, **kwargs
+                tree,
+                path,
+                ext,
+                template=args.template,
+                jobs=args.jobs,
+                incremental=args.incremental_publish,
+                **kwargs,
             )
         else:
             msg = "publishing document {} to '{}'...".format(document, path)
@@ -591,6 +599,31 @@ def run_publish(args, cwd, error, catch=True):
     return True
 
 
+def run_cache(args, cwd, error, catch=True):
+    """Process arguments and run the `doorstop cache` subcommand.
+
+    :param args: Namespace of CLI arguments
+    :param cwd: current working directory
+    :param error: function to call for CLI errors
+    :param catch: catch and log :class:`~doorstop.common.DoorstopError`
+
+    """
+    if args.project and not os.path.isdir(args.project):
+        error("project directory not found: {}".format(args.project))
+
+    with utilities.capture(catch=catch) as success:
+        root = args.project or vcs.find_root(cwd)
+        if args.action == "clear":
+            path = os.path.join(root, cache.DIRECTORY)
+            utilities.show("clearing cache in {}...".format(path))
+            cache.clear(root)
+
+    if not success:
+        return False
+
+    return True
+
+
 def _request_next_number(args):
     """Get the server's "next number" method if a server exists."""
     if args.force:
@@ -617,7 +650,7 @@ def _get_tree(args, cwd, request_next_number=None, load=False):
 
     if load:
         utilities.show("loading documents...", flush=True)
-        tree.load()
+        tree.load(jobs=args.jobs)
 
     return tree
 
@@ -675,6 +708,25 @@ def _iter_items(args, tree, error):
                 yield item
 
 
+def _export_traceability(args, cwd, error, catch, _tree):
+    """Export the traceability matrix of the whole tree to a file."""
+    if args.prefix != "all" or not args.path:
+        error("traceability can only be exported for 'all' to a file")
+    ext = utilities.get_ext(args, error, ".csv", ".csv")
+
+    with utilities.capture(catch=catch) as success:
+        tree = _tree or _get_tree(args, cwd, load=True)
+        msg = "exporting traceability to '{}'...".format(args.path)
+        utilities.show(msg, flush=True)
+        path = exporter.export_traceability(tree, args.path, ext)
+
+    if not success:
+        return False
+
+    utilities.show("exported: {}".format(path))
+    return True
+
+
 def _export_import(args, cwd, error, document, ext):
     """Edit a document by calling export followed by import.
 
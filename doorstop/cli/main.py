@@ -34,6 +34,25 @@ def main(args=None):  # pylint: disable=R0915
         help="path to the root of the project",
         default=root,
     )
+    project.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="number of processes used to load, check, and publish",
+    )
+    project.add_argument(
+        "--documents",
+        metavar="PATH",
+        action="append",
+        help="path in the project to search for documents (repeatable)",
+    )
+    project.add_argument(
+        "--exclude",
+        metavar="GLOB",
+        action="append",
+        help="pattern of directories to skip when searching for documents",
+    )
     project.add_argument("--no-cache", action="store_true", help=argparse.SUPPRESS)
     server = argparse.ArgumentParser(add_help=False)
     server.add_argument(
@@ -126,6 +145,11 @@ def main(args=None):  # pylint: disable=R0915
         action="store_true",
         help="do not check item review status",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-validate items affected by changes since the last run",
+    )
     parser.add_argument(
         "-s",
         "--skip",
@@ -161,6 +185,7 @@ def main(args=None):  # pylint: disable=R0915
     _import(subs, shared)
     _export(subs, shared)
     _publish(subs, shared)
+    _cache(subs, shared)
 
     # Parse arguments
     args = parser.parse_args(args=args)
@@ -174,8 +199,10 @@ def main(args=None):  # pylint: disable=R0915
     # Run the program
     function = commands.get(args.command)
     try:
-        success = function(args, os.getcwd(), parser.error)
-    except common.DoorstopFileError as exc:
+        with vcs.batch():
+            success = function(args, os.getcwd(), parser.error)
+    except common.DoorstopError as exc:
+        # e.g. version control commands run when the batch is flushed
         log.error(exc)
         success = False
     except KeyboardInterrupt:
@@ -517,6 +544,11 @@ def _export(subs, shared):
     group.add_argument("-t", "--tsv", action="store_true", help="output TSV")
     group.add_argument("-x", "--xlsx", action="store_true", help="output XLSX")
     sub.add_argument("-w", "--width", type=int, help="limit line width on text output")
+    sub.add_argument(
+        "--traceability",
+        action="store_true",
+        help="export the traceability matrix of 'all' to a CSV, TSV, or JSONL file",
+    )
 
 
 def _publish(subs, shared):
@@ -551,6 +583,21 @@ def _publish(subs, shared):
         help="do not include levels on heading and non-heading or non-heading items",
     )
     sub.add_argument("--template", help="template file", default=None)
+    sub.add_argument(
+        "--incremental",
+        dest="incremental_publish",
+        action="store_true",
+        help="only publish documents changed since the last publish to the path",
+    )
+
+
+def _cache(subs, shared):
+    """Configure the `doorstop cache` subparser."""
+    info = "manage the cache of parsed files and validation results"
+    sub = subs.add_parser(
+        "cache", description=info.capitalize() + ".", help=info, **shared
+    )
+    sub.add_argument("action", choices=["clear"], help="delete all cached data")
 
 
 if __name__ == "__main__":
@@ -34,8 +34,15 @@ class SettingsTestCase(unittest.TestCase):
             settings.CACHE_DOCUMENTS,
             settings.CACHE_ITEMS,
             settings.CACHE_PATHS,
+            settings.CACHE_PARSED,
+            settings.CACHE_REFERENCES,
+            settings.CACHE_MANIFEST,
             settings.WARN_ALL,
             settings.ERROR_ALL,
+            settings.VALIDATE_INCREMENTAL,
+            settings.VALIDATE_JOBS,
+            settings.DOCUMENT_ROOTS,
+            settings.DOCUMENT_EXCLUDES,
             settings.SERVER_HOST,
             settings.SERVER_PORT,
         )
@@ -54,8 +61,15 @@ class SettingsTestCase(unittest.TestCase):
             settings.CACHE_DOCUMENTS,
             settings.CACHE_ITEMS,
             settings.CACHE_PATHS,
+            settings.CACHE_PARSED,
+            settings.CACHE_REFERENCES,
+            settings.CACHE_MANIFEST,
             settings.WARN_ALL,
             settings.ERROR_ALL,
+            settings.VALIDATE_INCREMENTAL,
+            settings.VALIDATE_JOBS,
+            settings.DOCUMENT_ROOTS,
+            settings.DOCUMENT_EXCLUDES,
             settings.SERVER_HOST,
             settings.SERVER_PORT,
         ) = self.backup
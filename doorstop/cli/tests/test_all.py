@@ -79,6 +79,10 @@ class TestMain(SettingsTestCase):
         os.chdir(self.temp)
         self.assertIs(None, main(["--project", "."]))
 
+    def test_main_jobs(self):
+        """Verify 'doorstop' can load items with worker processes."""
+        self.assertIs(None, main(["--jobs", "2"]))
+
 
 @unittest.skipUnless(os.getenv(ENV), REASON)
 class TestCreate(TempTestCase):
@@ -712,6 +716,18 @@ class TestExport(TempTestCase):
         """Verify 'doorstop export' returns an error with no path."""
         self.assertRaises(SystemExit, main, ["export", "all"])
 
+    def test_export_tree_traceability(self):
+        """Verify 'doorstop export' can create a traceability CSV file."""
+        path = os.path.join(self.temp, "traceability.csv")
+        self.assertIs(None, main(["export", "all", path, "--traceability"]))
+        self.assertTrue(os.path.isfile(path))
+
+    def test_export_tree_traceability_jsonl(self):
+        """Verify 'doorstop export' can create a traceability JSON lines file."""
+        path = os.path.join(self.temp, "traceability.jsonl")
+        self.assertIs(None, main(["export", "all", path, "--traceability"]))
+        self.assertTrue(os.path.isfile(path))
+
 
 @unittest.skipUnless(os.getenv(ENV), REASON)
 class TestPublish(TempTestCase):
@@ -810,11 +826,43 @@ class TestPublish(TempTestCase):
         self.assertTrue(os.path.isdir(path))
         self.assertFalse(os.path.isfile(os.path.join(path, "index.html")))
 
+    def test_publish_tree_text_jobs(self):
+        """Verify 'doorstop publish' can render documents in parallel."""
+        path = os.path.join(self.temp, "all")
+        self.assertIs(None, main(["publish", "all", path, "--text", "--jobs", "2"]))
+        self.assertTrue(os.path.isdir(path))
+        self.assertTrue(os.listdir(path))
+
+    def test_publish_tree_text_incremental(self):
+        """Verify 'doorstop publish' can skip unchanged documents."""
+        path = os.path.join(self.temp, "all")
+        args = ["publish", "all", path, "--text", "--incremental"]
+        self.assertIs(None, main(args))
+        self.assertIs(None, main(args))
+        self.assertTrue(os.path.isfile(os.path.join(path, ".doorstop-publish.json")))
+
     def test_publish_tree_no_path(self):
         """Verify 'doorstop publish' returns an error with no path."""
         self.assertRaises(SystemExit, main, ["publish", "all"])
 
 
+class TestCache(MockTestCase):
+    """Integration tests for the 'doorstop cache' command."""
+
+    def test_cache_clear(self):
+        """Verify 'doorstop cache clear' deletes the cache directory."""
+        path = os.path.join(self.temp, ".doorstop-cache")
+        os.makedirs(path)
+        common.touch(os.path.join(path, "parse.json"))
+        self.assertIs(None, main(["cache", "clear", "--project", self.temp]))
+        self.assertFalse(os.path.exists(path))
+
+    def test_cache_clear_missing_project(self):
+        """Verify 'doorstop cache clear' returns an error for a missing project."""
+        path = os.path.join(self.temp, "missing")
+        self.assertRaises(SystemExit, main, ["cache", "clear", "--project", path])
+
+
 class TestPublishCommand(TempTestCase):
     """Tests 'doorstop publish' options toc and template"""
 
@@ -838,6 +886,50 @@ class TestPublishCommand(TempTestCase):
         )
 
 
+@patch("doorstop.settings.ADDREMOVE_FILES", False)
+class TestExportTraceability(MockTestCase):
+    """Integration tests for the 'doorstop export --traceability' option."""
+
+    def setUp(self):
+        super().setUp()
+        main(["create", "REQ", "reqs"])
+        main(["create", "TST", "tests", "--parent", "REQ"])
+        main(["add", "REQ"])
+        main(["add", "TST"])
+        main(["link", "TST1", "REQ1"])
+
+    def test_export_traceability_csv(self):
+        """Verify 'doorstop export' can create a traceability CSV file."""
+        path = os.path.join(self.temp, "traceability.csv")
+        self.assertIs(None, main(["export", "all", path, "--traceability"]))
+        lines = common.read_text(path).splitlines()
+        self.assertEqual(["REQ,TST", "REQ0001,TST0001"], lines)
+
+    def test_export_traceability_jsonl(self):
+        """Verify 'doorstop export' can create a traceability JSON lines file."""
+        path = os.path.join(self.temp, "traceability.jsonl")
+        self.assertIs(None, main(["export", "all", path, "--traceability"]))
+        text = common.read_text(path)
+        self.assertEqual('{"REQ": "REQ0001", "TST": "TST0001"}\n', text)
+
+    def test_export_traceability_unknown(self):
+        """Verify 'doorstop export' returns an error for an unknown format."""
+        path = os.path.join(self.temp, "traceability.xlsx")
+        args = ["export", "all", path, "--traceability"]
+        self.assertRaises(SystemExit, main, args)
+        self.assertFalse(os.path.exists(path))
+
+    def test_export_traceability_document(self):
+        """Verify 'doorstop export' only exports the traceability of 'all'."""
+        path = os.path.join(self.temp, "traceability.csv")
+        args = ["export", "REQ", path, "--traceability"]
+        self.assertRaises(SystemExit, main, args)
+
+    def test_export_traceability_no_path(self):
+        """Verify 'doorstop export' returns an error with no path."""
+        self.assertRaises(SystemExit, main, ["export", "all", "--traceability"])
+
+
 @patch("doorstop.cli.commands.run", Mock(return_value=True))
 class TestLogging(unittest.TestCase):
     """Integration tests for the Doorstop CLI logging."""
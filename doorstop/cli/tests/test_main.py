@@ -10,6 +10,8 @@ from unittest.mock import Mock, patch
 from doorstop import settings
 from doorstop.cli import main
 from doorstop.cli.tests import SettingsTestCase
+from doorstop.common import DoorstopError
+from doorstop.core.vcs import base
 
 
 class TestMain(SettingsTestCase):
@@ -26,6 +28,22 @@ class TestMain(SettingsTestCase):
         """Verify the CLI can be interrupted."""
         self.assertRaises(SystemExit, main.main, [])
 
+    def test_vcs_error(self):
+        """Verify version control errors after a command are reported."""
+
+        def flush():
+            base._pending.remove(working)  # pylint: disable=protected-access
+            raise DoorstopError("Command not found: git")
+
+        def run(*_):
+            base._pending.append(working)  # pylint: disable=protected-access
+            return True
+
+        working = Mock(flush=Mock(side_effect=flush))
+        with patch("doorstop.cli.commands.run", Mock(side_effect=run)):
+            self.assertRaises(SystemExit, main.main, [])
+        working.flush.assert_called_once_with()
+
     @patch("doorstop.cli.commands.run", Mock())
     def test_empty(self):
         """Verify 'doorstop' can be run in a working copy with no docs."""
@@ -42,6 +60,8 @@ class TestMain(SettingsTestCase):
         self.assertTrue(settings.CACHE_PATHS)
         self.assertFalse(settings.WARN_ALL)
         self.assertFalse(settings.ERROR_ALL)
+        self.assertFalse(settings.VALIDATE_INCREMENTAL)
+        self.assertEqual(1, settings.VALIDATE_JOBS)
 
     @patch("doorstop.cli.commands.run", Mock())
     def test_options(self):
@@ -60,6 +80,9 @@ class TestMain(SettingsTestCase):
                     "--no-cache",
                     "--warn-all",
                     "--error-all",
+                    "--incremental",
+                    "--jobs",
+                    "2",
                 ]
             ),
         )
@@ -75,6 +98,8 @@ class TestMain(SettingsTestCase):
         self.assertFalse(settings.CACHE_PATHS)
         self.assertTrue(settings.WARN_ALL)
         self.assertTrue(settings.ERROR_ALL)
+        self.assertTrue(settings.VALIDATE_INCREMENTAL)
+        self.assertEqual(2, settings.VALIDATE_JOBS)
 
     def test_main(self):
         testargs = [sep.join(["doorstop", "cli", "main.py"])]
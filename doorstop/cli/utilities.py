@@ -99,10 +99,21 @@ def configure_settings(args):
         settings.CHECK_SUSPECT_LINKS = args.no_suspect_check is False
     if args.no_review_check is not None:
         settings.CHECK_REVIEW_STATUS = args.no_review_check is False
+    if args.jobs is not None:
+        settings.VALIDATE_JOBS = args.jobs
+    if args.incremental is not None:
+        settings.VALIDATE_INCREMENTAL = args.incremental is True
     if args.no_cache is not None:
         settings.CACHE_DOCUMENTS = args.no_cache is False
         settings.CACHE_ITEMS = args.no_cache is False
         settings.CACHE_PATHS = args.no_cache is False
+        settings.CACHE_PARSED = args.no_cache is False
+        settings.CACHE_REFERENCES = args.no_cache is False
+        settings.CACHE_MANIFEST = args.no_cache is False
+    if args.documents is not None:
+        settings.DOCUMENT_ROOTS = args.documents
+    if args.exclude is not None:
+        settings.DOCUMENT_EXCLUDES = args.exclude
     if args.warn_all is not None:
         settings.WARN_ALL = args.warn_all is True
     if args.error_all is not None:
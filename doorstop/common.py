@@ -5,6 +5,7 @@
 import argparse
 import codecs
 import csv
+import filecmp
 import glob
 import io
 import logging
@@ -14,6 +15,9 @@ import shutil
 
 import frontmatter
 import yaml
+from yaml.emitter import Emitter
+
+from doorstop import settings
 
 verbosity = 0  # global verbosity setting for controlling string formatting
 PRINT_VERBOSITY = 0  # minimum verbosity to using `print`
@@ -124,6 +128,107 @@ def read_text(path):
         raise DoorstopError(msg)
 
 
+def read_bytes(path):
+    """Read the raw contents of a file.
+
+    :param path: file path to read from
+
+    :return: bytes or None if the file cannot be read
+
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _use_libyaml():
+    """Determine if the libyaml C bindings should be used."""
+    return settings.USE_LIBYAML and getattr(yaml, "__with_libyaml__", False)
+
+
+# characters libyaml and the pure-Python parser and emitter treat differently
+_LIBYAML_UNSAFE_CHARS = re.compile(
+    "[^\n\x20-\x7e\xa0-\ud7ff\ue000-\ufefe\uff00-\ufffd]"
+)
+_EMITTER = Emitter(io.StringIO(), allow_unicode=True)  # only analyzes scalars
+
+
+def _safe_load(text, loader=yaml.SafeLoader):
+    """Load YAML text, parsing with libyaml when results are identical.
+
+    Errors are always reported by the pure-Python parser so their
+    messages do not depend on how the text was parsed.
+
+    """
+    if loader is yaml.SafeLoader and _use_libyaml():
+        if not _LIBYAML_UNSAFE_CHARS.search(text):
+            try:
+                return yaml.load(text, Loader=yaml.CSafeLoader)
+            except yaml.error.YAMLError:
+                pass  # report the error from the pure-Python parser
+    return yaml.load(text, Loader=loader)
+
+
+def _libyaml_emits_identically(data):
+    """Determine if libyaml would dump data exactly like the pure-Python emitter.
+
+    libyaml folds double-quoted scalars, counts characters outside the
+    Basic Multilingual Plane differently, and ends documents that end in
+    a "keep" literal block with an explicit marker, so data is only dumped
+    with libyaml when no string would be dumped in those ways.
+
+    """
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str)
+            and "\n" not in key
+            and _libyaml_emits_identically(key)
+            and _libyaml_emits_identically(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(_libyaml_emits_identically(value) for value in data)
+    if isinstance(data, str):
+        return _libyaml_emits_text_identically(data)
+    return data is None or isinstance(data, (bool, int, float))
+
+
+def _libyaml_emits_text_identically(text):
+    """Determine if libyaml would dump a string like the pure-Python emitter."""
+    if _LIBYAML_UNSAFE_CHARS.search(text):
+        return False
+    if type(text) is not str:  # pylint: disable=unidiomatic-typecheck
+        # subclasses are dumped in the literal block style
+        if text.endswith("\n\n"):
+            return False
+        return not text or _EMITTER.analyze_scalar(text).allow_block
+    if "\n" in text:
+        return _EMITTER.analyze_scalar(text).allow_single_quoted
+    return True
+
+
+def _yaml_dumper(data):
+    """Get the fastest YAML dumper that produces identical output for data."""
+    if _use_libyaml() and _libyaml_emits_identically(data):
+        return yaml.CDumper
+    return yaml.Dumper
+
+
+def dump_yaml(data):
+    """Dump a dictionary to YAML text.
+
+    :param data: dictionary of YAML data
+
+    :return: text to write to a file
+
+    """
+    return yaml.dump(
+        data, Dumper=_yaml_dumper(data), default_flow_style=False, allow_unicode=True
+    )
+
+
 def load_yaml(text, path, loader=yaml.SafeLoader):
     """Parse a dictionary from YAML text.
 
@@ -135,7 +240,7 @@ def load_yaml(text, path, loader=yaml.SafeLoader):
     """
     # Load the YAML data
     try:
-        data = yaml.load(text, Loader=loader) or {}
+        data = _safe_load(text, loader=loader) or {}
     except yaml.error.YAMLError as exc:
         msg = "invalid contents: {}:\n{}".format(path, exc)
         raise DoorstopError(msg) from None
@@ -147,6 +252,17 @@ def load_yaml(text, path, loader=yaml.SafeLoader):
     return data
 
 
+class _YAMLHandler(frontmatter.YAMLHandler):
+    """YAML front matter handler that uses libyaml when available."""
+
+    def load(self, fm, **kwargs):
+        return _safe_load(fm)
+
+    def export(self, metadata, **kwargs):
+        kwargs["Dumper"] = _yaml_dumper(metadata)
+        return super().export(metadata, **kwargs)
+
+
 def load_markdown(text, path, textattributekeys):
     """Parse a dictionary from Markdown file with YAML frontmatter.
 
@@ -158,7 +274,7 @@ def load_markdown(text, path, textattributekeys):
     """
     # Load YAML-frontmatter data from text
     try:
-        data, content = frontmatter.parse(text, handler=frontmatter.YAMLHandler())
+        data, content = frontmatter.parse(text, handler=_YAMLHandler())
     except yaml.error.YAMLError as exc:
         msg = "invalid yaml contents: {}:\n{}".format(path, exc)
         raise DoorstopError(msg) from None
@@ -240,11 +356,19 @@ def touch(path):
         write_text("", path)
 
 
-def copy_dir_contents(src, dst):
-    """Copy the contents of a directory."""
+def copy_dir_contents(src, dst, copied=None):
+    """Copy the contents of a directory.
+
+    :param src: directory to copy the contents of
+    :param dst: directory to copy the contents to
+    :param copied: set of destination paths copied earlier in the same
+        publish; when given, paths left by an earlier publish are updated
+        (copying only changed files) and added to the set
+
+    """
     for fpath in glob.glob("{}/*".format(src)):
         dest_path = os.path.join(dst, os.path.split(fpath)[-1])
-        if os.path.exists(dest_path):
+        if os.path.exists(dest_path) and (copied is None or dest_path in copied):
             if os.path.basename(fpath) == "doorstop":
                 msg = "Skipping '{}' as this directory name is required by doorstop".format(
                     fpath
@@ -254,6 +378,9 @@ def copy_dir_contents(src, dst):
                     fpath
                 )
             log.warning(msg)
+        elif copied is not None:
+            _update_path(fpath, dest_path)
+            copied.add(dest_path)
         else:
             if os.path.isdir(fpath):
                 shutil.copytree(fpath, dest_path)
@@ -261,6 +388,24 @@ def copy_dir_contents(src, dst):
                 shutil.copyfile(fpath, dest_path)
 
 
+def _update_path(src, dst):
+    """Make a file or directory match its source, copying changed files."""
+    if os.path.isdir(src):
+        if not os.path.isdir(dst):
+            delete(dst)
+            os.makedirs(dst)
+        names = os.listdir(src)
+        for name in os.listdir(dst):
+            if name not in names:
+                delete(os.path.join(dst, name))
+        for name in names:
+            _update_path(os.path.join(src, name), os.path.join(dst, name))
+    elif not (os.path.isfile(dst) and filecmp.cmp(src, dst)):
+        log.trace("copying '{}'...".format(src))  # type: ignore
+        delete(dst)
+        shutil.copy2(src, dst)  # keep the time to compare quickly next time
+
+
 def delete(path):
     """Delete a file or directory with error handling."""
     if os.path.isdir(path):
@@ -276,9 +421,16 @@ def delete(path):
         os.remove(path)
 
 
-def delete_contents(dirname):
-    """Delete the contents of a directory."""
+def delete_contents(dirname, keep=()):
+    """Delete the contents of a directory.
+
+    :param dirname: directory to delete the contents of
+    :param keep: paths in the directory to leave in place
+
+    """
     for file in glob.glob("{}/*".format(dirname)):
+        if file in keep:
+            continue
         if os.path.isdir(file):
             shutil.rmtree(os.path.join(dirname, file))
         else:
@@ -343,7 +495,5 @@ def dump_markdown(data, textattr):
 
     content += textattr["text"]
 
-    text = frontmatter.dumps(
-        frontmatter.Post(content, **data), Dumper=yaml.dumper.Dumper
-    )
+    text = frontmatter.dumps(frontmatter.Post(content, **data), handler=_YAMLHandler())
     return text
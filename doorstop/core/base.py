@@ -7,10 +7,9 @@ import functools
 import os
 from typing import Dict
 
-import yaml
-
 from doorstop import common, settings
 from doorstop.common import DoorstopError, DoorstopInfo, DoorstopWarning
+from doorstop.core import cache
 
 log = common.logger(__name__)
 
@@ -24,11 +23,14 @@ def add_item(func):
         if settings.ADDREMOVE_FILES and item.tree:
             item.tree.vcs.add(item.path)
         # pylint: disable=W0212
-        if item not in item.document._items:
+        if item.uid not in item.document._item_index:
             item.document._items.append(item)
+            item.document._item_index[item.uid] = item
         if settings.CACHE_ITEMS and item.tree:
             item.tree._item_cache[item.uid] = item
             log.trace("cached item: {}".format(item))  # type: ignore
+        if item.tree:
+            item.tree._traceability = None
         return item
 
     return wrapped
@@ -40,7 +42,7 @@ def edit_item(func):
     @functools.wraps(func)
     def wrapped(self, *args, **kwargs):
         item = func(self, *args, **kwargs) or self
-        if settings.ADDREMOVE_FILES and item.tree:
+        if settings.ADDREMOVE_FILES and item.tree and not item.unchanged:
             item.tree.vcs.edit(item.path)
         return item
 
@@ -53,11 +55,15 @@ def delete_item(func):
     @functools.wraps(func)
     def wrapped(self, *args, **kwargs):
         item = func(self, *args, **kwargs) or self
+        if item.tree:
+            item.tree._unindex_item(item)  # pylint: disable=W0212
         if settings.ADDREMOVE_FILES and item.tree:
             item.tree.vcs.delete(item.path)
         # pylint: disable=W0212
         if item in item.document._items:
             item.document._items.remove(item)
+        if item.document._item_index.get(item.uid) is item:
+            del item.document._item_index[item.uid]
         if settings.CACHE_ITEMS and item.tree:
             item.tree._item_cache[item.uid] = None
             log.trace("expunged item: {}".format(item))  # type: ignore
@@ -90,7 +96,7 @@ def edit_document(func):
     @functools.wraps(func)
     def wrapped(self, *args, **kwargs):
         document = func(self, *args, **kwargs) or self
-        if settings.ADDREMOVE_FILES and document.tree:
+        if settings.ADDREMOVE_FILES and document.tree and not document.unchanged:
             document.tree.vcs.edit(document.config)
         return document
 
@@ -187,6 +193,7 @@ def auto_save(func):
     @functools.wraps(func)
     def wrapped(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
+        self._invalidate()  # pylint: disable=W0212
         if self.auto:
             self.save()
         return result
@@ -202,7 +209,20 @@ class BaseFileObject(metaclass=abc.ABCMeta):
 
     """
 
+    # `auto` has no slot so that its class default can be changed; objects
+    # only get a `__dict__` when they override it
+    __slots__ = (
+        "path",
+        "root",
+        "_data",
+        "_exists",
+        "_loaded",
+        "_unchanged",
+        "__dict__",
+    )
+
     auto = True  # set to False to delay automatic save until explicit save
+    unchanged_writes = 0  # number of writes skipped because files matched
 
     def __init__(self):
         self.path = None
@@ -210,6 +230,7 @@ class BaseFileObject(metaclass=abc.ABCMeta):
         self._data: Dict[str, str] = {}
         self._exists = True
         self._loaded = False
+        self._unchanged = False
 
     def __hash__(self):
         return hash(self.path)
@@ -220,6 +241,9 @@ class BaseFileObject(metaclass=abc.ABCMeta):
     def __ne__(self, other):
         return not self == other
 
+    def _invalidate(self):
+        """Discard values computed from the object's properties."""
+
     @staticmethod
     def _create(path, name):
         """Create a new file for the object.
@@ -259,6 +283,36 @@ class BaseFileObject(metaclass=abc.ABCMeta):
             raise DoorstopError(msg)
         return common.read_text(path)
 
+    def _read_parsed(self, path, parse):
+        """Read and parse a file, reusing data cached by an earlier run.
+
+        :param path: path to a text file
+        :param parse: function to parse the file's text into a dictionary
+
+        :return: dictionary of parsed data
+
+        """
+        data = self._get_parsed(path)
+        if data is None:
+            text = self._read(path)
+            data = parse(text)
+            self._cache_parsed(path, text, data)
+        return data
+
+    def _get_parsed(self, path):
+        """Get data parsed from a file if it is unchanged since caching."""
+        if not settings.CACHE_PARSED:
+            return None
+        return cache.get(self.root).get(path, self._read)
+
+    def _cache_parsed(self, path, text, data):
+        """Store data parsed from a file for later runs."""
+        if not settings.CACHE_PARSED:
+            return
+        if "!include" in text:
+            return  # included files are not tracked by the cache
+        cache.get(self.root).put(path, text, data)
+
     @staticmethod
     def _load(text, path, **kwargs):
         """Load YAML data from text.
@@ -282,13 +336,23 @@ class BaseFileObject(metaclass=abc.ABCMeta):
     def _write(self, text, path):
         """Write text to the object's file.
 
+        The file is left untouched when it already contains the text.
+
         :param text: text to write to a file
         :param path: path to the file
 
         """
         if not self._exists:
             raise DoorstopError("cannot save to deleted: {}".format(self))
-        common.write_text(text, path, end=settings.WRITE_LINESEPERATOR)
+        end = settings.WRITE_LINESEPERATOR
+        self._unchanged = common.read_bytes(path) == text.replace("\n", end).encode(
+            "utf-8"
+        )
+        if self._unchanged:
+            log.trace("unchanged file: {}".format(path))  # type: ignore
+            BaseFileObject.unchanged_writes += 1
+            return
+        common.write_text(text, path, end=end)
 
     @staticmethod
     def _dump(data):
@@ -299,7 +363,7 @@ class BaseFileObject(metaclass=abc.ABCMeta):
         :return: text to write to a file
 
         """
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return common.dump_yaml(data)
 
     # properties #############################################################
 
@@ -310,6 +374,11 @@ class BaseFileObject(metaclass=abc.ABCMeta):
         relpath = os.path.relpath(self.path, self.root)
         return "@{}{}".format(os.sep, relpath)
 
+    @property
+    def unchanged(self):
+        """Indicate if the last save found the file's text already up to date."""
+        return self._unchanged
+
     # extended attributes ####################################################
 
     @property  # type: ignore
@@ -2,18 +2,23 @@
 
 """Functions to build a tree and access documents and items."""
 
+import fnmatch
 import os
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Set
 
-from doorstop import common
+from doorstop import common, settings
 from doorstop.common import DoorstopError
-from doorstop.core import vcs
+from doorstop.core import cache, vcs
 from doorstop.core.document import Document
 from doorstop.core.tree import Tree
 
 log = common.logger(__name__)
 _tree: Optional[Tree] = None  # implicit tree for convenience functions
 
+SKIP_ALL = ".doorstop.skip-all"  # skip a directory and its subdirectories
+EXCLUDE_DIRNAMES = {".git", ".venv", "venv", cache.DIRECTORY}
+
 
 def build(cwd=None, root=None, request_next_number=None) -> Tree:
     """Build a tree from the current working directory or explicit root.
@@ -36,28 +41,28 @@ def build(cwd=None, root=None, request_next_number=None) -> Tree:
 
     # Find all documents in the working copy
     log.info("looking for documents in {}...".format(root))
-    skip_file_name = ".doorstop.skip-all"
-    if not os.path.isfile(os.path.join(root, skip_file_name)):
-        _document_from_path(root, root, documents)
-    exclude_dirnames = {".git", ".venv", "venv"}
-    if not os.path.isfile(os.path.join(root, skip_file_name)):
-        for dirpath, dirnames, _ in os.walk(root, topdown=True):
-            whilelist_dirnames = []
-            for dirname in dirnames:
-                if dirname in exclude_dirnames:
-                    continue
-                path = os.path.join(dirpath, dirname)
-                if os.path.isfile(os.path.join(path, skip_file_name)):
-                    continue
-                whilelist_dirnames.append(dirname)
-                _document_from_path(path, root, documents)
-            dirnames[:] = whilelist_dirnames
+    working_copy = vcs.load(root)
+    manifest = cache.get_manifest(root) if settings.CACHE_MANIFEST else None
+    key = [settings.DOCUMENT_ROOTS, settings.DOCUMENT_EXCLUDES]
+    paths = manifest.get_documents(key) if manifest else None
+    if paths is None:
+        stats: Optional[Dict[str, List[int]]] = {} if manifest else None
+        paths = _find_documents(root, working_copy, documents, stats)
+        if manifest:
+            relpaths = [os.path.relpath(path, root) for path in paths]
+            manifest.set_documents(key, relpaths, stats)
+    else:
+        log.debug("using the documents found by the last search")
+        for relpath in paths:
+            path = root if relpath == os.curdir else os.path.join(root, relpath)
+            _document_from_path(path, root, documents)
 
     # Build the tree
     if not documents:
         log.info("no documents found in: {}".format(root))
     log.info("building tree...")
     tree = Tree.from_list(documents, root=root)
+    tree._vcs = working_copy  # pylint: disable=W0212
     tree.request_next_number = request_next_number
     if len(tree):  # pylint: disable=len-as-condition
         log.info("built tree: {}".format(tree))
@@ -66,6 +71,110 @@ def build(cwd=None, root=None, request_next_number=None) -> Tree:
     return tree
 
 
+def _find_documents(root, working_copy, documents, stats=None):
+    """Search the configured roots of a working copy for documents.
+
+    Each directory is listed once, and only directories containing a
+    document's configuration file are loaded as documents. Directories
+    are skipped when they contain `.doorstop.skip-all`, match an exclude
+    pattern, or are ignored by the working copy.
+
+    :param root: path to root of working copy
+    :param working_copy: working copy to check for ignored directories
+    :param documents: list of :class:`~doorstop.core.document.Document`
+        to append results
+    :param stats: dictionary to record the modification time and size of
+        each directory listed and ignore file found
+
+    :return: list of paths to directories with a document configuration
+
+    """
+    paths: List[str] = []
+    patterns = ["*/" + pattern for pattern in settings.DOCUMENT_EXCLUDES]
+    regex = re.compile(
+        "|".join(fnmatch.translate(pattern) for pattern in patterns) or "(?!)"
+    )
+    visited: Set[str] = set()
+
+    def excluded(relpath):
+        """Determine if a directory should not be searched for documents."""
+        if os.path.basename(relpath) in EXCLUDE_DIRNAMES:
+            return True
+        if regex.match("/" + relpath.replace(os.path.sep, "/")):
+            return True
+        return working_copy.ignored_dir(relpath)
+
+    def scan(path):
+        """List a directory, recording what was read for the manifest."""
+        if stats is not None:
+            cache.stat(path, stats)
+        filenames, dirnames = _scan(path)
+        if stats is not None:
+            for filename in working_copy.IGNORES:
+                if filename in filenames:
+                    cache.stat(os.path.join(path, filename), stats)
+        return filenames, dirnames
+
+    def search(path, relpath, dirnames):
+        """Load the documents below a directory in `os.walk` order."""
+        children = []
+        for dirname, islink in dirnames:
+            child = os.path.join(path, dirname)
+            child_relpath = os.path.join(relpath, dirname)
+            if child in visited or excluded(child_relpath):
+                continue
+            visited.add(child)
+            filenames, child_dirnames = scan(child)
+            if SKIP_ALL in filenames:
+                continue
+            if Document.CONFIG in filenames:
+                paths.append(child)
+                _document_from_path(child, root, documents)
+            if not islink:
+                children.append((child, child_relpath, child_dirnames))
+        for child, child_relpath, child_dirnames in children:
+            search(child, child_relpath, child_dirnames)
+
+    for path in settings.DOCUMENT_ROOTS or [root]:
+        path = os.path.normpath(os.path.join(root, path))
+        relpath = os.path.relpath(path, root)
+        relpath = "" if relpath == os.curdir else relpath
+        if path in visited or (relpath and excluded(relpath)):
+            continue
+        visited.add(path)
+        filenames, dirnames = scan(path)
+        if SKIP_ALL in filenames:
+            continue
+        if Document.CONFIG in filenames:
+            paths.append(path)
+            _document_from_path(path, root, documents)
+        search(path, relpath, dirnames)
+
+    return paths
+
+
+def _scan(path):
+    """List the names in a directory and its subdirectories.
+
+    :return: set of all names, list of subdirectory name and symlink flag
+
+    """
+    filenames = set()
+    dirnames = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                filenames.add(entry.name)
+                try:
+                    if entry.is_dir():
+                        dirnames.append((entry.name, entry.is_symlink()))
+                except OSError:
+                    continue
+    except OSError as exc:
+        log.debug("unable to list directory: {}".format(exc))
+    return filenames, dirnames
+
+
 def _document_from_path(path, root, documents):
     """Attempt to create and append a document from the specified path.
 
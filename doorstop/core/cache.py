@@ -0,0 +1,569 @@
+# SPDX-License-Identifier: LGPL-3.0-only
+
+"""Persistent caches of parsed files, validation results, references, and paths."""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Optional, Set, Tuple
+
+from doorstop import common, settings
+
+log = common.logger(__name__)
+
+DIRECTORY = ".doorstop-cache"  # cache directory in the project root
+VERSION = 1  # incremented when the format of cached data changes
+RACY_NS = 2 * 10**9  # entries cached this soon after a change are hash checked
+USED_NS = 24 * 60 * 60 * 10**9  # resolution of last-used times for eviction
+
+_stores: Dict[Tuple[type, str], "_Store"] = {}
+
+
+class _Store(metaclass=ABCMeta):
+    """Base class for data stored in a project's cache directory."""
+
+    FILENAME = ""
+
+    def __init__(self, root):
+        self.root = root
+        self.path = os.path.join(root, DIRECTORY)
+        self._dirty = False
+        self._registered = False
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.path)
+
+    def _read(self):
+        """Read the stored contents from disk.
+
+        :return: dictionary of contents or None if missing or outdated
+
+        """
+        path = os.path.join(self.path, self.FILENAME)
+        if not os.path.isfile(path):
+            return None
+        log.debug("reading cache from {}...".format(path))
+        try:
+            with open(path, "r", encoding="utf-8") as stream:
+                contents = json.load(stream)
+        except (OSError, ValueError) as exc:
+            log.debug("ignored unreadable cache: {}".format(exc))
+            return None
+        if not isinstance(contents, dict) or contents.get("version") != VERSION:
+            return None
+        return contents
+
+    def _write(self, contents):
+        """Write contents to disk atomically."""
+        path = os.path.join(self.path, self.FILENAME)
+        log.debug("writing cache to {}...".format(path))
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            ignore = os.path.join(self.path, ".gitignore")
+            if not os.path.isfile(ignore):
+                common.write_text("# Created by Doorstop\n*\n", ignore)
+            temp = path + ".{}.tmp".format(os.getpid())
+            with open(temp, "w", encoding="utf-8") as stream:
+                json.dump(dict(contents, version=VERSION), stream)
+            os.replace(temp, path)
+        except OSError as exc:
+            log.debug("unable to write cache: {}".format(exc))
+        self._dirty = False
+
+    def _mark_dirty(self):
+        """Schedule the cache to be written when the process exits."""
+        self._dirty = True
+        if not self._registered:
+            atexit.register(self.save)
+            self._registered = True
+
+    @abstractmethod
+    def _reset(self):  # pragma: no cover (abstract method)
+        """Forget all data held in memory."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self):  # pragma: no cover (abstract method)
+        """Write changed data to disk."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Delete all cached data from memory and disk."""
+        self._reset()
+        self._dirty = False
+        if os.path.isdir(self.path):
+            log.info("deleting {}...".format(self.path))
+            shutil.rmtree(self.path)
+
+
+class ParseCache(_Store):
+    """Stores data parsed from files, keyed by path and validated by stat.
+
+    Entries are reused while a file's modification time and size are
+    unchanged. A content hash is kept for every entry and checked when
+    `settings.CACHE_PARSED_HASH` is set or the file changed too close to
+    the time it was cached for its modification time to be trusted.
+    Least recently used entries are evicted when the cache is larger than
+    `settings.CACHE_PARSED_SIZE`.
+
+    """
+
+    FILENAME = "parse.json"
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._entries: Optional[Dict[str, dict]] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def entries(self):
+        """Get the cached entries, reading them from disk on first use."""
+        if self._entries is None:
+            contents = self._read() or {}
+            self._entries = contents.get("entries", {})
+        return self._entries
+
+    def get(self, path, read):
+        """Get data parsed from a file if it is unchanged since caching.
+
+        :param path: path to the file
+        :param read: function to read the file's text for hash checks
+
+        :return: cached data or None
+
+        """
+        key = os.path.abspath(path)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+        if not result or (result.st_mtime_ns, result.st_size) != (
+            entry["mtime"],
+            entry["size"],
+        ):
+            self.misses += 1
+            return None
+        now = time.time_ns()
+        racy = entry["mtime"] + RACY_NS >= entry["stored"]
+        if racy or settings.CACHE_PARSED_HASH:
+            if _hash(read(path)) != entry["hash"]:
+                self.misses += 1
+                return None
+            if racy and entry["mtime"] + RACY_NS < now:
+                entry["stored"] = now  # the content is now known to be stable
+                self._mark_dirty()
+        if now - entry["used"] > USED_NS:
+            entry["used"] = now
+            self._mark_dirty()
+        self.hits += 1
+        log.trace("found cached data: {}".format(path))  # type: ignore
+        return json.loads(entry["data"])
+
+    def put(self, path, text, data):
+        """Store data parsed from a file's text.
+
+        Data that does not survive a round trip through JSON unchanged
+        (e.g. dates) is not cached.
+
+        :param path: path to the file
+        :param text: text read from the file
+        :param data: dictionary parsed from the text
+
+        """
+        key = os.path.abspath(path)
+        try:
+            dumped = json.dumps(data)
+            cacheable = json.loads(dumped) == data
+            result = os.stat(path)
+        except (TypeError, ValueError, OSError):
+            cacheable = False
+        if not cacheable:
+            log.trace("data not cacheable: {}".format(path))  # type: ignore
+            if self.entries.pop(key, None):
+                self._mark_dirty()
+            return
+        now = time.time_ns()
+        self.entries[key] = {
+            "mtime": result.st_mtime_ns,
+            "size": result.st_size,
+            "hash": _hash(text),
+            "stored": now,
+            "used": now,
+            "data": dumped,
+        }
+        self._mark_dirty()
+
+    def save(self):
+        """Write changed entries to disk, evicting the least recently used."""
+        if not self._dirty:
+            return
+        log.debug("parse cache: {} hits, {} misses".format(self.hits, self.misses))
+        self._evict()
+        self._write({"entries": self.entries})
+
+    def _reset(self):
+        self._entries = {}
+
+    def _evict(self):
+        """Drop least recently used entries until the size limit is met."""
+        sizes = {key: len(entry["data"]) for key, entry in self.entries.items()}
+        total = sum(sizes.values())
+        if total <= settings.CACHE_PARSED_SIZE:
+            return
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["used"]):
+            total -= sizes[key]
+            del self.entries[key]
+            if total <= settings.CACHE_PARSED_SIZE:
+                break
+        log.debug("evicted parse cache entries to {} bytes".format(total))
+
+
+class ValidationCache(_Store):
+    """Stores the issues found in each item by the last validation.
+
+    Entries are keyed by item UID and record a fingerprint of the item's
+    data and document, the item file's modification time and size, the
+    UIDs the item links to, and the issues found in the item. All entries
+    are discarded when the settings used for validation change.
+
+    """
+
+    FILENAME = "validate.json"
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._contents: Optional[dict] = None
+
+    def get_entries(self, key):
+        """Get the entries recorded by a validation with the same settings.
+
+        :param key: list of values identifying the validation settings
+
+        :return: dictionary of item UID to entry
+
+        """
+        if self._contents is None:
+            self._contents = self._read() or {}
+        if self._contents.get("key") != key:
+            log.debug("validation settings changed, discarding recorded issues")
+            self._contents = {"key": key, "entries": {}}
+        return self._contents["entries"]
+
+    def set_entries(self, key, entries):
+        """Replace the recorded entries.
+
+        :param key: list of values identifying the validation settings
+        :param entries: dictionary of item UID to entry
+
+        """
+        self._contents = {"key": key, "entries": entries}
+        self._mark_dirty()
+
+    def save(self):
+        """Write the recorded entries to disk."""
+        if not self._dirty:
+            return
+        self._write(self._contents)
+
+    def _reset(self):
+        self._contents = {}
+
+
+class ReferenceCache(_Store):
+    """Stores the lines on which external references were found in files.
+
+    Entries are keyed by path and reused while a file's modification time
+    and size are unchanged. Each entry records the lines of the references
+    that were searched for in every file by the last run, and the lines of
+    the keywords searched for in that file. Unchanged files are only
+    searched again for references that are new since the last run.
+
+    """
+
+    FILENAME = "references.json"
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._contents: Optional[dict] = None
+        self._refs: Set[str] = set()
+        self._new: Set[str] = set()
+        self._visited: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def contents(self):
+        """Get the cached contents, reading them from disk on first use."""
+        if self._contents is None:
+            contents = self._read() or {}
+            self._contents = {
+                "refs": contents.get("refs", []),
+                "files": contents.get("files", {}),
+            }
+        return self._contents
+
+    def start(self, refs):
+        """Start a search of all files for references.
+
+        :param refs: references that will be searched for
+
+        """
+        self.save()  # only complete searches are written
+        self._refs = set(refs)
+        self._new = self._refs - set(self.contents["refs"])
+        self._visited = set()
+
+    def search(self, path, refs, keywords, search):
+        """Get the lines of references and keywords found in a file.
+
+        :param path: path to the file
+        :param refs: references to find in the file
+        :param keywords: keywords to find in the file
+        :param search: function to search the file for references and
+            keywords, returning dictionaries of each found to its line
+
+        :return: dictionary of references found to line numbers,
+            dictionary of keywords to line numbers or None if not found
+
+        """
+        key = os.path.abspath(path)
+        self._visited.add(key)
+        entry = self.contents["files"].get(key)
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+        if (
+            entry is None
+            or not result
+            or (result.st_mtime_ns, result.st_size) != (entry["mtime"], entry["size"])
+            or entry["mtime"] + RACY_NS >= entry["stored"]
+        ):
+            entry = {"refs": {}, "keywords": {}}
+            missing = set(refs)
+        else:
+            missing = {ref for ref in self._new if ref in refs}
+        found = {ref: line for ref, line in entry["refs"].items() if ref in refs}
+        found_words = {
+            word: line for word, line in entry["keywords"].items() if word in keywords
+        }
+        missing_words = set(keywords) - set(found_words)
+        if not missing and not missing_words:
+            self.hits += 1
+            return found, found_words
+        self.misses += 1
+        lines, lines_words = search(path, missing, missing_words)
+        found.update(lines)
+        found_words.update({word: lines_words.get(word) for word in missing_words})
+        if result:
+            self.contents["files"][key] = {
+                "mtime": result.st_mtime_ns,
+                "size": result.st_size,
+                "stored": time.time_ns(),
+                "refs": found,
+                "keywords": found_words,
+            }
+        return found, found_words
+
+    def finish(self):
+        """Record that all files were searched and drop files not found."""
+        log.debug("reference cache: {} hits, {} misses".format(self.hits, self.misses))
+        files = self.contents["files"]
+        for key in set(files) - self._visited:
+            del files[key]
+        self.contents["refs"] = sorted(self._refs)
+        self._mark_dirty()
+
+    def save(self):
+        """Write the cached contents to disk."""
+        if not self._dirty:
+            return
+        self._write(self.contents)
+
+    def _reset(self):
+        self._contents = {"refs": [], "files": {}}
+
+
+class Manifest(_Store):
+    """Stores the paths of documents and items found in a project.
+
+    Each list of paths is recorded with the modification time and size of
+    every directory and file read while finding them. A list is reused
+    while all of these are unchanged, as adding, removing, or renaming a
+    file changes the modification time of its directory.
+
+    """
+
+    FILENAME = "manifest.json"
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._contents: Optional[dict] = None
+
+    @property
+    def contents(self):
+        """Get the cached contents, reading them from disk on first use."""
+        if self._contents is None:
+            contents = self._read() or {}
+            self._contents = {
+                "documents": contents.get("documents", {}),
+                "items": contents.get("items", {}),
+            }
+        return self._contents
+
+    def get_documents(self, key):
+        """Get the paths of the documents found with the same settings.
+
+        :param key: list of values identifying the search settings
+
+        :return: list of document paths or None if outdated
+
+        """
+        entry = self.contents["documents"]
+        if entry.get("key") != key:
+            return None
+        return self._get_paths(entry)
+
+    def set_documents(self, key, paths, stats):
+        """Record the paths of the documents found.
+
+        :param key: list of values identifying the search settings
+        :param paths: list of document paths
+        :param stats: dictionary of each path read while searching to its
+            modification time and size
+
+        """
+        self.contents["documents"] = _entry(paths, stats, key=key)
+        self._mark_dirty()
+
+    def get_items(self, path):
+        """Get the paths of a document's item files.
+
+        :param path: path to the document's directory
+
+        :return: list of item file paths or None if outdated
+
+        """
+        entry = self.contents["items"].get(os.path.abspath(path))
+        if entry is None:
+            return None
+        return self._get_paths(entry)
+
+    def set_items(self, path, paths, stats):
+        """Record the paths of a document's item files.
+
+        :param path: path to the document's directory
+        :param paths: list of item file paths
+        :param stats: dictionary of each directory read while listing
+            item files to its modification time and size
+
+        """
+        self.contents["items"][os.path.abspath(path)] = _entry(paths, stats)
+        self._mark_dirty()
+
+    @staticmethod
+    def _get_paths(entry):
+        """Get the paths recorded in an entry if nothing read has changed."""
+        for path, (mtime, size) in entry["stats"].items():
+            # Changes made too soon after recording might not change mtime
+            if mtime + RACY_NS >= entry["stored"]:
+                return None
+            try:
+                result = os.stat(path)
+            except OSError:
+                return None
+            if (result.st_mtime_ns, result.st_size) != (mtime, size):
+                return None
+        return entry["paths"]
+
+    def save(self):
+        """Write the cached contents to disk."""
+        if not self._dirty:
+            return
+        self._write(self.contents)
+
+    def _reset(self):
+        self._contents = {"documents": {}, "items": {}}
+
+
+def stat(path, stats):
+    """Record a path's modification time and size for a manifest.
+
+    :param path: path to a file or directory
+    :param stats: dictionary to update
+
+    """
+    try:
+        result = os.stat(path)
+    except OSError:
+        return
+    stats[os.path.abspath(path)] = [result.st_mtime_ns, result.st_size]
+
+
+def _entry(paths, stats, **kwargs):
+    """Create a manifest entry recording paths and the stats they rely on."""
+    return dict(kwargs, paths=list(paths), stats=dict(stats), stored=time.time_ns())
+
+
+def get(root):
+    """Get the shared parse cache for a project root."""
+    return _get_store(ParseCache, root)
+
+
+def get_validation(root):
+    """Get the shared validation cache for a project root."""
+    return _get_store(ValidationCache, root)
+
+
+def get_references(root):
+    """Get the shared reference cache for a project root."""
+    return _get_store(ReferenceCache, root)
+
+
+def get_manifest(root):
+    """Get the shared manifest of document and item paths for a project root."""
+    return _get_store(Manifest, root)
+
+
+def clear(root):
+    """Delete all cached data for a project root."""
+    store = get(root)
+    for (_, path), other in _stores.items():
+        if path == store.root:
+            other.clear()
+    store.clear()
+
+
+def fingerprint(*values):
+    """Get a hash of JSON-serializable values.
+
+    :return: hash or None if the values cannot be serialized
+
+    """
+    try:
+        text = json.dumps(values, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return _hash(text)
+
+
+def _get_store(cls, root):
+    """Get the shared store of a class for a project root."""
+    key = (cls, os.path.abspath(root))
+    if key not in _stores:
+        _stores[key] = cls(key[1])
+    return _stores[key]
+
+
+def _hash(text):
+    """Get a content hash for a file's text."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
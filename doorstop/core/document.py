@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: LGPL-3.0-only
+# pylint: disable=C0302
 
 """Representation of a collection of items."""
 
@@ -12,6 +13,7 @@ import yaml
 
 from doorstop import common, settings
 from doorstop.common import DoorstopError, DoorstopInfo, DoorstopWarning
+from doorstop.core import cache
 from doorstop.core.base import (
     BaseFileObject,
     BaseValidatable,
@@ -72,6 +74,7 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
         self._data["itemformat"] = kwargs.get("itemformat")  # type: ignore
         self._extended_reviewed: List[str] = []
         self._items: List[Item] = []
+        self._item_index: Dict[UID, Item] = {}
         self._itered = False
         self.children: List[Document] = []
 
@@ -178,10 +181,14 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
 
     def _load_with_include(self, yamlfile):
         """Load the YAML file and process input tags."""
-        # Read text from file
-        text = self._read(yamlfile)
+        # Read and parse YAML data from file
+        return self._read_parsed(
+            yamlfile, lambda text: self._parse_with_include(text, yamlfile)
+        )
+
+    def _parse_with_include(self, text, yamlfile):
+        """Parse YAML data from text and process input tags."""
 
-        # Parse YAML data from text
         class IncludeLoader(yaml.SafeLoader):
             def include(self, node):
                 container = IncludeLoader.filenames[0]  # type: ignore
@@ -201,8 +208,14 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
         IncludeLoader.filenames = [yamlfile]  # type: ignore
         return self._load(text, yamlfile, loader=IncludeLoader)
 
-    def load(self, reload=False):
-        """Load the document's properties from its file."""
+    def load(self, reload=False, _parse_items=True):
+        """Load the document's properties from its file.
+
+        :param reload: reload the document and its items
+        :param _parse_items: parse item files while reloading (disabled
+            when the tree parses them in worker processes)
+
+        """
         if self._loaded and not reload:
             return
         log.debug("loading {}...".format(repr(self)))
@@ -246,7 +259,7 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
         # Set meta attributes
         self._loaded = True
         if reload:
-            list(self._iter(reload=reload))
+            list(self._iter(reload=reload, _parse_items=_parse_items))
 
     @edit_document
     def save(self):
@@ -282,7 +295,7 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
         self._loaded = False
         self.auto = True
 
-    def _iter(self, reload=False):
+    def _iter(self, reload=False, _parse_items=True):
         """Yield the document's items."""
         if self._itered and not reload:
             msg = "iterating document {}'s loaded items...".format(self)
@@ -292,53 +305,120 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
         log.info("loading document {}'s items...".format(self))
         # Reload the document's item
         self._items = []
-        for dirpath, dirnames, filenames in os.walk(self.path):
-            for dirname in list(dirnames):
-                path = os.path.join(dirpath, dirname, Document.CONFIG)
-                if os.path.exists(path):
-                    path = os.path.dirname(path)
-                    dirnames.remove(dirname)
-                    log.trace(  # type: ignore
-                        "skipped embedded document: {}".format(path)
-                    )
-            for filename in filenames:
-                path = os.path.join(dirpath, filename)
-                try:
-                    item = Item(
-                        self,
-                        path,
-                        root=self.root,
-                        tree=self.tree,
-                        itemformat=self.itemformat,
-                    )
-                except DoorstopError:
-                    pass  # skip non-item files
-                else:
-                    self._items.append(item)
-                    if reload:
-                        try:
-                            item.load(reload=reload)
-                        except Exception:
-                            log.error("Unable to load: %s", item)
-                            raise
-                    if settings.CACHE_ITEMS and self.tree:
-                        self.tree._item_cache[  # pylint: disable=protected-access
-                            item.uid
-                        ] = item
-                        log.trace("cached item: {}".format(item))  # type: ignore
+        self._item_index = {}
+        if self.tree:
+            self.tree._link_index = None  # pylint: disable=W0212
+            self.tree._traceability = None  # pylint: disable=W0212
+        manifest = cache.get_manifest(self.root) if settings.CACHE_MANIFEST else None
+        relpaths = manifest.get_items(self.path) if manifest else None
+        stats = None
+        if relpaths is None:
+            stats = {} if manifest else None
+            paths = self._find_files(stats)
+        else:
+            log.trace("using the item files found by the last search")  # type: ignore
+            assert self.path
+            paths = (os.path.join(self.path, relpath) for relpath in relpaths)
+        found = []
+        for path in paths:
+            try:
+                item = Item(
+                    self,
+                    path,
+                    root=self.root,
+                    tree=self.tree,
+                    itemformat=self.itemformat,
+                )
+            except DoorstopError:
+                pass  # skip non-item files
+            else:
+                found.append(os.path.relpath(path, self.path))
+                self._items.append(item)
+                self._item_index.setdefault(item.uid, item)
+                if reload and _parse_items:
+                    try:
+                        item.load(reload=reload)
+                    except Exception:
+                        log.error("Unable to load: %s", item)
+                        raise
+                if settings.CACHE_ITEMS and self.tree:
+                    self.tree._item_cache[  # pylint: disable=protected-access
+                        item.uid
+                    ] = item
+                    log.trace("cached item: {}".format(item))  # type: ignore
+        if manifest and stats is not None:
+            manifest.set_items(self.path, found, stats)
         # Set meta attributes
         self._itered = True
         # Yield items
         yield from list(self._items)
 
-    def copy_assets(self, dest):
-        """Copy the contents of the assets directory."""
+    def _find_files(self, stats=None):
+        """Yield the paths of files named like items in the document.
+
+        Directories are listed in the same order as :func:`os.walk`,
+        skipping embedded documents and the document's assets and
+        template directories.
+
+        :param stats: dictionary to record the modification time and size
+            of each directory listed
+
+        """
+        skipped = {Document.ASSETS, Document.TEMPLATE}
+        dirpaths = [self.path]
+        while dirpaths:
+            dirpath = dirpaths.pop()
+            if stats is not None:
+                cache.stat(dirpath, stats)
+            try:
+                with os.scandir(dirpath) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            if dirpath != self.path and any(
+                entry.name == Document.CONFIG for entry in entries
+            ):
+                log.trace("skipped embedded document: {}".format(dirpath))  # type: ignore
+                continue
+            subdirpaths = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            continue
+                        if dirpath == self.path and entry.name in skipped:
+                            continue
+                        subdirpaths.append(entry.path)
+                    elif self._is_item_filename(entry.name) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+            dirpaths.extend(reversed(subdirpaths))
+
+    def _is_item_filename(self, filename):
+        """Determine if a filename has an item's extension and a valid UID."""
+        name, ext = os.path.splitext(filename)
+        if ext.lower() not in Item.EXTENSIONS.get(self.itemformat, ()):
+            return False
+        try:
+            UID(name).check()
+        except DoorstopError:
+            return False
+        return True
+
+    def copy_assets(self, dest, copied=None):
+        """Copy the contents of the assets directory.
+
+        :param dest: directory to copy the assets to
+        :param copied: set of paths copied in the same incremental publish
+
+        """
         if not self.assets:
             return
         # Create folder if it does not exist.
         if not os.path.isdir(dest):
             os.makedirs(dest)
-        common.copy_dir_contents(self.assets, dest)
+        common.copy_dir_contents(self.assets, dest, copied)
 
     # properties #############################################################
 
@@ -829,22 +909,26 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
 
         """
         uid = UID(value)
-        for item in self:
-            if item.uid == uid:
-                if item.active:
-                    return item
-                else:
-                    log.trace("item is inactive: {}".format(item))  # type: ignore
+        if not self._itered:
+            list(self._iter())
+        item = self._item_index.get(uid)
+        if item:
+            if item.active:
+                return item
+            else:
+                log.trace("item is inactive: {}".format(item))  # type: ignore
 
         raise DoorstopError("no matching{} UID: {}".format(_kind, uid))
 
     def get_issues(
-        self, skip=None, document_hook=None, item_hook=None
+        self, skip=None, document_hook=None, item_hook=None, _issues=None
     ):  # pylint: disable=unused-argument
         """Yield all the document's issues.
 
         :param skip: list of document prefixes to skip
         :param item_hook: function to call for custom item validation
+        :param _issues: dictionary of item UID to the issues found by
+            item validation, used when present and filled in otherwise
 
         :return: generator of :class:`~doorstop.common.DoorstopError`,
                               :class:`~doorstop.common.DoorstopWarning`,
@@ -877,15 +961,31 @@ class Document(BaseValidatable, BaseFileObject):  # pylint: disable=R0902
 
         # Check each item
         for item in items:
+            if _issues is None:
+                item_issues = item_validator.get_issues(item, skip=skip)
+            else:
+                item_issues = self._get_item_issues(item_validator, item, skip, _issues)
             # Check item
             for issue in chain(
-                hook(item=item, document=self, tree=self.tree),
-                item_validator.get_issues(item, skip=skip),
+                hook(item=item, document=self, tree=self.tree), item_issues
             ):
                 # Prepend the item's UID to yielded exceptions
                 if isinstance(issue, Exception):
                     yield type(issue)("{}: {}".format(item.uid, issue))
 
+    @staticmethod
+    def _get_item_issues(item_validator, item, skip, issues):
+        """Yield an item's issues, using and recording them in a dictionary."""
+        if item.uid in issues:
+            log.debug("using issues already found for item %s...", item)
+            found = issues[item.uid]
+        else:
+            found = item_validator.get_issues(item, skip=skip)
+        issues[item.uid] = []
+        for issue in found:
+            issues[item.uid].append(issue)
+            yield issue
+
     @staticmethod
     def _get_issues_level(items):
         """Yield all the document's issues related to item level."""
@@ -3,6 +3,7 @@
 """Functions to export documents and items."""
 
 import datetime
+import json
 import os
 from collections import defaultdict
 from typing import Any, Dict
@@ -105,6 +106,60 @@ def export_file(obj, path, ext=None, **kwargs):
         raise common.DoorstopFileError(msg) from None
 
 
+def export_traceability(tree, path, ext=None):
+    """Stream a tree's traceability matrix to a file.
+
+    Rows are written as they are found so the whole matrix is never
+    held in memory.
+
+    :param tree: Tree to export
+    :param path: output file location with desired extension
+    :param ext: file extension to override output path's extension
+
+    :raises: :class:`doorstop.common.DoorstopError` for unknown file formats
+
+    :return: path to created file
+
+    """
+    ext = ext or os.path.splitext(path)[-1] or ".csv"
+    if ext not in TRACEABILITY_DELIMITERS and ext != ".jsonl":
+        exts = ", ".join(list(TRACEABILITY_DELIMITERS) + [".jsonl"])
+        msg = "unknown traceability export format: {} (options: {})"
+        raise DoorstopError(msg.format(ext, exts))
+    prefixes = [str(document.prefix) for document in tree.documents]
+    rows = tree.iter_traceability()
+    common.create_dirname(path)
+    log.info("exporting traceability to {}...".format(path))
+    try:
+        if ext == ".jsonl":
+            lines = _lines_traceability_jsonl(prefixes, rows)
+            return common.write_lines(lines, path)
+        table = _tabulate_traceability(prefixes, rows)
+        delimiter = TRACEABILITY_DELIMITERS[ext]
+        return common.write_csv(table, path, delimiter=delimiter)
+    except IOError:
+        msg = "unable to write to: {}".format(path)
+        raise common.DoorstopFileError(msg) from None
+
+
+def _tabulate_traceability(prefixes, rows):
+    """Yield a header of prefixes and then rows of UIDs."""
+    yield prefixes
+    for row in rows:
+        yield ["" if item is None else str(item.uid) for item in row]
+
+
+def _lines_traceability_jsonl(prefixes, rows):
+    """Yield a JSON object mapping prefixes to UIDs for each row."""
+    for row in rows:
+        data = {
+            prefix: str(item.uid)
+            for prefix, item in zip(prefixes, row)
+            if item is not None
+        }
+        yield json.dumps(data)
+
+
 def _lines_yaml(obj, **_):
     """Yield lines for a YAML export.
 
@@ -323,6 +378,8 @@ def _width(text):
 FORMAT_LINES = {".yml": _lines_yaml}
 # Mapping from file extension to file generator
 FORMAT_FILE = {".csv": _file_csv, ".tsv": _file_tsv, ".xlsx": _file_xlsx}
+# Mapping from file extension to traceability matrix delimiter
+TRACEABILITY_DELIMITERS = {".csv": ",", ".tsv": "\t"}
 # Union of format dictionaries
 FORMAT = dict(list(FORMAT_LINES.items()) + list(FORMAT_FILE.items()))  # type: ignore
 
@@ -5,7 +5,9 @@
 import functools
 import linecache
 import os
-from typing import Any, List
+from collections.abc import MutableMapping
+from types import MemberDescriptorType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from doorstop import common, settings
 from doorstop.common import DoorstopError
@@ -77,6 +79,83 @@ def _convert_to_str(value, result):
     return result + "\\T" + str(type(value)) + "\\V" + str(value).replace("\\", "\\\\")
 
 
+def _parse_item_text(text, path, itemformat):
+    """Parse an item's data from the text of its file.
+
+    :param text: text read from the item file
+    :param path: path to the item file (for displaying errors)
+    :param itemformat: format of the item file
+
+    :return: dictionary of the item's parsed data
+
+    """
+    if itemformat == "markdown":
+        # Parse YAML data from markdown with YAML frontmatter
+        return common.load_markdown(text, path, Item.MARKDOWN_TEXT_ATTRIBUTES)
+    # Parse YAML data from text
+    return common.load_yaml(text, path)
+
+
+def _parse_item_file(path, itemformat):
+    """Read and parse an item file (runs in worker processes).
+
+    :param path: path to the item file
+    :param itemformat: format of the item file
+
+    :return: text of the item file and its parsed data
+
+    """
+    text = common.read_text(path)
+    return text, _parse_item_text(text, path, itemformat)
+
+
+class _SharedData(dict):
+    """Default item data shared by items until one of them changes its own."""
+
+    def __setitem__(self, key, value):
+        raise TypeError("shared item data is read-only")
+
+    def __delitem__(self, key):
+        raise TypeError("shared item data is read-only")
+
+
+class _SharedDataView(MutableMapping):  # pylint: disable=too-many-ancestors
+    """Item data that reads the shared defaults until a value is changed."""
+
+    __slots__ = ("_values", "_own")
+
+    def __init__(self, values, own):
+        self._values = values
+        self._own = own  # copies the shared defaults into the item's own data
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._values = self._own()
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        self._values = self._own()
+        del self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+
+def _tree_defines(tree, name):
+    """Determine if a tree's class (not just the object) provides a method.
+
+    `Tree` imports this module, so a class attribute check stands in for
+    `isinstance` and still rejects mocks and other tree-like objects.
+
+    """
+    return callable(getattr(type(tree), name, None))
+
+
 def requires_tree(func):
     """Require a tree reference."""
 
@@ -94,11 +173,32 @@ def requires_tree(func):
 class Item(BaseFileObject):  # pylint: disable=R0902
     """Represents an item file with linkable text."""
 
+    __slots__ = (
+        "document",
+        "tree",
+        "itemformat",
+        "_stamps",
+        "_item_data",
+        "_pending",
+    )
+
     EXTENSIONS = {
         "yaml": [".yml", ".yaml"],
         "markdown": [".md"],
     }
     MARKDOWN_TEXT_ATTRIBUTES = ["text", "header"]  # attributes parsed from content
+    PARTIAL_ATTRIBUTES = {  # attributes converted on first use by a partial load
+        "short name",
+        "text",
+        "notes",
+        "verification methods",
+        "verification plan",
+        "phase",
+        "status",
+        "artifact",
+        "references",
+        "header",
+    }
 
     DEFAULT_LEVEL = Level("1.0")
     DEFAULT_ACTIVE = True
@@ -117,6 +217,34 @@ class Item(BaseFileObject):  # pylint: disable=R0902
     DEFAULT_STATUS = Text()
     DEFAULT_ARTIFACT = Text()
 
+    _DEFAULT_DATA = _SharedData(
+        {
+            "level": DEFAULT_LEVEL,
+            "active": DEFAULT_ACTIVE,
+            "normative": DEFAULT_NORMATIVE,
+            "derived": DEFAULT_DERIVED,
+            "reviewed": DEFAULT_REVIEWED,
+            "short name": DEFAULT_SHORT_NAME,
+            "text": DEFAULT_TEXT,
+            "notes": DEFAULT_NOTES,
+            "ref": DEFAULT_REF,
+            "verification methods": DEFAULT_VERIFICATION_METHODS,
+            "verification plan": DEFAULT_VERIFICATION_PLAN,
+            "phase": DEFAULT_PHASE,
+            "status": DEFAULT_STATUS,
+            "artifact": DEFAULT_ARTIFACT,
+            "references": None,
+            "links": frozenset(),
+        }
+    )
+    _DEFAULT_DATA_HEADER = _SharedData(_DEFAULT_DATA, header=DEFAULT_HEADER)
+
+    reference_finder = ReferenceFinder()  # stateless, shared by all items
+    yaml_validator = YamlValidator()  # stateless, shared by all items
+
+    stamp_hits = 0  # number of stamps reused from an item's cache
+    stamp_misses = 0  # number of stamps computed
+
     def __init__(self, document, path, root=os.getcwd(), **kwargs):
         """Initialize an item from an existing file.
 
@@ -141,29 +269,15 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         self.root: str = root
         self.document = document
         self.tree = kwargs.get("tree")
-        self.auto = kwargs.get("auto", Item.auto)
+        if "auto" in kwargs:
+            self.auto = kwargs["auto"]
         self.itemformat = kwargs.get("itemformat", Item.DEFAULT_ITEMFORMAT)
-        self.reference_finder = ReferenceFinder()
-        self.yaml_validator = YamlValidator()
-        # Set default values
-        self._data["level"] = Item.DEFAULT_LEVEL  # type: ignore
-        self._data["active"] = Item.DEFAULT_ACTIVE  # type: ignore
-        self._data["normative"] = Item.DEFAULT_NORMATIVE  # type: ignore
-        self._data["derived"] = Item.DEFAULT_DERIVED  # type: ignore
-        self._data["reviewed"] = Item.DEFAULT_REVIEWED  # type: ignore
-        self._data["short name"] = Item.DEFAULT_SHORT_NAME # type: ignore
-        self._data["text"] = Item.DEFAULT_TEXT
-        self._data["notes"] = Item.DEFAULT_NOTES
-        self._data["ref"] = Item.DEFAULT_REF
-        self._data["verification methods"] = Item.DEFAULT_VERIFICATION_METHODS # type: ignore
-        self._data["verification plan"] = Item.DEFAULT_VERIFICATION_PLAN # type: ignore
-        self._data["phase"] = Item.DEFAULT_PHASE # type: ignore
-        self._data["status"] = Item.DEFAULT_STATUS # type: ignore
-        self._data["artifact"] = Item.DEFAULT_ARTIFACT # type: ignore
-        self._data["references"] = None  # type: ignore
-        self._data["links"] = set()  # type: ignore
-        if settings.ENABLE_HEADERS:
-            self._data["header"] = Item.DEFAULT_HEADER
+        self._stamps: Dict[bool, Tuple[Tuple[str, ...], Stamp]] = {}
+        self._pending: Optional[Dict[str, Any]] = None  # values not converted yet
+        # Share default values until the item's data is first used
+        self._item_data: Dict[str, Any] = (
+            Item._DEFAULT_DATA_HEADER if settings.ENABLE_HEADERS else Item._DEFAULT_DATA
+        )
 
         Item._check_itemformat(self.itemformat, path)
 
@@ -250,86 +364,123 @@ class Item(BaseFileObject):  # pylint: disable=R0902
             raise DoorstopError(msg)
 
     def _set_attributes(self, attributes):
-        """Set the item's attributes."""
-        self.yaml_validator.validate_item_yaml(attributes)
-        for key, value in attributes.items():
-            if key == "level":
-                value = Level(value)
-            elif key == "active":
-                value = to_bool(value)
-            elif key == "normative":
-                value = to_bool(value)
-            elif key == "derived":
-                value = to_bool(value)
-            elif key == "reviewed":
-                value = Stamp(value)
-            elif key == "short name":
-                value = Text(value)
-            elif key == "text":
-                value = Text(value)
-            elif key == "notes":
-                value = Text(value)
-            elif key == "status":
-                value = Text(value)
-            elif key == "phase":
-                value = Text(value)
-            elif key == "artifact":
-                value = Text(value)
-            elif key == "verification methods":
-                value = Text(value)
-            elif key == "verification plan":
-                value = Text(value)
-            elif key == "ref":
-                value = value.strip()
-            elif key == "references":
-                stripped_value = []
-                for ref_dict in value:
-                    ref_type = ref_dict["type"]
-                    ref_path = ref_dict["path"]
+        """Set the item's attributes.
 
-                    stripped_ref_dict = {"type": ref_type, "path": ref_path.strip()}
-                    if "keyword" in ref_dict:
-                        ref_keyword = ref_dict["keyword"]
-                        stripped_ref_dict["keyword"] = ref_keyword
+        With `settings.LOAD_PARTIAL`, text attributes read from the file
+        are kept as they were parsed and converted on first use.
 
-                    stripped_value.append(stripped_ref_dict)
-
-                value = stripped_value
-            elif key == "links":
+        """
+        self.yaml_validator.validate_item_yaml(attributes)
+        self._invalidate()
+        data = self._own_data()
+        pending = self._pending or {}
+        for key, value in attributes.items():
+            if (
+                settings.LOAD_PARTIAL
+                and key in Item.PARTIAL_ATTRIBUTES
+                and isinstance(value, list if key == "references" else str)
+            ):
+                data[key] = None  # keep the attribute's position until converted
+                pending[key] = value
+                continue
+            pending.pop(key, None)
+            if key == "links":
                 value = set(UID(part) for part in value)
-            elif key == "header":
-                value = Text(value)
-            self._data[key] = value
+                self._update_link_index(value)
+            else:
+                value = Item._convert_attribute(key, value)
+            data[key] = value
+        self._pending = pending or None
+
+    @staticmethod
+    def _convert_attribute(key, value):
+        """Convert an attribute's value parsed from a file."""
+        if key == "level":
+            value = Level(value)
+        elif key == "active":
+            value = to_bool(value)
+        elif key == "normative":
+            value = to_bool(value)
+        elif key == "derived":
+            value = to_bool(value)
+        elif key == "reviewed":
+            value = Stamp(value)
+        elif key == "short name":
+            value = Text(value)
+        elif key == "text":
+            value = Text(value)
+        elif key == "notes":
+            value = Text(value)
+        elif key == "status":
+            value = Text(value)
+        elif key == "phase":
+            value = Text(value)
+        elif key == "artifact":
+            value = Text(value)
+        elif key == "verification methods":
+            value = Text(value)
+        elif key == "verification plan":
+            value = Text(value)
+        elif key == "ref":
+            value = value.strip()
+        elif key == "references":
+            stripped_value = []
+            for ref_dict in value:
+                ref_type = ref_dict["type"]
+                ref_path = ref_dict["path"]
+
+                stripped_ref_dict = {"type": ref_type, "path": ref_path.strip()}
+                if "keyword" in ref_dict:
+                    ref_keyword = ref_dict["keyword"]
+                    stripped_ref_dict["keyword"] = ref_keyword
+
+                stripped_value.append(stripped_ref_dict)
+
+            value = stripped_value
+        elif key == "header":
+            value = Text(value)
+        return value
 
     def load(self, reload=False):
         """Load the item's properties from its file."""
         if self._loaded and not reload:
             return
         log.debug("loading {}...".format(repr(self)))
-        # Read text from file
-        text = self._read(self.path)
-
-        if self.itemformat == "markdown":
-            # Parse YAML data from markdown with YAML frontmatter
-            data = common.load_markdown(text, self.path, Item.MARKDOWN_TEXT_ATTRIBUTES)
-        elif self.itemformat == "yaml":
-            # Parse YAML data from text
-            data = common.load_yaml(text, self.path)
-        else:
+        if self.itemformat not in ("markdown", "yaml"):
             msg = "unknown item format detected during load: {}({})".format(
                 self.uid, self.itemformat
             )
             raise DoorstopError(msg) from None
+        # Read and parse data from file
+        data = self._read_parsed(
+            self.path, lambda text: _parse_item_text(text, self.path, self.itemformat)
+        )
         # Store parsed data
+        self._load_data(data)
+
+    def _load_data(self, data):
+        """Store the item's properties parsed from its file."""
         self._set_attributes(data)
         # Set meta attributes
         self._loaded = True
 
     @edit_item
-    def save(self):
-        """Format and save the item's properties to its file."""
+    def save(self, _text=None):
+        """Format and save the item's properties to its file.
+
+        :param _text: text already formatted from the item's properties
+
+        """
         log.debug("saving {}...".format(repr(self)))
-        # Format the data items
+        text = self._format() if _text is None else _text
+        # Save the YAML to file
+        self._write(text, self.path)
+        # Set meta attributes
+        self._loaded = True
+        self.auto = True
+
+    def _format(self):
+        """Format the item's properties as text for its file."""
         if self.itemformat == "markdown":
             # Dump the data to YAML-frontmatter
             data, textattr = self._yaml_data(
@@ -347,14 +498,43 @@ class Item(BaseFileObject):  # pylint: disable=R0902
                 self.uid, self.itemformat
             )
             raise DoorstopError(msg) from None
-        # Save the YAML to file
-        self._write(text, self.path)
-        # Set meta attributes
-        self._loaded = True
-        self.auto = True
+        return text
 
     # properties #############################################################
 
+    @property
+    def _data(self):
+        """Get all of the item's data, converting any values not converted yet."""
+        data = self._item_data
+        if type(data) is _SharedData:  # pylint: disable=unidiomatic-typecheck
+            return _SharedDataView(data, self._own_data)
+        if self._pending:
+            for key, value in self._pending.items():
+                data[key] = Item._convert_attribute(key, value)
+            self._pending = None
+        return data
+
+    @_data.setter
+    def _data(self, value):
+        self._item_data = value
+        self._pending = None
+
+    def _own_data(self):
+        """Get the item's data to change, copied from the shared defaults."""
+        data = self._item_data
+        if type(data) is _SharedData:  # pylint: disable=unidiomatic-typecheck
+            data = dict(data)
+            data["links"] = set()
+            self._item_data = data
+        return data
+
+    def _attribute(self, key):
+        """Get one of the item's attributes, converting its value on first use."""
+        pending = self._pending
+        if pending and key in pending:
+            self._item_data[key] = Item._convert_attribute(key, pending.pop(key))
+        return self._item_data[key]
+
     def _yaml_data(self, textattributekeys=None):
         """Get all the item's data formatted for YAML dumping."""
         data = {}
@@ -434,13 +614,13 @@ class Item(BaseFileObject):  # pylint: disable=R0902
     @auto_load
     def level(self):
         """Get the item's level."""
-        return self._data["level"]
+        return self._attribute("level")
 
     @level.setter  # type: ignore
     @auto_save
     def level(self, value):
         """Set the item's level."""
-        self._data["level"] = Level(value)  # type: ignore
+        self._own_data()["level"] = Level(value)  # type: ignore
 
     @property
     def depth(self):
@@ -461,13 +641,13 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         - etc.
 
         """
-        return self._data["active"]
+        return self._attribute("active")
 
     @active.setter  # type: ignore
     @auto_save
     def active(self, value):
         """Set the item's active status."""
-        self._data["active"] = to_bool(value)
+        self._own_data()["active"] = to_bool(value)
 
     @property  # type: ignore
     @auto_load
@@ -479,13 +659,13 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         documents.
 
         """
-        return self._data["derived"]
+        return self._attribute("derived")
 
     @derived.setter  # type: ignore
     @auto_save
     def derived(self, value):
         """Set the item's derived status."""
-        self._data["derived"] = to_bool(value)
+        self._own_data()["derived"] = to_bool(value)
 
     @property  # type: ignore
     @auto_load
@@ -500,13 +680,13 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         - etc.
 
         """
-        return self._data["normative"]
+        return self._attribute("normative")
 
     @normative.setter  # type: ignore
     @auto_save
     def normative(self, value):
         """Set the item's normative status."""
-        self._data["normative"] = to_bool(value)
+        self._own_data()["normative"] = to_bool(value)
 
     @property
     def heading(self):
@@ -544,117 +724,117 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         """Indicate if the item has been reviewed."""
         stamp = self.stamp(links=True)
         if self._data["reviewed"] == Stamp(True):
-            self._data["reviewed"] = stamp
+            self._own_data()["reviewed"] = stamp
         return self._data["reviewed"] == stamp
 
     @reviewed.setter  # type: ignore
     @auto_save
     def reviewed(self, value):
         """Set the item's review status."""
-        self._data["reviewed"] = Stamp(value)  # type: ignore
+        self._own_data()["reviewed"] = Stamp(value)  # type: ignore
 
     @property  # type: ignore
     @auto_load
     def short_name(self):
         """Get the item's short name."""
-        return self._data["short name"]
+        return self._attribute("short name")
 
     @short_name.setter  # type: ignore
     @auto_save
     def short_name(self, value):
         """Set the item's short name."""
-        self._data["short name"] = Text(value)
+        self._own_data()["short name"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def text(self):
         """Get the item's text."""
-        return self._data["text"]
+        return self._attribute("text")
 
     @text.setter  # type: ignore
     @auto_save
     def text(self, value):
         """Set the item's text."""
-        self._data["text"] = Text(value)
+        self._own_data()["text"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def notes(self):
         """Get the item's notes."""
-        return self._data["notes"]
+        return self._attribute("notes")
 
     @notes.setter  # type: ignore
     @auto_save
     def notes(self, value):
         """Set the item's notes."""
-        self._data["notes"] = Text(value)
+        self._own_data()["notes"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def verification_methods(self):
         """Get the requirement verification methods"""
-        return self._data["verification methods"]
+        return self._attribute("verification methods")
 
     @verification_methods.setter  # type: ignore
     @auto_save
     def verification_methods(self, value):
         """Set the requirement verification methods"""
-        self._data["verification methods"] = Text(value)
+        self._own_data()["verification methods"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def verification_plan(self):
         """Get requirements verification plan"""
-        return self._data["verification plan"]
+        return self._attribute("verification plan")
 
     @verification_plan.setter  # type: ignore
     @auto_save
     def verification_plan(self, value):
         """Set requirements verification plan"""
-        self._data["verification plan"] = Text(value)
+        self._own_data()["verification plan"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def phase(self):
         """Get the requirements verification phase."""
-        return self._data["phase"]
+        return self._attribute("phase")
 
     @phase.setter  # type: ignore
     @auto_save
     def phase(self, value):
         """Set the requirements verification phase."""
-        self._data["phase"] = Text(value)
+        self._own_data()["phase"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def status(self):
         """Get the requirements verification status."""
-        return self._data["status"]
+        return self._attribute("status")
 
     @status.setter  # type: ignore
     @auto_save
     def status(self, value):
         """Set the requirements verification status."""
-        self._data["status"] = Text(value)
+        self._own_data()["status"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def artifact(self):
         """Get the item's artifacts"""
-        return self._data["artifact"]
+        return self._attribute("artifact")
 
     @artifact.setter  # type: ignore
     @auto_save
     def artifact(self, value):
         """Set the item's artifacts."""
-        self._data["artifact"] = Text(value)
+        self._own_data()["artifact"] = Text(value)
 
     @property  # type: ignore
     @auto_load
     def header(self):
         """Get the item's header."""
         if settings.ENABLE_HEADERS:
-            return self._data["header"]
+            return self._attribute("header")
         return None
 
     @header.setter  # type: ignore
@@ -662,7 +842,7 @@ class Item(BaseFileObject):  # pylint: disable=R0902
     def header(self, value):
         """Set the item's header."""
         if settings.ENABLE_HEADERS:
-            self._data["header"] = Text(value)
+            self._own_data()["header"] = Text(value)
 
     @property  # type: ignore
     @auto_load
@@ -673,23 +853,25 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         the filename of any type of file.
 
         """
-        return self._data["ref"]
+        return self._attribute("ref")
 
     @ref.setter  # type: ignore
     @auto_save
     def ref(self, value):
         """Set the item's external file reference."""
-        self._data["ref"] = str(value) if value else ""
+        self._own_data()["ref"] = str(value) if value else ""
 
     @property  # type: ignore
     @auto_load
     def references(self):
         """Get the item's external file references."""
-        return self._data["references"]
+        return self._attribute("references")
 
     def attribute(self, attrib):
         """Get the item's custom attribute."""
-        return self._data.get(attrib)
+        if attrib not in self._item_data:
+            return None
+        return self._attribute(attrib)
 
     @references.setter  # type: ignore
     @auto_save
@@ -697,19 +879,35 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         """Set the item's external file references."""
         if value is not None:
             assert isinstance(value, list)
-        self._data["references"] = value
+        self._own_data()["references"] = value
 
     @property  # type: ignore
     @auto_load
     def links(self):
         """Get a list of the item UIDs this item links to."""
-        return sorted(self._data["links"])
+        return sorted(self._attribute("links"))
 
     @links.setter  # type: ignore
     @auto_save
     def links(self, value):
         """Set the list of item UIDs this item links to."""
-        self._data["links"] = set(UID(v) for v in value)  # type: ignore
+        links = set(UID(v) for v in value)
+        self._update_link_index(links)
+        self._own_data()["links"] = links  # type: ignore
+
+    def _invalidate(self):
+        """Discard the item's cached stamps and the tree's traceability."""
+        self._stamps.clear()
+        if self.tree:
+            self.tree._traceability = None  # pylint: disable=protected-access
+
+    def _update_link_index(self, links):
+        """Update the tree's reverse-link index for a new set of links."""
+        if self.tree:
+            old = self._data["links"]
+            self.tree._index_links(  # pylint: disable=protected-access
+                self, added=links - old, removed=old - links  # type: ignore
+            )
 
     @property
     def parent_links(self):
@@ -794,7 +992,9 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         """
         uid = UID(value)
         log.info("linking to '{}'...".format(uid))
-        self._data["links"].add(uid)  # type: ignore
+        self._own_data()["links"].add(uid)  # type: ignore
+        if self.tree:
+            self.tree._index_links(self, added=[uid])  # pylint: disable=W0212
 
     @auto_save
     def unlink(self, value):
@@ -805,9 +1005,12 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         """
         uid = UID(value)
         try:
-            self._data["links"].remove(uid)  # type: ignore
+            self._own_data()["links"].remove(uid)  # type: ignore
         except KeyError:
             log.warning("link to {0} does not exist".format(uid))
+        else:
+            if self.tree:
+                self.tree._index_links(self, removed=[uid])  # pylint: disable=W0212
 
     def is_reviewed(self):
         return self._data["reviewed"]
@@ -833,7 +1036,9 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         if not settings.CACHE_PATHS:
             linecache.clearcache()
         # Search for the external reference
-        return self.reference_finder.find_ref(self.ref, self.tree, self.path)
+        return self.reference_finder.find_ref(
+            self.ref, self.tree, self.path, scanner=self._get_reference_scanner()
+        )
 
     @requires_tree
     def find_references(self):
@@ -858,16 +1063,25 @@ class Item(BaseFileObject):  # pylint: disable=R0902
             linecache.clearcache()
 
         references = []
+        scanner = self._get_reference_scanner()
         for ref_item in self.references:
             path = ref_item["path"]
             keyword = ref_item["keyword"] if "keyword" in ref_item else None
 
             reference = self.reference_finder.find_file_reference(
-                path, self.root, self.tree, self.path, keyword
+                path, self.root, self.tree, self.path, keyword, scanner=scanner
             )
             references.append(reference)
         return references
 
+    def _get_reference_scanner(self):
+        """Get the tree's locations of all external references, if available."""
+        tree = self.tree
+        if settings.CACHE_PATHS and tree is not None:
+            if _tree_defines(tree, "_get_reference_scanner"):
+                return tree._get_reference_scanner()  # pylint: disable=W0212
+        return None
+
     def find_child_links(self, find_all=True):
         """Get a list of item UIDs that link to this item (reverse links).
 
@@ -916,7 +1130,7 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         :return: list of found items, list of all child documents
 
         """
-        child_items: List[Item] = []
+        child_items: List[Union[Item, UnknownItem]] = []
         child_documents: List[Any] = []  # `List[Document]`` creats an import cycle
         document = document or self.document
         tree = tree or self.tree
@@ -927,18 +1141,30 @@ class Item(BaseFileObject):  # pylint: disable=R0902
         for document2 in tree:
             if document2.parent == document.prefix:
                 child_documents.append(document2)
-                # Search for child items unless we only need to find one
-                if not child_items or find_all:
-                    for item2 in document2:
-                        if self.uid in item2.links:
-                            if not item2.active:
-                                item2 = UnknownItem(item2.uid)
-                                log.warning(item2.exception)
-                                child_items.append(item2)
-                            else:
-                                child_items.append(item2)
-                                if not find_all and item2.active:
-                                    break
+        if _tree_defines(tree, "_get_child_items"):
+            # Look up the linking items in the tree's reverse-link index
+            items2: Iterable[Item] = [
+                item2
+                for item2 in tree._get_child_items(self.uid)  # pylint: disable=W0212
+                if item2.document in child_documents
+            ]
+        else:
+            # Scan the child documents of other tree-like objects
+            items2 = (
+                item2
+                for document2 in child_documents
+                for item2 in document2
+                if self.uid in item2.links
+            )
+        for item2 in items2:
+            if not item2.active:
+                unknown = UnknownItem(item2.uid)
+                log.warning(unknown.exception)
+                child_items.append(unknown)
+            else:
+                child_items.append(item2)
+                if not find_all:
+                    break
         # Display found links
         if child_items:
             if find_all:
@@ -953,7 +1179,19 @@ class Item(BaseFileObject):  # pylint: disable=R0902
 
     @auto_load
     def stamp(self, links=False):
-        """Hash the item's key content for later comparison."""
+        """Hash the item's key content for later comparison.
+
+        Stamps are cached until the item's attributes are changed or the
+        document's extended reviewed attributes differ.
+
+        """
+        extended_reviewed = tuple(self.document.extended_reviewed)
+        cached = self._stamps.get(links)
+        if cached and cached[0] == extended_reviewed:
+            Item.stamp_hits += 1
+            return cached[1]
+        Item.stamp_misses += 1
+
         values = [self.uid, self.text, self.ref]
 
         if self.references:
@@ -961,10 +1199,12 @@ class Item(BaseFileObject):  # pylint: disable=R0902
 
         if links:
             values.extend(self.links)
-        for key in self.document.extended_reviewed:
+        for key in extended_reviewed:
             if key in self._data:
                 values.append(_convert_to_str(self._data[key], ""))
-        return Stamp(*values)
+        stamp = Stamp(*values)
+        self._stamps[links] = (extended_reviewed, stamp)
+        return stamp
 
     @auto_save
     def clear(self, parents=None):
@@ -978,7 +1218,7 @@ class Item(BaseFileObject):  # pylint: disable=R0902
     def review(self):
         """Mark the item as reviewed."""
         log.info("marking item as reviewed...")
-        self._data["reviewed"] = self.stamp(links=True)
+        self._own_data()["reviewed"] = self.stamp(links=True)
 
     @delete_item
     def delete(self, path=None):
@@ -995,7 +1235,15 @@ class UnknownItem:
 
     def __init__(self, value, spec=Item):
         self._uid = UID(value)
-        self._spec = dir(spec)  # list of attribute names for warnings
+        self._spec = [  # list of attribute names for warnings
+            name
+            for name in dir(spec)
+            # slots of a class are only attributes of its instances
+            if not (
+                isinstance(spec, type)
+                and isinstance(getattr(spec, name), MemberDescriptorType)
+            )
+        ]
         msg = UID.UNKNOWN_MESSAGE.format(k="", u=self.uid)
         self.exception = DoorstopError(msg)
 
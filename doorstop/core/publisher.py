@@ -2,16 +2,25 @@
 
 """Functions to publish documents and items."""
 
+import hashlib
+import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from doorstop import common, settings
 from doorstop.common import DoorstopError
+from doorstop.core import cache
 from doorstop.core.publishers.html import HtmlPublisher
 from doorstop.core.publishers.latex import LaTeXPublisher
 from doorstop.core.publishers.markdown import MarkdownPublisher
 from doorstop.core.publishers.text import TextPublisher
+from doorstop.core.template import MANIFEST, MATRIX
 from doorstop.core.types import is_tree, iter_documents
 
+MANIFEST_VERSION = 1  # incremented when the format of manifests changes
+
 log = common.logger(__name__)
 
 
@@ -24,6 +33,8 @@ def publish(
     matrix=None,
     template=None,
     toc=True,
+    jobs=None,
+    incremental=False,
     **kwargs,
 ):
     """Publish an object to a given format.
@@ -39,6 +50,9 @@ def publish(
     :param linkify: turn links into hyperlinks (for Markdown, HTML or LaTeX)
     :param index: create an index.html (for HTML)
     :param matrix: create a traceability matrix, traceability.csv
+    :param jobs: number of processes used to render documents
+    :param incremental: only publish the documents of a tree that changed
+        since it was last published to the same directory
 
     :raises: :class:`doorstop.common.DoorstopError` for unknown file formats
 
@@ -58,37 +72,79 @@ def publish(
     publisher.setPath(path)
     publisher.setup(linkify, index, matrix)
 
+    # Read the manifest of an earlier incremental publish.
+    incremental = incremental and is_tree(obj)
+    copied: Optional[Set[str]] = set() if incremental else None
+    manifest = _read_manifest(path) if incremental else {}
+    if not incremental and is_tree(obj):
+        common.delete(os.path.join(path, MANIFEST))  # outputs may change below
+
     # Process templates.
-    publisher.processTemplates(template)
+    publisher.processTemplates(template, copied)
     log.info("Template = {}".format(publisher.getTemplate()))
     # Run all preparations.
     publisher.preparePublish()
 
     # Publish documents
     count = 0
+    written = 0
+    targets = []
+    options = dict(
+        linkify=publisher.getLinkify(),
+        template=publisher.getTemplate(),
+        toc=toc,
+        **kwargs,
+    )
+    outputs: Dict[str, Any] = {}
+    if incremental:
+        key = _get_manifest_key(path, publisher, options)
+        if manifest.get("key") != key:
+            manifest = {}
+        fingerprints = _get_fingerprints(obj, key)
     for obj2, path2 in iter_documents(obj, path, ext):
         count += 1
         # Run all special actions.
         publisher.publishAction(obj2, path2)
+        render = True
+        if incremental:
+            name = os.path.relpath(publisher.getDocumentPath(), path)
+            outputs[name] = fingerprints[str(obj2.prefix)]
+            render = not (
+                outputs[name]
+                and outputs[name] == manifest.get("outputs", {}).get(name)
+                and os.path.isfile(publisher.getDocumentPath())
+            )
+        if jobs and jobs > 1:
+            targets.append((obj2, publisher.getDocumentPath(), render))
+            continue  # documents are rendered together below
 
         # Publish content to the specified path
-        log.info("publishing to {}...".format(publisher.getDocumentPath()))
-        lines = publish_lines(
-            obj2,
-            ext,
-            publisher=publisher,
-            linkify=publisher.getLinkify(),
-            template=publisher.getTemplate(),
-            toc=toc,
-            **kwargs,
-        )
-        common.write_lines(
-            lines, publisher.getDocumentPath(), end=settings.WRITE_LINESEPERATOR
-        )
-        if obj2.copy_assets(publisher.getAssetsPath()):
-            log.info(
-                "Copied assets from %s to %s", obj.assets, publisher.getAssetsPath()
-            )
+        lines = None
+        if render:
+            lines = publish_lines(obj2, ext, publisher=publisher, **options)
+            written += 1
+        _write_document(obj2, publisher, lines, copied)
+
+    # Publish documents rendered in parallel
+    for obj2, path2, lines in _render_documents(publisher, targets, jobs, ext, options):
+        publisher.document, publisher.documentPath = obj2, path2
+        _write_document(obj2, publisher, lines, copied)
+        if lines is not None:
+            written += 1
+
+    # Remove outputs of documents deleted since the last publish
+    changed = True
+    if incremental:
+        for name in set(manifest.get("outputs", {})) - set(outputs):
+            log.info("removing {}...".format(name))
+            common.delete(os.path.join(path, name))
+        assets = publisher.getAssetsPath()
+        if os.path.isdir(assets):
+            common.delete_contents(assets, keep=copied)
+            if not os.listdir(assets):
+                os.rmdir(assets)
+        changed = bool(written) or manifest.get("outputs") != outputs
+        _write_manifest(path, {"key": key, "outputs": outputs})
 
     # Create index
     if publisher.getIndex():
@@ -96,7 +152,10 @@ def publish(
 
     # Create traceability matrix
     if (publisher.getIndex() or ext == ".tex" or ext == ".md") and (publisher.getMatrix()):
-        publisher.create_matrix(path)
+        if changed or not os.path.isfile(os.path.join(path, MATRIX)):
+            publisher.create_matrix(path)
+        else:
+            log.info("traceability matrix is unchanged")
 
     # Run all concluding operations.
     publisher.concludePublish()
@@ -107,6 +166,220 @@ def publish(
     return path
 
 
+def _write_document(document, publisher, lines, copied=None):
+    """Write a document's published lines and copy its assets.
+
+    :param document: document being published
+    :param publisher: publisher prepared for the document
+    :param lines: lines to write or None to keep an unchanged file
+    :param copied: set of paths copied in the same incremental publish
+
+    """
+    if lines is None:
+        log.info("unchanged: {}".format(publisher.getDocumentPath()))
+    else:
+        log.info("publishing to {}...".format(publisher.getDocumentPath()))
+        common.write_lines(
+            lines, publisher.getDocumentPath(), end=settings.WRITE_LINESEPERATOR
+        )
+    if copied is None:
+        document.copy_assets(publisher.getAssetsPath())
+    else:
+        document.copy_assets(publisher.getAssetsPath(), copied)
+
+
+def _render_documents(publisher, targets, jobs, ext, kwargs):
+    """Yield the published lines of documents rendered in a process pool.
+
+    Documents are rendered by forked workers that share the publisher and
+    the (read-only) tree, and their lines are yielded in order so the
+    caller writes the same files as a serial run.
+
+    :param publisher: publisher prepared for every document
+    :param targets: list of (document, output path, render flag)
+    :param jobs: number of processes
+    :param ext: file extension to specify the output format
+    :param kwargs: keyword arguments for the line generator
+
+    :return: iterator of (document, output path, lines or None when the
+        document is not rendered)
+
+    """
+    rendered = [(document, path) for document, path, render in targets if render]
+    if len(rendered) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        if targets:
+            log.debug("rendering documents serially")
+        for document, path, render in targets:
+            lines = None
+            if render:
+                lines = publish_lines(document, ext, publisher=publisher, **kwargs)
+            yield document, path, lines
+        return
+    log.info("rendering {} documents with {} jobs...".format(len(rendered), jobs))
+    if is_tree(publisher.object):
+        # Load what every document needs once instead of in each worker
+        tree = publisher.object
+        tree.load()
+        if tree._link_index is None:  # pylint: disable=W0212
+            tree._build_link_index()  # pylint: disable=W0212
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_publish_worker,
+        initargs=(publisher, rendered, ext, kwargs),
+    ) as executor:
+        results = executor.map(_render_document, range(len(rendered)))
+        for document, path, render in targets:
+            if not render:
+                yield document, path, None
+        for (document, path), lines in zip(rendered, results):
+            yield document, path, lines
+
+
+def _get_manifest_key(path, publisher, options):
+    """Get a fingerprint of the settings and template all documents use."""
+    return cache.fingerprint(
+        MANIFEST_VERSION,
+        publisher.ext,
+        publisher.getIndex(),
+        publisher.getMatrix(),
+        options,
+        _hash_directory(os.path.join(path, "template")),
+        settings.PUBLISH_PARENT_LINKS,
+        settings.PUBLISH_CHILD_LINKS,
+        settings.PUBLISH_BODY_LEVELS,
+        settings.PUBLISH_HEADING_LEVELS,
+        settings.ENABLE_HEADERS,
+        settings.WRITE_LINESEPERATOR,
+        settings.CHECK_REF,
+        settings.DOC_REPO,
+        settings.PROJECT,
+    )
+
+
+def _get_fingerprints(tree, key):
+    """Get a fingerprint of the content each document's output shows.
+
+    A document shows its configuration, its parent and child documents,
+    its items, the items they link to and from, and the locations of
+    their external references.
+
+    :param tree: tree being published
+    :param key: fingerprint of the settings and template
+
+    :return: dictionary of document prefix to fingerprint or None when
+        the document must be published
+
+    """
+    items = {}
+    for document in tree:
+        for item in document:
+            items[str(item.uid)] = cache.fingerprint(item.data)
+    fingerprints: Dict[str, Optional[str]] = {}
+    for document in tree:
+        context = [
+            key,
+            str(document.prefix),
+            document._data,  # pylint: disable=W0212
+            str(document.parent),
+            [str(prefix) for prefix in document.children],
+        ]
+        values = []
+        try:
+            for item in document:
+                links = [str(uid) for uid in item.links]
+                links += [str(child.uid) for child in item.find_child_items()]
+                values.append(
+                    [
+                        str(item.uid),
+                        items[str(item.uid)],
+                        [[uid, items.get(uid)] for uid in links],
+                        _find_references(item),
+                    ]
+                )
+        except DoorstopError:
+            fingerprints[str(document.prefix)] = None  # publishing shows the error
+            continue
+        fingerprints[str(document.prefix)] = cache.fingerprint(context, values)
+    return fingerprints
+
+
+def _find_references(item):
+    """Get the locations of an item's external references if published."""
+    if not settings.CHECK_REF:
+        return None
+    ref = item.find_ref() if item.ref else None
+    references = item.find_references() if item.references else None
+    return [ref, references]
+
+
+def _hash_directory(path):
+    """Get a content hash of the files in a directory."""
+    sha = hashlib.sha1()
+    for root, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            filepath = os.path.join(root, filename)
+            sha.update(os.path.relpath(filepath, path).encode("utf-8"))
+            sha.update(common.read_bytes(filepath) or b"")
+    return sha.hexdigest()
+
+
+def _read_manifest(path):
+    """Read the manifest of an earlier incremental publish.
+
+    :return: dictionary of contents or an empty dictionary if missing or
+        outdated
+
+    """
+    filepath = os.path.join(path, MANIFEST)
+    try:
+        with open(filepath, "r", encoding="utf-8") as stream:
+            contents = json.load(stream)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(contents, dict) or contents.get("version") != MANIFEST_VERSION:
+        return {}
+    return contents
+
+
+def _write_manifest(path, contents):
+    """Write the manifest of an incremental publish."""
+    filepath = os.path.join(path, MANIFEST)
+    log.debug("writing publish manifest to {}...".format(filepath))
+    text = json.dumps(dict(contents, version=MANIFEST_VERSION), indent=2)
+    common.write_text(text, filepath)
+
+_publish_state: Dict[str, Any] = {}  # publisher shared with forked workers
+_publish_targets: List[Tuple[Any, str]] = []  # documents to render in workers
+
+
+def _init_publish_worker(publisher, targets, ext, kwargs):
+    """Store the publisher and documents in a forked worker process."""
+    _publish_state.update(publisher=publisher, ext=ext, kwargs=kwargs)
+    _publish_targets[:] = targets
+
+
+def _render_document(index):
+    """Render a document in a worker process.
+
+    :param index: index of the document in the shared list
+
+    :return: list of lines of text
+
+    """
+    publisher = _publish_state["publisher"]
+    document, path = _publish_targets[index]
+    publisher.document, publisher.documentPath = document, path
+    lines = publish_lines(
+        document,
+        _publish_state["ext"],
+        publisher=publisher,
+        **_publish_state["kwargs"],
+    )
+    return list(lines)
+
+
 def publish_lines(obj, ext=".txt", publisher=None, **kwargs):
     """Yield lines for a report in the specified format.
 
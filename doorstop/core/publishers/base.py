@@ -143,7 +143,7 @@ class BasePublisher(metaclass=ABCMeta):
     def _matrix_content(self):
         """Yield rows of content for the traceability matrix in csv format."""
         yield tuple(map(extract_prefix, self.object.documents))
-        for row in self.object.get_traceability():
+        for row in self.object.iter_traceability():
             yield tuple(map(extract_uid, row))
 
     @abstractmethod
@@ -192,10 +192,15 @@ class BasePublisher(metaclass=ABCMeta):
         """Get the export path of the individual document."""
         return self.documentPath
 
-    def processTemplates(self, template):
-        """Retrieve the template and its path."""
+    def processTemplates(self, template, copied=None):
+        """Retrieve the template and its path.
+
+        :param template: name of a custom template
+        :param copied: set of paths copied in the same incremental publish
+
+        """
         self.assetsPath, self.template = get_template(
-            self.object, self.path, self.ext, template
+            self.object, self.path, self.ext, template, copied
         )
 
     def getAssetsPath(self):
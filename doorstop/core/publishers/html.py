@@ -5,6 +5,7 @@
 import os
 import re
 import tempfile
+from itertools import islice
 
 import bottle
 import markdown
@@ -36,6 +37,8 @@ class HtmlPublisher(MarkdownPublisher):
         self.list["start_item"] = {"itemize": "<li>", "enumerate": "<li>"}
         self.list["end_item"] = {"itemize": "</li>", "enumerate": "</li>"}
 
+    MATRIX_PAGE_ROWS = 10000  # split larger traceability matrices into pages
+
     EXTENSIONS = (
         "markdown.extensions.extra",
         "markdown.extensions.sane_lists",
@@ -165,10 +168,36 @@ class HtmlPublisher(MarkdownPublisher):
         filename = MATRIX.replace(".csv", ".html")
         path = os.path.join(directory, filename)
         log.info("creating an {}...".format(filename))
-        lines = self.lines_matrix()
         # Format according to the template.
         if self.template == "":
             self.template = HTMLTEMPLATE
+        rows = self.object.iter_traceability()
+        page = list(islice(rows, self.MATRIX_PAGE_ROWS + 1))
+        if len(page) <= self.MATRIX_PAGE_ROWS:
+            self._write_matrix_page(path, self.lines_matrix(page))
+            return
+
+        # Split large matrices into pages listed by a small index
+        pages = []
+        number = 0
+        start = 1
+        while page:
+            number += 1
+            rows_page = page[: self.MATRIX_PAGE_ROWS]
+            page = page[self.MATRIX_PAGE_ROWS :]
+            page.extend(islice(rows, self.MATRIX_PAGE_ROWS + 1 - len(page)))
+            name = MATRIX.replace(".csv", "-{}.html".format(number))
+            log.info("creating an {}...".format(name))
+            lines = self._lines_matrix_page(rows_page, number, last=not page)
+            self._write_matrix_page(os.path.join(directory, name), lines)
+            pages.append(
+                (name, start, start + len(rows_page) - 1, rows_page[0], rows_page[-1])
+            )
+            start += len(rows_page)
+        self._write_matrix_page(path, self.lines_matrix_index(pages))
+
+    def _write_matrix_page(self, path, lines):
+        """Typeset lines of a traceability matrix page and save them."""
         templatePath = os.path.abspath(
             os.path.join(self.assetsPath, "..", "..", "template", "views")
         )
@@ -186,6 +215,39 @@ class HtmlPublisher(MarkdownPublisher):
         )
         common.write_text(html, path)
 
+    def _lines_matrix_page(self, rows, number, last):
+        """Yield lines of HTML for one page of a paginated matrix."""
+        links = ['<a href="{}">Index</a>'.format(MATRIX.replace(".csv", ".html"))]
+        if number > 1:
+            name = MATRIX.replace(".csv", "-{}.html".format(number - 1))
+            links.insert(0, '<a href="{}">Previous</a>'.format(name))
+        if not last:
+            name = MATRIX.replace(".csv", "-{}.html".format(number + 1))
+            links.append('<a href="{}">Next</a>'.format(name))
+        navigation = "<p>{}</p>".format(" | ".join(links))
+        yield navigation
+        yield from self.lines_matrix(rows)
+        yield navigation
+
+    def lines_matrix_index(self, pages):
+        """Yield lines of HTML for the index of a paginated matrix.
+
+        :param pages: list of (filename, first row, last row, first
+            row items, last row items) for each page
+
+        """
+
+        def row_uid(row):
+            return next((str(item.uid) for item in row if item), "")
+
+        yield "<h3>Traceability Matrix Pages:</h3>"
+        yield "<ul>"
+        for filename, start, end, first, last in pages:
+            yield '<li> <a href="{f}">Rows {s} to {e}</a> ({a} to {b}) </li>'.format(
+                f=filename, s=start, e=end, a=row_uid(first), b=row_uid(last)
+            )
+        yield "</ul>"
+
     def typesetTemplate(
         self,
         templatePath,
@@ -220,11 +282,17 @@ class HtmlPublisher(MarkdownPublisher):
     def _matrix_content(self):
         """Yield rows of content for the traceability matrix in csv format."""
         yield tuple(map(extract_prefix, self.object.documents))
-        for row in self.object.get_traceability():
+        for row in self.object.iter_traceability():
             yield tuple(map(extract_uid, row))
 
-    def lines_matrix(self):
-        """Traceability table for html output."""
+    def lines_matrix(self, rows=None):
+        """Traceability table for html output.
+
+        :param rows: rows of the matrix (default: the tree's traceability)
+
+        """
+        if rows is None:
+            rows = self.object.iter_traceability()
         yield '<table class="table">'
         # header
         yield "<thead>"
@@ -236,7 +304,7 @@ class HtmlPublisher(MarkdownPublisher):
         yield "</thead>"
         # data
         yield "<tbody>"
-        for index, row in enumerate(self.object.get_traceability()):
+        for index, row in enumerate(rows):
             if index % 2:
                 yield '<tr class="alt">'
             else:
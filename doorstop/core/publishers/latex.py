@@ -623,7 +623,7 @@ class LaTeXPublisher(BasePublisher):
     def create_matrix(self, directory):
         """Create a traceability table for LaTeX."""
         # Setup.
-        table = self.object.get_traceability().__iter__()
+        table = self.object.iter_traceability()
         traceability = []
         file = os.path.join(directory, "traceability.tex")
         count = 0
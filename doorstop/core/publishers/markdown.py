@@ -84,7 +84,7 @@ class MarkdownPublisher(BasePublisher):
 
         # data
         linkify = kwargs.get("linkify", False)
-        for index, row in enumerate(self.object.get_traceability()):
+        for index, row in enumerate(self.object.iter_traceability()):
             link = ""
             row_count = 0
             for item in row:
@@ -180,7 +180,7 @@ class TestModule(MockDataMixIn, unittest.TestCase):
             (None, None, None, mock_item_unknown, None),
             (None, None, None, None, None),
         ]
-        mock_tree.get_traceability = lambda: mock_trace
+        mock_tree.iter_traceability = lambda: iter(mock_trace)
         html_publisher = publisher.check(".html")
         # Act
         html_publisher.create_index(FILES, index="index2.html", tree=mock_tree)
@@ -209,7 +209,7 @@ class TestModule(MockDataMixIn, unittest.TestCase):
             (None, None, None, mock_item_unknown, None),
             (None, None, None, None, None),
         ]
-        mock_tree.get_traceability = lambda: mock_trace
+        mock_tree.iter_traceability = lambda: iter(mock_trace)
         html_publisher = publisher.check(".html", obj=mock_tree)
         # Create the self.dirpath first.
         os.makedirs(self.dirpath)
@@ -225,6 +225,44 @@ class TestModule(MockDataMixIn, unittest.TestCase):
             expected_content = file.read()
         self.assertEqual(expected_content, result_content)
 
+    @patch(
+        "doorstop.core.publishers.html.HtmlPublisher.typesetTemplate",
+        Mock(side_effect=lambda _path, body, **_: body),
+    )
+    def test_matrix_tree_pages(self):
+        """Verify a large traceability matrix is split into pages."""
+        mock_tree = MagicMock()
+        mock_document = MagicMock()
+        mock_document.prefix = "REQ"
+        mock_tree.documents = [mock_document]
+        mock_tree.__iter__.return_value = [mock_document]
+        mock_trace = []
+        for number in range(1, 6):
+            mock_item = Mock(spec=["uid"])
+            mock_item.uid = "REQ00{}".format(number)
+            mock_trace.append((mock_item,))
+        mock_tree.iter_traceability = lambda: iter(mock_trace)
+        html_publisher = publisher.check(".html", obj=mock_tree)
+        html_publisher.MATRIX_PAGE_ROWS = 2
+        os.makedirs(self.dirpath)
+        # Act
+        html_publisher.create_matrix(self.dirpath)
+        # Assert
+        for name in ("traceability-1.html", "traceability-3.html"):
+            self.assertTrue(os.path.isfile(os.path.join(self.dirpath, name)))
+        self.assertFalse(
+            os.path.isfile(os.path.join(self.dirpath, "traceability-4.html"))
+        )
+        with open(os.path.join(self.dirpath, "traceability.html")) as file:
+            text = file.read()
+        self.assertIn('<a href="traceability-3.html">Rows 5 to 5</a>', text)
+        self.assertIn("(REQ003 to REQ004)", text)
+        with open(os.path.join(self.dirpath, "traceability-3.html")) as file:
+            text = file.read()
+        self.assertIn('<a href="traceability-2.html">Previous</a>', text)
+        self.assertNotIn("Next", text)
+        self.assertIn("REQ005", text)
+
     def test_lines_html_item(self):
         """Verify HTML can be published from an item."""
         expected = """<h2 id="req3">1.1 Heading</h2>
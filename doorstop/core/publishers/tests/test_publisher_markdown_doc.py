@@ -12,7 +12,7 @@ from shutil import rmtree
 
 from doorstop.core import publisher
 from doorstop.core.builder import build
-from doorstop.core.publishers.tests.helpers import getWalk
+from doorstop.core.publishers.tests.helpers import getFileContents, getWalk
 from doorstop.core.tests import ROOT, MockDataMixIn, MockDocument
 from doorstop.core.tests.helpers import on_error_with_retry
 
@@ -54,6 +54,23 @@ class TestPublisherFullDocument(MockDataMixIn, unittest.TestCase):
         walk = getWalk(self.dirpath)
         self.assertEqual(self.expected_walk, walk)
 
+    def test_publish_markdown_tree_jobs(self):
+        """Verify that publishing with jobs matches a serial publish."""
+        serial = os.path.join(self.dirpath, "serial")
+        parallel = os.path.join(self.dirpath, "parallel")
+        # Act
+        publisher.publish(self.mock_tree, serial, ext=".md")
+        publisher.publish(self.mock_tree, parallel, ext=".md", jobs=2)
+        # Assert
+        walk = getWalk(serial)
+        self.assertEqual(walk.replace("serial", "parallel", 1), getWalk(parallel))
+        for name in os.listdir(serial):
+            if name.endswith(".md"):
+                self.assertEqual(
+                    getFileContents(os.path.join(serial, name)),
+                    getFileContents(os.path.join(parallel, name)),
+                )
+
     def test_publish_markdown_document_to_path(self):
         """Verify that single document export to path works."""
         expected_walk = """{n}/
@@ -5,6 +5,8 @@
 import linecache
 import os
 import re
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from doorstop import common, settings
 from doorstop.common import DoorstopError
@@ -12,13 +14,23 @@ from doorstop.common import DoorstopError
 log = common.logger(__name__)
 
 
+def _compile_ref(ref):
+    """Compile a regex to find a reference in a line of text."""
+    pattern = r"(\b|\W){}(\b|\W)".format(re.escape(ref))
+    log.trace("regex: {}".format(pattern))  # type: ignore
+    return re.compile(pattern)
+
+
 class ReferenceFinder:
     """Finds files referenced from an Item."""
 
     @staticmethod
-    def find_ref(ref, tree, item_path):
+    def find_ref(ref, tree, item_path, scanner=None):
         """Get the external file reference and line number.
 
+        :param scanner: :class:`ReferenceScanner` that already searched
+            for the reference
+
         :raises: :class:`~doorstop.common.DoorstopError` when no
             reference is found
 
@@ -29,18 +41,24 @@ class ReferenceFinder:
 
         """
 
+        # Use the location found while scanning for all references
+        if scanner and ref in scanner.refs:
+            return scanner.find_ref(ref, item_path)
+
         # Search for the external reference
         log.debug("searching for ref '{}'...".format(ref))
-        pattern = r"(\b|\W){}(\b|\W)".format(re.escape(ref))
-        log.trace("regex: {}".format(pattern))  # type: ignore
-        regex = re.compile(pattern)
-        for path, filename, relpath in tree.vcs.paths:
+        regex = _compile_ref(ref)
+        # Only search the files before the first file named like the reference
+        named = [
+            (position, relpath)
+            for position, path, relpath in tree.vcs.find_filename(ref)
+            if path != item_path
+        ]
+        end = named[0][0] if named else None
+        for path, filename, relpath in islice(tree.vcs.paths, end):
             # Skip the item's file while searching
             if path == item_path:
                 continue
-            # Check for a matching filename
-            if filename == ref:
-                return relpath, None
             # Skip extensions that should not be considered text
             if os.path.splitext(filename)[-1] in settings.SKIP_EXTS:
                 continue
@@ -54,14 +72,22 @@ class ReferenceFinder:
                 if regex.search(line):
                     log.debug("found ref: {}".format(relpath))
                     return relpath, lineno
+        # Use the matching filename
+        if named:
+            return named[0][1], None
 
         msg = "external reference not found: {}".format(ref)
         raise DoorstopError(msg)
 
     @staticmethod
-    def find_file_reference(ref_path, root, tree, item_path, keyword=None):
+    def find_file_reference(
+        ref_path, root, tree, item_path, keyword=None, scanner=None
+    ):  # pylint: disable=R0913
         """Find the external file reference.
 
+        :param scanner: :class:`ReferenceScanner` that already searched
+            for the keyword
+
         :raises: :class:`~doorstop.common.DoorstopError` when no
             reference is found
 
@@ -72,29 +98,217 @@ class ReferenceFinder:
         log.debug("searching for ref '{}'...".format(ref_path))
         ref_full_path = os.path.normpath(os.path.join(root, ref_path))
 
-        for path, _filename, relpath in tree.vcs.paths:
-            # Skip the item's file while searching
-            if path == item_path:
-                continue
-            if path == ref_full_path:
-                if keyword is None:
-                    return relpath, None
-
-                # Search for the reference in the file
-                try:
-                    lines = linecache.getlines(path)
-                except SyntaxError:
-                    log.trace("unable to read lines from: {}".format(path))  # type: ignore
-                    continue
+        # Use the location found while scanning for all keywords
+        if scanner and (ref_full_path, keyword) in scanner.keywords:
+            return scanner.find_keyword(ref_path, ref_full_path, keyword, item_path)
 
-                log.debug("searching for ref '{}'...".format(keyword))
-                pattern = r"(\b|\W){}(\b|\W)".format(re.escape(keyword))
-                log.trace("regex: {}".format(pattern))  # type: ignore
-                regex = re.compile(pattern)
-                for lineno, line in enumerate(lines, start=1):
-                    if regex.search(line):
-                        log.debug("found ref: {}".format(relpath))
-                        return relpath, lineno
+        # Look up the file, skipping the item's file
+        found = tree.vcs.find_path(ref_full_path)
+        if found and ref_full_path != item_path:
+            path, _filename, relpath = found
+            if keyword is None:
+                return relpath, None
+
+            # Search for the reference in the file
+            try:
+                lines = linecache.getlines(path)
+            except SyntaxError:
+                log.trace("unable to read lines from: {}".format(path))  # type: ignore
+                lines = []
+
+            log.debug("searching for ref '{}'...".format(keyword))
+            regex = _compile_ref(keyword)
+            for lineno, line in enumerate(lines, start=1):
+                if regex.search(line):
+                    log.debug("found ref: {}".format(relpath))
+                    return relpath, lineno
 
         msg = "external reference not found: {}".format(ref_path)
         raise DoorstopError(msg)
+
+
+class ReferenceScanner:
+    """Finds many external references with a single pass over all files.
+
+    Each file is searched once for all references with a combined regex
+    that only matches where a reference's text occurs. The regex used by
+    :class:`ReferenceFinder` then confirms a match on that line, so the
+    same locations are found as by searching for each reference alone.
+
+    """
+
+    def __init__(self, refs: Iterable[str], keywords: Mapping[str, Iterable[str]]):
+        """Initialize a scanner for references.
+
+        :param refs: references to find in file names and contents
+        :param keywords: dictionary of file paths to keywords to find in them
+
+        """
+        # Locations of each reference in its first two files, as only one
+        # of them can be skipped for being the referencing item's file
+        self.refs: Dict[str, List[Tuple[str, str, Optional[int]]]] = {
+            ref: [] for ref in refs if ref
+        }
+        # Line numbers of keywords, or None when missing from a file
+        self.keywords: Dict[Tuple[str, str], Optional[int]] = {
+            (path, keyword): None
+            for path, words in keywords.items()
+            for keyword in words
+            if keyword
+        }
+        self._files: Dict[str, Set[str]] = {}
+        for path, keyword in self.keywords:
+            self._files.setdefault(path, set()).add(keyword)
+        self._relpaths: Dict[str, str] = {}
+        self._regex: Optional[re.Pattern] = None
+
+    def scan(self, paths, index=None):
+        """Search files for all references and keywords.
+
+        :param paths: iterable of path, filename, and relative path of
+            each file to search, as yielded by a working copy's paths
+        :param index: :class:`~doorstop.core.cache.ReferenceCache` of
+            locations found by earlier runs in unchanged files
+
+        """
+        log.info(
+            "scanning files for {} references and {} keywords...".format(
+                len(self.refs), len(self.keywords)
+            )
+        )
+        pending = set(self.refs)
+        if index:
+            index.start(self.refs.keys())
+        for path, filename, relpath in paths:
+            words = self._files.get(path, set())
+            if words:
+                self._relpaths[path] = relpath
+            if not index and not pending and not words:
+                if len(self._relpaths) == len(self._files):
+                    break
+                continue
+            # Check for a matching filename
+            if filename in pending:
+                self._add_ref(filename, path, relpath, None, pending)
+            # Skip extensions that should not be considered text
+            refs = self.refs.keys() if index else pending
+            if os.path.splitext(filename)[-1] in settings.SKIP_EXTS:
+                refs = set()
+            # Search for the references in the file
+            if index:
+                found, found_words = index.search(path, refs, words, self._search)
+            else:
+                found, found_words = self._search(path, refs, words)
+            for ref, lineno in found.items():
+                if ref != filename:
+                    self._add_ref(ref, path, relpath, lineno, pending)
+            for keyword, lineno in found_words.items():
+                self.keywords[(path, keyword)] = lineno
+        if index:
+            index.finish()
+
+    def _search(self, path, refs, keywords):
+        """Search a file's lines for references and keywords.
+
+        :return: dictionaries of the references and keywords found to
+            their line numbers
+
+        """
+        found: Dict[str, int] = {}
+        found_words: Dict[str, int] = {}
+        if not refs and not keywords:
+            return found, found_words
+        try:
+            lines = linecache.getlines(path)
+        except (SyntaxError, UnicodeDecodeError):
+            log.trace("unable to read lines from: {}".format(path))  # type: ignore
+            return found, found_words
+        if refs:
+            if self._regex is None:
+                self._regex = _compile_any(self.refs)
+            found.update(_search_lines(lines, self._regex, refs))
+        if keywords:
+            found_words.update(_search_lines(lines, _compile_any(keywords), keywords))
+        return found, found_words
+
+    def _add_ref(self, ref, path, relpath, lineno, pending):
+        """Record the location of a reference in a file."""
+        locations = self.refs[ref]
+        if len(locations) < 2:
+            locations.append((path, relpath, lineno))
+        if len(locations) == 2:
+            pending.discard(ref)
+
+    def find_ref(self, ref, item_path):
+        """Get the location of a reference outside of an item's file.
+
+        :raises: :class:`~doorstop.common.DoorstopError` when no
+            reference is found
+
+        :return: relative path to file, line number or None (when found
+            as filename)
+
+        """
+        for path, relpath, lineno in self.refs[ref]:
+            # Skip the item's file
+            if path == item_path:
+                continue
+            log.debug("found ref: {}".format(relpath))
+            return relpath, lineno
+        msg = "external reference not found: {}".format(ref)
+        raise DoorstopError(msg)
+
+    def find_keyword(self, ref_path, path, keyword, item_path):
+        """Get the location of a keyword in a file other than an item's file.
+
+        :raises: :class:`~doorstop.common.DoorstopError` when no
+            reference is found
+
+        :return: relative path to file, line number
+
+        """
+        lineno = self.keywords[(path, keyword)]
+        if lineno is None or path == item_path:
+            msg = "external reference not found: {}".format(ref_path)
+            raise DoorstopError(msg)
+        relpath = self._relpaths[path]
+        log.debug("found ref: {}".format(relpath))
+        return relpath, lineno
+
+
+def _compile_any(needles):
+    """Compile a regex matching the longest needle starting at each position."""
+    needles = sorted(needles, key=len, reverse=True)
+    pattern = "(?=({}))".format("|".join(re.escape(needle) for needle in needles))
+    return re.compile(pattern)
+
+
+def _search_lines(lines, regex, needles):
+    """Yield each needle found in lines and the number of its first line.
+
+    :param lines: lines of text to search
+    :param regex: combined regex from :func:`_compile_any`
+    :param needles: needles (a subset of those in the combined regex) to find
+
+    :return: generator of needle, line number
+
+    """
+    if not needles or not regex.search("".join(lines)):
+        return
+    needles = set(needles)
+    regexes: Dict[str, re.Pattern] = {}
+    for lineno, line in enumerate(lines, start=1):
+        for match in regex.finditer(line):
+            longest = match.group(1)
+            # Shorter needles starting where a longer one matched also matched
+            prefixes = (longest[:i] for i in range(len(longest) - 1, 0, -1))
+            for needle in chain([longest], prefixes):
+                if needle not in needles:
+                    continue
+                if needle not in regexes:
+                    regexes[needle] = _compile_ref(needle)
+                if regexes[needle].search(line):
+                    needles.remove(needle)
+                    yield needle, lineno
+                    if not needles:
+                        return
@@ -14,6 +14,7 @@ from doorstop.core.types import is_tree
 HTMLTEMPLATE = "doorstop"
 INDEX = "index.html"
 MATRIX = "traceability.csv"
+MANIFEST = ".doorstop-publish.json"  # fingerprints of incrementally published files
 
 REQUIRED_LATEX_PACKAGES = {
     "inputenc": None,
@@ -30,7 +31,7 @@ REQUIRED_LATEX_PACKAGES = {
 log = common.logger(__name__)
 
 
-def get_template(obj, path, ext, template):
+def get_template(obj, path, ext, template, copied=None):
     """Return the correct template.
 
     Return correct template according to the published type.
@@ -38,6 +39,10 @@ def get_template(obj, path, ext, template):
     built-in templates.
 
     Create the output folder and template folder.
+
+    When a set of copied paths is given, files left by an earlier publish
+    are only replaced if they changed, the paths copied are added to the
+    set, and the assets directory is left for the caller to clean up.
     """
 
     # Set assets, ouput and template folders.
@@ -94,10 +99,12 @@ I.e., only one of the documents in the tree should have a template folder."""
 
 
     # Remove existing templates and assets first.
-    if os.path.isdir(assets_dir):
+    if copied is not None:
+        log.debug("Updating changed files in %s", template_dir)
+    elif os.path.isdir(assets_dir):
         log.info("Deleting contents of assets directory %s", assets_dir)
         common.delete_contents(assets_dir)
-    if os.path.isdir(template_dir):
+    if os.path.isdir(template_dir) and copied is None:
         log.info("Deleting contents of template directory %s", template_dir)
         common.delete(template_dir)
 
@@ -107,7 +114,7 @@ I.e., only one of the documents in the tree should have a template folder."""
 
     # Copy template from document if it exists and template is given.
     if document_template and template:
-        os.makedirs(template_dir)
+        os.makedirs(template_dir, exist_ok=True)
         if is_tree(obj):
             for each in obj.documents:
                 log.info(
@@ -115,31 +122,40 @@ I.e., only one of the documents in the tree should have a template folder."""
                     each.template,
                     os.path.join(os.path.dirname(path), "template"),
                 )
-                common.copy_dir_contents(each.template, template_dir)
+                common.copy_dir_contents(each.template, template_dir, copied)
         else:
             log.info(
                 "Copying %s to %s",
                 document_template,
                 os.path.join(os.path.dirname(path), "template"),
             )
-            common.copy_dir_contents(document_template, template_dir)
+            common.copy_dir_contents(document_template, template_dir, copied)
 
     # Only create template_dir if template actually exists.
     elif os.path.isdir(template_assets):
-        os.makedirs(template_dir)
+        os.makedirs(template_dir, exist_ok=True)
         log.info(
             "Copying %s to %s",
             template_assets,
             os.path.join(os.path.dirname(path), "template"),
         )
-        common.copy_dir_contents(template_assets, template_dir)
+        common.copy_dir_contents(template_assets, template_dir, copied)
         # If html template, also copy the default views files.
         if ext == ".html" and builtin_template:
             views_src_dir = os.path.join(os.path.dirname(__file__), "..", "views")
             views_tgt_dir = os.path.join(template_dir, "views")
             log.info("Copying %s to %s", views_src_dir, views_tgt_dir)
-            os.makedirs(views_tgt_dir)
-            common.copy_dir_contents(views_src_dir, views_tgt_dir)
+            os.makedirs(views_tgt_dir, exist_ok=True)
+            common.copy_dir_contents(views_src_dir, views_tgt_dir, copied)
+            if copied is not None:
+                common.delete_contents(views_tgt_dir, keep=copied)
+                copied.add(views_tgt_dir)
+
+    # Remove template files left by an earlier publish.
+    if copied is not None and os.path.isdir(template_dir):
+        common.delete_contents(template_dir, keep=copied)
+        if not os.listdir(template_dir):
+            os.rmdir(template_dir)
 
     # Return correct template and assets folder.
     if not template:
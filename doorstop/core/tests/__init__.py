@@ -4,12 +4,13 @@
 
 import logging
 import os
-from typing import List
+from typing import Dict, List
 from unittest.mock import MagicMock, Mock, patch
 
 from doorstop.core.base import BaseFileObject
 from doorstop.core.document import Document
 from doorstop.core.item import Item
+from doorstop.core.types import UID
 from doorstop.core.validators.item_validator import ItemValidator
 from doorstop.core.vcs.mockvcs import WorkingCopy
 
@@ -94,6 +95,7 @@ class MockSimpleDocument:
         self.prefix = "RQ"
         self.itemformat = "yaml"
         self._items: List[Item] = []
+        self._item_index: Dict[UID, Item] = {}
         self.extended_reviewed: List[str] = []
 
     def __iter__(self):
@@ -101,6 +103,7 @@ class MockSimpleDocument:
 
     def set_items(self, items):
         self._items = items
+        self._item_index = {item.uid: item for item in items}
 
 
 class MockDocumentSkip(MockDocument):  # pylint: disable=W0223,R0902
@@ -205,7 +208,8 @@ class MockDataMixIn:  # pylint: disable=R0903
     _mock_item3.document.prefix = "sys"
     item3.tree = Mock()
     item3.tree.find_item = Mock(return_value=_mock_item3)
-    item3.tree.vcs.paths = [
+    item3.tree.vcs = WorkingCopy(None)
+    item3.tree.vcs._path_cache = [  # pylint: disable=W0212
         (
             "Doorstop.sublime-project",
             "Doorstop.sublime-project",
@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: LGPL-3.0-only
+# pylint: disable=C0302
 
 """Tests for the doorstop.core package."""
 
@@ -30,6 +31,7 @@ from doorstop.core.tests import (
     DocumentNoSkip,
 )
 from doorstop.core.tests.helpers import on_error_with_retry
+from doorstop.core.validators.item_validator import ItemValidator
 from doorstop.core.vcs import mockvcs
 
 
@@ -131,6 +133,52 @@ class TestItemMarkdown(unittest.TestCase):
         self.assertEqual(["SYS001", "SYS002"], item2.links)
 
 
+class TestItemSaveUnchanged(unittest.TestCase):
+    """Integration tests for saving items whose files are unchanged."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp, "REQ001.yml")
+        common.write_text("text: Hello, world!\n", self.path)
+        self.item = core.Item(None, self.path)
+        self.item.tree = Mock()
+        self.item.save()
+        self.item.tree.reset_mock()
+        self.mtime = os.stat(self.path).st_mtime_ns - 10**9
+        os.utime(self.path, ns=(self.mtime, self.mtime))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    @patch("doorstop.settings.ADDREMOVE_FILES", True)
+    def test_save_unchanged(self):
+        """Verify an unchanged item file is neither written nor edited."""
+        count = core.base.BaseFileObject.unchanged_writes
+        self.item.save()
+        self.assertTrue(self.item.unchanged)
+        self.assertEqual(self.mtime, os.stat(self.path).st_mtime_ns)
+        self.assertFalse(self.item.tree.vcs.edit.called)
+        self.assertEqual(count + 1, core.base.BaseFileObject.unchanged_writes)
+
+    @patch("doorstop.settings.ADDREMOVE_FILES", True)
+    def test_save_changed(self):
+        """Verify a changed item file is written and edited."""
+        self.item.text = "Goodbye!"
+        self.assertFalse(self.item.unchanged)
+        self.assertNotEqual(self.mtime, os.stat(self.path).st_mtime_ns)
+        self.item.tree.vcs.edit.assert_called_once_with(self.path)
+
+    @patch("doorstop.settings.ADDREMOVE_FILES", True)
+    @patch("doorstop.settings.WRITE_LINESEPERATOR", "\r\n")
+    def test_save_line_endings(self):
+        """Verify a file is rewritten when only its line endings differ."""
+        self.item.save()
+        self.assertNotEqual(self.mtime, os.stat(self.path).st_mtime_ns)
+        with open(self.path, "rb") as stream:
+            self.assertIn(b"\r\n", stream.read())
+        self.item.tree.vcs.edit.assert_called_once_with(self.path)
+
+
 class TestDocument(unittest.TestCase):
     """Integration tests for the Document class."""
 
@@ -360,6 +408,216 @@ class TestTree(unittest.TestCase):
         self.assertTrue(self.tree.validate())
 
 
+def _create_tree_files(root, count=10):
+    """Create a parent document and a child document linking to it."""
+    for prefix, parent in (("SYS", None), ("REQ", "SYS")):
+        path = os.path.join(root, prefix.lower())
+        os.makedirs(path)
+        config = {"prefix": prefix, "sep": "", "digits": 3}
+        if parent:
+            config["parent"] = parent
+        common.write_text(
+            yaml.dump({"settings": config}),
+            os.path.join(path, core.Document.CONFIG),
+        )
+        for number in range(1, count + 1):
+            text = "level: 1.{n}\ntext: |\n  {p} item {n}.\n".format(n=number, p=prefix)
+            if parent:
+                text += "links:\n- {}{:03}: null\n".format(parent, number)
+            common.write_text(
+                text, os.path.join(path, "{}{:03}.yml".format(prefix, number))
+            )
+
+
+class TestTreeLoadJobs(unittest.TestCase):
+    """Integration tests for loading a tree with worker processes."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        _create_tree_files(self.temp)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    def _load(self, jobs):
+        tree = core.build(cwd=self.temp, root=self.temp)
+        tree.load(jobs=jobs)
+        return tree
+
+    def test_load_jobs(self):
+        """Verify a tree loaded in parallel matches a serial load."""
+        expected = self._load(jobs=1)
+        actual = self._load(jobs=2)
+        for document, document2 in zip(expected, actual):
+            self.assertEqual(
+                [(item.uid, item.data) for item in document],
+                [(item.uid, item.data) for item in document2],
+            )
+            self.assertTrue(all(item._loaded for item in document2))
+        self.assertEqual(["REQ001"], actual.find_item("SYS001").child_links)
+
+    def test_load_jobs_error(self):
+        """Verify a parallel load reports the same error as a serial load."""
+        path = os.path.join(self.temp, "req", "REQ005.yml")
+        common.write_text("text: [unclosed\n", path)
+        with self.assertRaises(DoorstopError) as serial:
+            self._load(jobs=1)
+        with self.assertRaises(DoorstopError) as parallel:
+            self._load(jobs=2)
+        self.assertEqual(str(serial.exception), str(parallel.exception))
+
+
+class TestTreeValidateJobs(unittest.TestCase):
+    """Integration tests for validating a tree with worker processes."""
+
+    def setUp(self):
+        self.temps = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        for temp in self.temps:
+            _create_tree_files(temp)
+            common.write_text(
+                "level: 1.11\ntext: |\n  SYS item 11.\n",
+                os.path.join(temp, "sys", "SYS011.yml"),
+            )
+            common.write_text(
+                "active: false\nlevel: 1.11\nlinks: [SYS002]\n",
+                os.path.join(temp, "req", "REQ011.yml"),
+            )
+
+    def tearDown(self):
+        for temp in self.temps:
+            shutil.rmtree(temp, onerror=on_error_with_retry)
+
+    def _validate(self, temp, jobs):
+        """Get the issues and warnings logged by a validation."""
+        tree = core.build(cwd=temp, root=temp)
+        issues = []
+        with patch("doorstop.settings.VALIDATE_JOBS", jobs):
+            with self.assertLogs("doorstop", logging.WARNING) as logs:
+                try:
+                    for issue in tree.get_issues():
+                        issues.append((type(issue), str(issue)))
+                except DoorstopError as exc:
+                    issues.append((DoorstopError, str(exc)))
+        return issues, [message.replace(temp, "") for message in logs.output]
+
+    def _read_files(self, temp):
+        """Get the contents of all item files."""
+        return {
+            name: common.read_text(os.path.join(temp, prefix, name))
+            for prefix in ("sys", "req")
+            for name in os.listdir(os.path.join(temp, prefix))
+        }
+
+    def test_validate_jobs(self):
+        """Verify a parallel validation matches a serial validation."""
+        expected, expected_messages = self._validate(self.temps[0], jobs=1)
+        issues, messages = self._validate(self.temps[1], jobs=2)
+        self.assertIn(
+            (DoorstopWarning, "SYS: SYS011: no links from child document: REQ"),
+            issues,
+        )
+        self.assertEqual(expected, issues)
+        self.assertIn("WARNING:doorstop.core.item:no item with UID: REQ011", messages)
+        self.assertEqual(expected_messages, messages)
+        self.assertEqual(
+            self._read_files(self.temps[0]), self._read_files(self.temps[1])
+        )
+
+    def test_validate_jobs_error(self):
+        """Verify a parallel validation stops at the same error."""
+        get_issues = ItemValidator.get_issues
+
+        def get_issues_error(self, item, **kwargs):
+            if item.uid == "REQ005":
+                raise DoorstopError("check failed")
+            yield from get_issues(self, item, **kwargs)
+
+        with patch.object(ItemValidator, "get_issues", get_issues_error):
+            expected, _ = self._validate(self.temps[0], jobs=1)
+            issues, _ = self._validate(self.temps[1], jobs=2)
+        self.assertEqual((DoorstopError, "check failed"), issues[-1])
+        self.assertEqual(expected, issues)
+        self.assertEqual(
+            self._read_files(self.temps[0]), self._read_files(self.temps[1])
+        )
+
+
+class TestTreeValidateIncremental(unittest.TestCase):
+    """Integration tests for validating a tree incrementally."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        _create_tree_files(self.temp)
+        common.write_text(
+            "level: 1.11\ntext: |\n  SYS item 11.\n",
+            os.path.join(self.temp, "sys", "SYS011.yml"),
+        )
+        self._validate(incremental=False)  # review and reformat new items
+
+    def tearDown(self):
+        core.cache.clear(self.temp)  # avoid writing the cache at exit
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    def _validate(self, incremental=True):
+        """Get the issues found in a freshly built tree and the items checked."""
+        with patch.object(
+            ItemValidator,
+            "get_issues",
+            autospec=True,
+            side_effect=ItemValidator.get_issues,
+        ) as mock_get_issues:
+            tree = core.build(cwd=self.temp, root=self.temp)
+            with patch("doorstop.settings.VALIDATE_INCREMENTAL", incremental):
+                issues = [(type(issue), str(issue)) for issue in tree.get_issues()]
+        checked = [str(call[0][1].uid) for call in mock_get_issues.call_args_list]
+        return issues, sorted(checked)
+
+    def test_validate_incremental(self):
+        """Verify issues are reused from an earlier validation."""
+        expected, _ = self._validate(incremental=False)
+        self.assertIn(
+            (DoorstopWarning, "SYS: SYS011: no links from child document: REQ"),
+            expected,
+        )
+        issues, checked = self._validate()
+        self.assertEqual(expected, issues)
+        self.assertEqual(21, len(checked))
+        issues, checked = self._validate()
+        self.assertEqual(expected, issues)
+        self.assertEqual([], checked)
+
+    def test_validate_incremental_changed(self):
+        """Verify changed items and their linked items are checked again."""
+        self._validate()
+        path = os.path.join(self.temp, "req", "REQ005.yml")
+        common.write_text(
+            "level: 1.5\ntext: |\n  REQ item 5.\nlinks:\n- SYS011: null\n", path
+        )
+        issues, checked = self._validate()
+        self.assertEqual(["REQ005", "SYS005", "SYS011"], checked)
+        expected, _ = self._validate(incremental=False)
+        self.assertEqual(expected, issues)
+
+    def test_validate_incremental_deleted(self):
+        """Verify items linked to a deleted item are checked again."""
+        self._validate()
+        os.remove(os.path.join(self.temp, "sys", "SYS003.yml"))
+        issues, checked = self._validate()
+        self.assertEqual(["REQ003"], checked)
+        self.assertIn(
+            (DoorstopError, "REQ: REQ003: linked to unknown item: SYS003"), issues
+        )
+        expected, _ = self._validate(incremental=False)
+        self.assertEqual(expected, issues)
+
+    def test_validate_incremental_settings(self):
+        """Verify all items are checked again when settings change."""
+        self._validate()
+        with patch("doorstop.settings.CHECK_SUSPECT_LINKS", False):
+            _, checked = self._validate()
+        self.assertEqual(21, len(checked))
+
+
 @unittest.skipUnless(os.getenv(ENV), REASON)
 class TestEditor(unittest.TestCase):
     """Integrations tests for the editor module."""
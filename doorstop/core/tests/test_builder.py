@@ -160,3 +160,48 @@ class TestModule(unittest.TestCase):
         # Verify that building tree ignores subfolder's document.
         same_tree_again = build(cwd, root)
         self.assertEqual(1, len(same_tree_again.documents))
+
+    def _create_documents(self):
+        """Create a tree with documents in nested folders."""
+        temp = tempfile.mkdtemp()
+        tree = build(temp, temp)
+        tree.create_document(temp, "TST")
+        for prefix, parent in (("A", "TST"), ("B", "TST"), ("C", "A")):
+            path = os.path.join(temp, *prefix.replace("C", "A/C").split("/"))
+            tree.create_document(path, prefix, parent=parent)
+        return temp
+
+    def test_tree_skips_excluded_documents(self):
+        """Verify documents are not found in excluded folders."""
+        temp = self._create_documents()
+
+        with patch("doorstop.settings.DOCUMENT_EXCLUDES", ["B", "A/C"]):
+            tree = build(temp, temp)
+
+        self.assertEqual(["TST", "A"], [str(doc.prefix) for doc in tree.documents])
+
+    def test_tree_finds_documents_in_roots(self):
+        """Verify documents are only found in the configured search roots."""
+        temp = tempfile.mkdtemp()
+        tree = build(temp, temp)
+        tree.create_document(os.path.join(temp, "reqs"), "TST")
+        tree.create_document(os.path.join(temp, "reqs", "A"), "A", parent="TST")
+        tree.create_document(os.path.join(temp, "other"), "B", parent="TST")
+
+        with patch("doorstop.settings.DOCUMENT_ROOTS", ["reqs/A", "reqs"]):
+            tree = build(temp, temp)
+
+        self.assertEqual(["TST", "A"], [str(doc.prefix) for doc in tree.documents])
+
+    def test_tree_skips_ignored_documents(self):
+        """Verify documents are not found in folders the VCS ignores."""
+        temp = self._create_documents()
+        working_copy = Mock()
+        working_copy.IGNORES = ()
+        working_copy.ignored_dir = lambda path: path == "A"
+
+        with patch("doorstop.core.vcs.load", Mock(return_value=working_copy)):
+            tree = build(temp, temp)
+
+        self.assertEqual(["TST", "B"], [str(doc.prefix) for doc in tree.documents])
+        self.assertIs(working_copy, tree.vcs)
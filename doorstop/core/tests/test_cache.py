@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: LGPL-3.0-only
+
+"""Unit tests for the doorstop.core.cache module."""
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from doorstop import common
+from doorstop.core import cache
+from doorstop.core.item import Item
+from doorstop.core.tests.helpers import on_error_with_retry
+
+
+class TestStore(unittest.TestCase):
+    """Unit tests for the _Store base class."""
+
+    # pylint: disable=protected-access
+
+    def test_abstract(self):
+        """Verify stores must implement saving and resetting."""
+        self.assertEqual({"_reset", "save"}, cache._Store.__abstractmethods__)
+        self.assertRaises(TypeError, cache._Store, tempfile.gettempdir())
+
+        class Store(cache._Store):
+            def _reset(self):
+                pass
+
+            def save(self):
+                pass
+
+        self.assertIsInstance(Store(tempfile.gettempdir()), cache._Store)
+
+
+class TestParseCache(unittest.TestCase):
+    """Unit tests for the ParseCache class."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp, "REQ001.yml")
+        self.text = "text: Hello, world!\n"
+        common.write_text(self.text, self.path)
+        self._age(self.path)
+        self.cache = cache.ParseCache(self.temp)
+        self.read = Mock(side_effect=common.read_text)
+
+    def tearDown(self):
+        self.cache.clear()  # avoid writing the cache at exit
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    @staticmethod
+    def _age(path, seconds=60):
+        """Make a file look like it was modified a while ago."""
+        stat = os.stat(path)
+        mtime = stat.st_mtime_ns - seconds * 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_get_miss(self):
+        """Verify nothing is returned for an unknown file."""
+        self.assertIsNone(self.cache.get(self.path, self.read))
+        self.assertEqual(1, self.cache.misses)
+
+    def test_put_get(self):
+        """Verify data can be reused without reading the file."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        data = self.cache.get(self.path, self.read)
+        self.assertEqual({"text": "Hello, world!"}, data)
+        self.assertFalse(self.read.called)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_get_changed(self):
+        """Verify data is not reused after a file changes."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        common.write_text("text: Goodbye!\n", self.path)
+        self.assertIsNone(self.cache.get(self.path, self.read))
+
+    def test_get_deleted(self):
+        """Verify data is not reused after a file is deleted."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        os.remove(self.path)
+        self.assertIsNone(self.cache.get(self.path, self.read))
+
+    @patch("doorstop.settings.CACHE_PARSED_HASH", True)
+    def test_get_hash(self):
+        """Verify contents are compared when hash checks are enabled."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        stat = os.stat(self.path)
+        common.write_text("text: Hello, World!\n", self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNone(self.cache.get(self.path, self.read))
+        self.read.assert_called_once_with(self.path)
+
+    def test_get_racy(self):
+        """Verify contents are compared for files changed while caching."""
+        common.write_text(self.text, self.path)
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        self.assertEqual(
+            {"text": "Hello, world!"}, self.cache.get(self.path, self.read)
+        )
+        self.read.assert_called_once_with(self.path)
+
+    def test_put_uncacheable(self):
+        """Verify data that does not round trip through JSON is skipped."""
+        data = {"date": datetime.date(2020, 1, 1)}
+        self.cache.put(self.path, self.text, data)
+        self.assertEqual({}, self.cache.entries)
+        self.cache.put(self.path, self.text, {1: "one"})
+        self.assertEqual({}, self.cache.entries)
+
+    def test_save(self):
+        """Verify entries are written to disk and read back."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        self.cache.save()
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.temp, cache.DIRECTORY, ".gitignore"))
+        )
+        parse_cache = cache.ParseCache(self.temp)
+        data = parse_cache.get(self.path, self.read)
+        self.assertEqual({"text": "Hello, world!"}, data)
+
+    @patch("doorstop.settings.CACHE_PARSED_SIZE", 100)
+    def test_save_evicts(self):
+        """Verify the least recently used entries are evicted."""
+        paths = []
+        for number in range(1, 6):
+            path = os.path.join(self.temp, "REQ00{}.yml".format(number))
+            text = "text: {}\n".format("x" * 30)
+            common.write_text(text, path)
+            self.cache.put(path, text, {"text": "x" * 30})
+            self.cache.entries[os.path.abspath(path)]["used"] = number
+            paths.append(os.path.abspath(path))
+        self.cache.save()
+        self.assertEqual(paths[-2:], sorted(self.cache.entries))
+
+    def test_clear(self):
+        """Verify the cache directory can be deleted."""
+        self.cache.put(self.path, self.text, {"text": "Hello, world!"})
+        self.cache.save()
+        self.cache.clear()
+        self.assertFalse(os.path.exists(os.path.join(self.temp, cache.DIRECTORY)))
+        self.assertEqual({}, self.cache.entries)
+
+    def test_get_shared(self):
+        """Verify one cache is shared per project root."""
+        self.assertIs(cache.get(self.temp), cache.get(self.temp + os.sep))
+
+    @patch("doorstop.settings.CACHE_PARSED", True)
+    def test_item_load(self):
+        """Verify items are loaded from the cache when unchanged."""
+        item = Item(None, self.path, root=self.temp)
+        self.assertEqual("Hello, world!", item.text)
+        parse_cache = cache.get(self.temp)
+        self.assertEqual(1, parse_cache.misses)
+        with patch("doorstop.common.load_yaml") as mock_load_yaml:
+            item = Item(None, self.path, root=self.temp)
+            self.assertEqual("Hello, world!", item.text)
+        self.assertFalse(mock_load_yaml.called)
+        self.assertEqual(1, parse_cache.hits)
+        parse_cache.clear()  # avoid writing the cache at exit
+
+
+class TestValidationCache(unittest.TestCase):
+    """Unit tests for the ValidationCache class."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.cache = cache.ValidationCache(self.temp)
+        self.entries = {"REQ001": {"fingerprint": "abc123", "issues": []}}
+
+    def tearDown(self):
+        self.cache.clear()  # avoid writing the cache at exit
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    def test_get_entries_empty(self):
+        """Verify there are no entries before a validation is recorded."""
+        self.assertEqual({}, self.cache.get_entries([True]))
+
+    def test_set_entries_save(self):
+        """Verify entries are written to disk and read back."""
+        self.cache.set_entries([True], self.entries)
+        self.cache.save()
+        validation_cache = cache.ValidationCache(self.temp)
+        self.assertEqual(self.entries, validation_cache.get_entries([True]))
+
+    def test_get_entries_key_changed(self):
+        """Verify entries are discarded when validation settings change."""
+        self.cache.set_entries([True], self.entries)
+        self.assertEqual({}, self.cache.get_entries([False]))
+
+    def test_clear_all(self):
+        """Verify all caches for a project root can be cleared at once."""
+        validation_cache = cache.get_validation(self.temp)
+        validation_cache.set_entries([True], self.entries)
+        validation_cache.save()
+        cache.clear(self.temp)
+        self.assertFalse(os.path.exists(os.path.join(self.temp, cache.DIRECTORY)))
+        self.assertEqual({}, validation_cache.get_entries([True]))
+
+
+class TestReferenceCache(unittest.TestCase):
+    """Unit tests for the ReferenceCache class."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp, "main.c")
+        common.write_text("// REQ001\n// REF123\n", self.path)
+        TestParseCache._age(self.path)  # pylint: disable=protected-access
+        self.cache = cache.ReferenceCache(self.temp)
+        self.search = Mock(return_value=({"REQ001": 1}, {"REF123": 2}))
+
+    def tearDown(self):
+        self.cache.clear()  # avoid writing the cache at exit
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    def scan(self, refs, keywords):
+        """Search the file through the cache and record a complete search."""
+        self.cache.start(refs)
+        found = self.cache.search(self.path, refs, keywords, self.search)
+        self.cache.finish()
+        return found
+
+    def test_search_miss(self):
+        """Verify files are searched when nothing is cached."""
+        found = self.scan({"REQ001", "REQ002"}, {"REF123", "REF456"})
+        self.assertEqual(({"REQ001": 1}, {"REF123": 2, "REF456": None}), found)
+        self.search.assert_called_once_with(
+            self.path, {"REQ001", "REQ002"}, {"REF123", "REF456"}
+        )
+        self.assertEqual(1, self.cache.misses)
+
+    def test_search_hit(self):
+        """Verify cached locations are reused for unchanged files."""
+        self.scan({"REQ001"}, {"REF123"})
+        self.search.reset_mock()
+        found = self.scan({"REQ001"}, {"REF123"})
+        self.assertEqual(({"REQ001": 1}, {"REF123": 2}), found)
+        self.assertFalse(self.search.called)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_search_new_refs(self):
+        """Verify unchanged files are only searched for new references."""
+        self.scan({"REQ001"}, set())
+        self.search.return_value = ({"REQ002": 3}, {})
+        found = self.scan({"REQ001", "REQ002"}, set())
+        self.assertEqual(({"REQ001": 1, "REQ002": 3}, {}), found)
+        self.search.assert_called_with(self.path, {"REQ002"}, set())
+
+    def test_search_changed(self):
+        """Verify changed files are searched again for all references."""
+        self.scan({"REQ001"}, set())
+        common.write_text("// REQ001 changed\n", self.path)
+        self.scan({"REQ001"}, set())
+        self.search.assert_called_with(self.path, {"REQ001"}, set())
+        self.assertEqual(2, self.search.call_count)
+
+    def test_search_incomplete(self):
+        """Verify locations are only reused after a complete search."""
+        self.cache.start({"REQ001"})
+        self.cache.search(self.path, {"REQ001"}, set(), self.search)
+        self.cache.save()
+        self.assertFalse(os.path.exists(os.path.join(self.temp, cache.DIRECTORY)))
+
+    def test_save(self):
+        """Verify cached locations are written to disk and read back."""
+        self.scan({"REQ001"}, {"REF123"})
+        self.cache.save()
+        self.cache = cache.ReferenceCache(self.temp)
+        self.search.reset_mock()
+        found = self.scan({"REQ001"}, {"REF123"})
+        self.assertEqual(({"REQ001": 1}, {"REF123": 2}), found)
+        self.assertFalse(self.search.called)
+
+    def test_finish_drops_missing_files(self):
+        """Verify files not found by the last search are dropped."""
+        self.scan({"REQ001"}, set())
+        self.cache.start({"REQ001"})
+        self.cache.finish()
+        self.assertEqual({}, self.cache.contents["files"])
+
+
+class TestManifest(unittest.TestCase):
+    """Unit tests for the Manifest class."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp, "reqs")
+        os.makedirs(self.path)
+        config = os.path.join(self.path, ".doorstop.yml")
+        common.write_text("settings:\n  prefix: REQ\n", config)
+        common.write_text(
+            "text: Hello, world!\n", os.path.join(self.path, "REQ001.yml")
+        )
+        TestParseCache._age(self.path)
+        self.cache = cache.Manifest(self.temp)
+        self.stats = {}
+        cache.stat(self.path, self.stats)
+
+    def tearDown(self):
+        self.cache.clear()  # avoid writing the cache at exit
+        shutil.rmtree(self.temp, onerror=on_error_with_retry)
+
+    def test_get_documents_miss(self):
+        """Verify no documents are returned before a search is recorded."""
+        self.assertIsNone(self.cache.get_documents([]))
+
+    def test_set_get_documents(self):
+        """Verify documents are reused while searched directories are unchanged."""
+        self.cache.set_documents([], ["reqs"], self.stats)
+        self.assertEqual(["reqs"], self.cache.get_documents([]))
+
+    def test_get_documents_key_changed(self):
+        """Verify documents are searched again when the settings change."""
+        self.cache.set_documents([], ["reqs"], self.stats)
+        self.assertIsNone(self.cache.get_documents([["reqs"], []]))
+
+    def test_get_documents_changed(self):
+        """Verify documents are searched again after a directory changes."""
+        self.cache.set_documents([], ["reqs"], self.stats)
+        common.write_text("text: Goodbye!\n", os.path.join(self.path, "REQ002.yml"))
+        self.assertIsNone(self.cache.get_documents([]))
+
+    def test_get_documents_racy(self):
+        """Verify directories changed just before recording are not trusted."""
+        common.write_text("text: Goodbye!\n", os.path.join(self.path, "REQ002.yml"))
+        stats = {}
+        cache.stat(self.path, stats)
+        self.cache.set_documents([], ["reqs"], stats)
+        self.assertIsNone(self.cache.get_documents([]))
+
+    def test_set_items_save(self):
+        """Verify item paths are written to disk and read back."""
+        self.cache.set_items(self.path, ["REQ001.yml"], self.stats)
+        self.cache.save()
+        manifest = cache.Manifest(self.temp)
+        self.assertEqual(["REQ001.yml"], manifest.get_items(self.path))
+
+    @patch("doorstop.settings.CACHE_MANIFEST", True)
+    def test_build(self):
+        """Verify a tree is built from the manifest when unchanged."""
+        from doorstop.core import builder  # pylint: disable=C0415
+
+        TestParseCache._age(self.temp)
+        list(builder.build(self.temp, self.temp).document)
+        with patch("doorstop.core.builder._find_documents") as mock_find:
+            with patch("os.walk") as mock_walk:
+                tree = builder.build(self.temp, self.temp)
+                items = list(tree.document)
+        self.assertFalse(mock_find.called)
+        self.assertFalse(mock_walk.called)
+        self.assertEqual(["REQ001"], [str(item.uid) for item in items])
+        cache.get_manifest(self.temp).clear()  # avoid writing the cache at exit
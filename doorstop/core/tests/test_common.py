@@ -3,8 +3,13 @@
 """Unit tests for the doorstop.common module """
 
 import unittest
+from unittest.mock import patch
+
+import yaml
 
 from doorstop import common
+from doorstop.core.tests import MockItem, MockSimpleDocument
+from doorstop.core.types import Level, Text, _Literal
 
 MARKDOW_DEFAULT = """
 ---
@@ -154,3 +159,116 @@ list:
 
 text text text""".lstrip(),
         )
+
+
+YAML_CORPUS = [
+    "",
+    "Single line of text.",
+    "Trailing newline.\n",
+    "Two\nlines",
+    "Paragraph one.\n\nParagraph two.",
+    "# Heading\n\n- item\n  - nested item\n\n```python\ndef f():\n    return 1\n```",
+    "    indented code block",
+    "Trailing space on a line \nnext line",
+    "Trailing space ",
+    "Quotes ' and \" and backslash \\",
+    "YAML syntax: key: value # comment & *alias !tag [flow] {map} | >",
+    "Unicode: é ß 漢字 \xa0 non-breaking",
+    "Emoji outside the BMP: \U0001F600",
+    "Next line \x85 and line separator  ",
+    "Tab\tseparated\tvalues",
+    "Carriage\r\nreturn",
+    "A very long line " + "that keeps on going " * 10,
+    "A very long line with\nbreaks " + "that keeps on going " * 10,
+    "true",
+    "1.0",
+    "null",
+]
+
+
+class TestYAMLIO(unittest.TestCase):
+    """Unit tests for YAML loading and dumping with and without libyaml."""
+
+    # pylint: disable=protected-access
+
+    def _dump(self, data):
+        with patch("doorstop.settings.USE_LIBYAML", False):
+            expected = common.dump_yaml(data)
+        with patch("doorstop.settings.USE_LIBYAML", True):
+            actual = common.dump_yaml(data)
+        self.assertEqual(expected, actual)
+        return expected
+
+    def _load(self, text):
+        with patch("doorstop.settings.USE_LIBYAML", False):
+            expected = common.load_yaml(text, "path/to/REQ001.yml")
+        with patch("doorstop.settings.USE_LIBYAML", True):
+            actual = common.load_yaml(text, "path/to/REQ001.yml")
+        self.assertEqual(expected, actual)
+        return expected
+
+    def test_round_trip_text(self):
+        """Verify literal text is dumped and loaded identically."""
+        for value in YAML_CORPUS:
+            with self.subTest(value=value):
+                text = self._dump({"text": Text(value).yaml})
+                self.assertEqual(Text(value), Text(self._load(text)["text"]))
+                text = self._dump({"text": _Literal(value + "\n\n")})
+                self.assertEqual(value + "\n\n", self._load(text)["text"])
+
+    def test_round_trip_strings(self):
+        """Verify plain strings are dumped and loaded identically."""
+        for value in YAML_CORPUS:
+            with self.subTest(value=value):
+                text = self._dump({"attribute": value, value.strip() or "key": [value]})
+                self._load(text)
+
+    def test_round_trip_levels(self):
+        """Verify levels are dumped and loaded identically."""
+        for value in ("1", "1.0", "1.2", "1.10", "2.3.0", "1.2.3.4.5", "10.20"):
+            with self.subTest(value=value):
+                level = Level(value)
+                text = self._dump({"level": level.yaml})
+                self.assertEqual(level, Level(self._load(text)["level"]))
+
+    def test_round_trip_item(self):
+        """Verify a saved item is byte-identical with and without libyaml."""
+        for value in YAML_CORPUS:
+            with self.subTest(value=value):
+                item = MockItem(MockSimpleDocument(), "path/to/REQ001.yml")
+                item.text = value
+                item.header = value
+                item.level = "1.2.0"
+                item.set("custom", {"list": [value, 1, None, True], "text": value})
+                with patch("doorstop.settings.USE_LIBYAML", False):
+                    item.save()
+                    expected = item._file
+                with patch("doorstop.settings.USE_LIBYAML", True):
+                    item.save()
+                    actual = item._file
+                self.assertEqual(expected, actual)
+                self._load(actual)
+
+    @unittest.skipUnless(yaml.__with_libyaml__, "libyaml is not installed")
+    @patch("doorstop.settings.USE_LIBYAML", True)
+    def test_dumper(self):
+        """Verify libyaml is used for typical item data."""
+        data = {
+            "level": Level("1.2").yaml,
+            "links": [{"SYS001": "abc123"}],
+            "text": Text("# Heading\n\n- item\n  - nested item").yaml,
+        }
+        self.assertIs(yaml.CDumper, common._yaml_dumper(data))
+        data["text"] = Text("Tab\tseparated").yaml
+        self.assertIs(yaml.Dumper, common._yaml_dumper(data))
+
+    @patch("doorstop.settings.USE_LIBYAML", True)
+    def test_load_error(self):
+        """Verify parse errors are reported the same with and without libyaml."""
+        text = "text: [unclosed\n"
+        with self.assertRaises(common.DoorstopError) as actual:
+            common.load_yaml(text, "path/to/REQ001.yml")
+        with patch("doorstop.settings.USE_LIBYAML", False):
+            with self.assertRaises(common.DoorstopError) as expected:
+                common.load_yaml(text, "path/to/REQ001.yml")
+        self.assertEqual(str(expected.exception), str(actual.exception))
@@ -7,6 +7,8 @@
 
 import logging
 import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, Mock, call, patch
@@ -14,6 +16,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 from doorstop import common
 from doorstop.common import DoorstopError, DoorstopInfo, DoorstopWarning
 from doorstop.core.document import Document
+from doorstop.core.item import Item
 from doorstop.core.tests import EMPTY, FILES, NEW, ROOT, MockDocument, MockItem
 from doorstop.core.types import UID, Level
 
@@ -315,6 +318,30 @@ class TestDocument(unittest.TestCase):
         print(self.document.items)
         self.assertEqual(7, len(self.document.tree._item_cache))
 
+    def test_items_skip_files(self):
+        """Verify only files named like items are considered as items."""
+        temp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp)
+        for relpath in (
+            ".doorstop.yml",
+            "REQ001.yml",
+            "index.yml",
+            "notes.txt",
+            os.path.join("sub", "REQ002.yml"),
+            os.path.join("assets", "REQ003.yml"),
+            os.path.join("template", "REQ004.yml"),
+            os.path.join("embedded", ".doorstop.yml"),
+            os.path.join("embedded", "REQ005.yml"),
+        ):
+            path = os.path.join(temp, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            common.write_text("", path)
+        document = Document(temp, root=temp)
+        with patch("doorstop.core.document.Item", wraps=Item) as mock_item:
+            uids = [str(item.uid) for item in document.items]
+        self.assertEqual(["REQ001", "REQ002"], uids)
+        self.assertEqual(2, mock_item.call_count)
+
     @patch("doorstop.core.document.Document", MockDocument)
     def test_new(self):
         """Verify a new document can be created with defaults."""
@@ -785,6 +812,17 @@ outline:
         self.document.tree.vcs.delete.assert_called_once_with(self.document.config)
         self.assertIs(None, self.document.tree._document_cache[self.document.prefix])
 
+    @patch("doorstop.core.item.Item.delete", Mock())
+    @patch("doorstop.common.delete", Mock())
+    def test_delete_cache_str(self):
+        """Verify a deleted document is expunged when cached by string."""
+        prefix = str(self.document.prefix)
+        self.document.tree = Mock()
+        self.document.tree._item_cache = {}
+        self.document.tree._document_cache = {prefix: self.document}
+        self.document.delete()
+        self.assertIs(None, self.document.tree._document_cache[prefix])
+
     @patch("doorstop.core.document.Document.get_issues", Mock(return_value=[]))
     def test_issues(self):
         """Verify an document's issues convenience property can be accessed."""
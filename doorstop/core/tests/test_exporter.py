@@ -120,6 +120,33 @@ class TestModule(MockDataMixIn, unittest.TestCase):
             DoorstopError, exporter.export_file, self.document, "a.csv", ".a"
         )
 
+    def test_export_traceability(self):
+        """Verify a traceability matrix can be streamed to files."""
+        parent = Mock(uid="RQ001")
+        child = Mock(uid="TST001")
+        tree = Mock(documents=[Mock(prefix="RQ"), Mock(prefix="TST")])
+        tree.iter_traceability.side_effect = lambda: iter(
+            [(parent, child), (None, Mock(uid="TST002"))]
+        )
+        temp = tempfile.mkdtemp()
+        # Act
+        path_csv = exporter.export_traceability(tree, os.path.join(temp, "t.csv"))
+        path_tsv = exporter.export_traceability(tree, os.path.join(temp, "t.tsv"))
+        path_jsonl = exporter.export_traceability(tree, os.path.join(temp, "t.jsonl"))
+        # Assert
+        with open(path_csv, encoding="utf-8") as stream:
+            self.assertEqual("RQ,TST\nRQ001,TST001\n,TST002\n", stream.read())
+        with open(path_tsv, encoding="utf-8") as stream:
+            self.assertEqual("RQ\tTST\nRQ001\tTST001\n\tTST002\n", stream.read())
+        with open(path_jsonl, encoding="utf-8") as stream:
+            text = '{"RQ": "RQ001", "TST": "TST001"}\n{"TST": "TST002"}\n'
+            self.assertEqual(text, stream.read())
+
+    def test_export_traceability_unknown(self):
+        """Verify an exception is raised for unknown traceability formats."""
+        tree = Mock(documents=[])
+        self.assertRaises(DoorstopError, exporter.export_traceability, tree, "a.a")
+
     @patch("doorstop.core.exporter._file_csv")
     def test_file_tsv(self, mock_file_csv):
         """Verify a (mock) TSV file can be created."""
@@ -605,6 +605,7 @@ class TestModuleAddItem(unittest.TestCase):
 
     mock_document = Mock()
     mock_document._items = []
+    mock_document._item_index = {}
 
     def setUp(self):
         # Create default item attributes
@@ -3,7 +3,11 @@
 
 """Unit tests for the doorstop.core.item module."""
 
+import logging
 import os
+import shutil
+import tempfile
+import tracemalloc
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
@@ -18,7 +22,7 @@ from doorstop.core.tests import (
     MockItem,
     MockSimpleDocument,
 )
-from doorstop.core.types import Stamp, Text
+from doorstop.core.types import Level, Stamp, Text
 from doorstop.core.vcs.mockvcs import WorkingCopy
 
 YAML_DEFAULT = """
@@ -820,7 +824,7 @@ class TestItem(unittest.TestCase):
         self.item._data["attr"] = 1
         stamp = "0s4QQh2AZXSoZNYGcfybCGLHAgO4EWY9gxK_LVNiqOA="
         self.assertEqual(stamp, self.item.stamp())
-        self.item._data["attr"] = "1"
+        self.item.set_attributes({"attr": "1"})
         stamp = "GWlkpsRSzT_lgE4CNvE4wrUZZwM3iHKHOa6idcHUSUw="
         self.assertEqual(stamp, self.item.stamp())
 
@@ -837,19 +841,43 @@ class TestItem(unittest.TestCase):
         self.item._data["attr"] = []
         stamp = "qwUP7VgUbHWIdj-T2ZfGhROfJQwSHDhsC6WR9vUTk1U="
         self.assertEqual(stamp, self.item.stamp())
-        self.item._data["attr"] = [None]
+        self.item.set_attributes({"attr": [None]})
         stamp = "GHDRiY4C3twnXDTCqoCAD_iymfe892ZzQuYjuccFBT0="
         self.assertEqual(stamp, self.item.stamp())
-        self.item._data["attr"] = [""]
+        self.item.set_attributes({"attr": [""]})
         stamp = "Rfwtl2j56CdQLtE4b5StEa0ECVTqlOpABLdhEa1avyo="
         self.assertEqual(stamp, self.item.stamp())
-        self.item._data["attr"] = [[]]
+        self.item.set_attributes({"attr": [[]]})
         stamp = "AXWIEp9CYI4UWzIw4NinvDrUFzQl_8rCL9B_PmGisYk="
         self.assertEqual(stamp, self.item.stamp())
-        self.item._data["attr"] = [{}]
+        self.item.set_attributes({"attr": [{}]})
         stamp = "C5Bm5ej09zaJxbtbE9PIcno8M9lIBIC6sJOmNJkrJH8="
         self.assertEqual(stamp, self.item.stamp())
 
+    def test_stamp_cached(self):
+        """Verify an item's stamps are cached until it changes."""
+        stamp = self.item.stamp()
+        hits = Item.stamp_hits
+        self.assertIs(stamp, self.item.stamp())
+        self.assertEqual(hits + 1, Item.stamp_hits)
+        self.assertIsNot(stamp, self.item.stamp(links=True))
+        self.item.text = "changed"
+        self.assertNotEqual(stamp, self.item.stamp())
+
+    def test_stamp_cached_reload(self):
+        """Verify reloading an item discards its cached stamps."""
+        stamp = self.item.stamp()
+        self.item._file = "text: changed\n"
+        self.item.load(reload=True)
+        self.assertNotEqual(stamp, self.item.stamp())
+
+    def test_stamp_cached_extended_reviewed(self):
+        """Verify changing extended reviewed attributes recomputes stamps."""
+        self.item._data["type"] = "functional"
+        stamp = self.item.stamp()
+        self.item.document.extended_reviewed = ["type"]
+        self.assertNotEqual(stamp, self.item.stamp())
+
     def test_stamp_with_empty_dict_extended_reviewed(self):
         """Verify fingerprint with empty dict extended reviewed attribute."""
         self.item.document.extended_reviewed = ["attr"]
@@ -968,6 +996,113 @@ class TestItem(unittest.TestCase):
         self.assertIs(None, self.item.tree._item_cache[self.item.uid])
 
 
+class TestItemData(unittest.TestCase):
+    """Unit tests for the compact representation of Items."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp)
+        self.path = os.path.join(self.temp, "REQ001.yml")
+        common.write_text("level: 1.2\nlinks: [SYS001]\ntext: abc\n", self.path)
+
+    def test_shared_defaults(self):
+        """Verify items share their default data until it is used."""
+        item1 = Item(None, self.path, auto=False)
+        item2 = Item(None, self.path, auto=False)
+        self.assertIs(item1._item_data, item2._item_data)
+        self.assertIsNotNone(item1._data)
+        self.assertIs(item1._item_data, item2._item_data)
+        item1.link("SYS002")
+        self.assertIsNot(item1._item_data, item2._item_data)
+        self.assertEqual(["SYS002"], [str(uid) for uid in item1._data["links"]])
+        self.assertEqual(0, len(item2._item_data["links"]))
+        self.assertEqual(["SYS001"], item2.links)
+
+    @patch("doorstop.settings.LOAD_PARTIAL", True)
+    def test_load_partial(self):
+        """Verify text attributes are converted on first use."""
+        item = Item(None, self.path)
+        item.load()
+        self.assertEqual({"text": "abc"}, item._pending)
+        self.assertEqual(Level("1.2"), item.level)
+        self.assertEqual(["SYS001"], item.links)
+        self.assertIn("text", item._pending)
+        self.assertEqual("abc", item.text)
+        self.assertIsInstance(item.text, Text)
+        self.assertFalse(item._pending)
+        partial = Item(None, self.path)
+        partial.load()
+        with patch("doorstop.settings.LOAD_PARTIAL", False):
+            expected = Item(None, self.path)
+            expected.load()
+        self.assertEqual(expected._format(), partial._format())
+
+    def test_unloaded_items_share_data(self):
+        """Verify unloaded items only hold their own slots."""
+        items = [Item(None, self.path) for _ in range(10)]
+        for item in items:
+            self.assertFalse(vars(item))
+            self.assertIs(items[0]._item_data, item._item_data)
+        for item in items:
+            item.load()
+        self.assertIsNot(items[0]._item_data, items[1]._item_data)
+        self.assertEqual(items[0]._data, items[1]._data)
+
+    def test_shared_data_copy_on_write(self):
+        """Verify the shared default data is copied before it is changed."""
+        item1 = Item(None, self.path)
+        item2 = Item(None, self.path)
+        shared = item1._item_data
+        data = item1._data
+        self.assertIs(shared, item1._item_data)
+        self.assertRaises(TypeError, shared.__setitem__, "text", "abc")
+        data["text"] = "abc"
+        self.assertEqual("abc", data["text"])
+        self.assertEqual("abc", item1._item_data["text"])
+        self.assertIs(shared, item2._item_data)
+        self.assertEqual("", shared["text"])
+
+    @patch.object(Item, "auto", False)
+    def test_auto_class_default(self):
+        """Verify the class default applies to items that do not override it."""
+        item = Item(None, self.path)
+        self.assertFalse(item.auto)
+        self.assertTrue(Item(None, self.path, auto=True).auto)
+        item.save()
+        self.assertTrue(item.auto)
+
+    def _bytes_per_item(self, own=False, load=False, count=100):
+        """Measure the memory allocated for each new item."""
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            items = [Item(None, self.path) for _ in range(count)]
+            for item in items:
+                if own:
+                    item._own_data()
+                if load:
+                    item.load()
+            return (tracemalloc.get_traced_memory()[0] - start) / count
+        finally:
+            tracemalloc.stop()
+
+    def test_bytes_per_item(self):
+        """Verify sharing default data reduces the memory used by each item."""
+        shared = self._bytes_per_item()
+        copied = self._bytes_per_item(own=True)
+        loaded = self._bytes_per_item(load=True)
+        logging.info(
+            "bytes per item: %.0f unloaded (%.0f with copied defaults), %.0f loaded",
+            shared,
+            copied,
+            loaded,
+        )
+        self.assertLess(shared, copied)
+        self.assertLess(shared, loaded)
+
+
 class TestFormatting(unittest.TestCase):
     """Unit tests for text formatting in Items."""
 
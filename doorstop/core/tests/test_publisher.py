@@ -5,6 +5,8 @@
 # pylint: disable=unused-argument,protected-access
 
 import os
+import shutil
+import tempfile
 import unittest
 from secrets import token_hex
 from shutil import rmtree
@@ -13,6 +15,7 @@ from unittest.mock import Mock, patch
 from doorstop.common import DoorstopError
 from doorstop.core import publisher
 from doorstop.core.builder import build
+from doorstop.core.template import MANIFEST
 from doorstop.core.tests import EMPTY, ROOT, MockDataMixIn
 from doorstop.core.tests.helpers import on_error_with_retry
 
@@ -183,3 +186,77 @@ class TestModule(MockDataMixIn, unittest.TestCase):
         do_index = tmp_publisher.getMatrix()
         # Assert
         self.assertEqual(do_index, False)
+
+
+class TestIncremental(unittest.TestCase):
+    """Unit tests for incremental publishing."""
+
+    DOCUMENTS = {
+        "REQ": (None, ""),
+        "TST": ("REQ", "links: [REQ001]\n"),
+        "OTH": ("REQ", ""),
+    }
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp)
+        for prefix, (parent, links) in self.DOCUMENTS.items():
+            path = os.path.join(self.temp, prefix.lower())
+            os.makedirs(path)
+            with open(os.path.join(path, ".doorstop.yml"), "w") as stream:
+                stream.write("settings:\n  digits: 3\n  prefix: {}\n".format(prefix))
+                stream.write("  sep: ''\n")
+                if parent:
+                    stream.write("  parent: {}\n".format(parent))
+            with open(os.path.join(path, prefix + "001.yml"), "w") as stream:
+                stream.write("level: 1\ntext: {}\n{}".format(prefix.lower(), links))
+        self.output = os.path.join(self.temp, "public")
+
+    def publish(self, path=None, incremental=True):
+        """Publish the tree and return the prefixes of rendered documents."""
+        tree = build(cwd=self.temp, root=self.temp)
+        with patch(
+            "doorstop.core.publisher.publish_lines", wraps=publisher.publish_lines
+        ) as mock_publish_lines:
+            publisher.publish(tree, path or self.output, ".md", incremental=incremental)
+        calls = mock_publish_lines.call_args_list
+        return sorted(str(args[0].prefix) for args, _ in calls)
+
+    def read(self, path):
+        """Read the published text of each document."""
+        texts = {}
+        for name in os.listdir(path):
+            if name.endswith(".md") and name != "traceability.md":
+                with open(os.path.join(path, name)) as stream:
+                    texts[name] = stream.read()
+        return texts
+
+    def test_unchanged(self):
+        """Verify unchanged documents are not published again."""
+        self.assertEqual(["OTH", "REQ", "TST"], self.publish())
+        self.assertTrue(os.path.isfile(os.path.join(self.output, MANIFEST)))
+        self.assertEqual([], self.publish())
+
+    def test_changed_item(self):
+        """Verify documents showing a changed item are published again."""
+        self.publish()
+        with open(os.path.join(self.temp, "tst", "TST001.yml"), "a") as stream:
+            stream.write("header: changed\n")
+        self.assertEqual(["REQ", "TST"], self.publish())
+        expected = os.path.join(self.temp, "expected")
+        self.publish(expected, incremental=False)
+        self.assertEqual(self.read(expected), self.read(self.output))
+
+    def test_deleted_document(self):
+        """Verify outputs of deleted documents are removed."""
+        self.publish()
+        shutil.rmtree(os.path.join(self.temp, "oth"))
+        self.assertEqual(["REQ"], self.publish())
+        self.assertEqual(["REQ.md", "TST.md"], sorted(self.read(self.output)))
+
+    def test_not_incremental(self):
+        """Verify a full publish discards the manifest."""
+        self.publish()
+        self.assertEqual(["OTH", "REQ", "TST"], self.publish(incremental=False))
+        self.assertFalse(os.path.exists(os.path.join(self.output, MANIFEST)))
+        self.assertEqual(["OTH", "REQ", "TST"], self.publish())
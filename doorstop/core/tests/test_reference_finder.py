@@ -4,11 +4,15 @@
 """Unit tests for the doorstop.core.reference_finder module."""
 
 import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from doorstop import common
 from doorstop.common import DoorstopError
-from doorstop.core.reference_finder import ReferenceFinder
+from doorstop.core import cache
+from doorstop.core.reference_finder import ReferenceFinder, ReferenceScanner
 from doorstop.core.tests import TESTS_ROOT, MockItem, MockSimpleDocument
 from doorstop.core.vcs.mockvcs import WorkingCopy
 
@@ -139,3 +143,98 @@ class TestReferenceFinder(unittest.TestCase):
             reference_finder.find_file_reference(reference_path, root, tree, item_path)
 
         self.assertTrue("external reference not found" in str(context.exception))
+
+
+class TestReferenceScanner(unittest.TestCase):
+    """Unit tests for the ReferenceScanner class."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.paths = []
+        for filename, text in [
+            ("a.txt", "REQ10 is here\nREQ1 is here\n"),
+            ("REQ1", "text\n"),
+            ("b.txt", "xREQ1\nkeyword REF123\n"),
+        ]:
+            path = os.path.join(self.temp, filename)
+            common.write_text(text, path)
+            self.paths.append((path, filename, filename))
+        self.tree = Mock()
+        self.tree.vcs = WorkingCopy(self.temp)
+        self.tree.vcs._path_cache = self.paths  # pylint: disable=W0212
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def scan(self, refs, keywords=None):
+        scanner = ReferenceScanner(refs, keywords or {})
+        scanner.scan(self.paths)
+        return scanner
+
+    def test_find_ref(self):
+        """Verify all references are found with one scan."""
+        scanner = self.scan(["REQ1", "REQ10", "REF123"])
+        for ref in ["REQ1", "REQ10", "REF123"]:
+            expected = ReferenceFinder.find_ref(ref, self.tree, None)
+            self.assertEqual(expected, scanner.find_ref(ref, None))
+        self.assertEqual(("a.txt", 2), scanner.find_ref("REQ1", None))
+
+    def test_find_ref_skips_item_path(self):
+        """Verify a reference in the item's own file is skipped."""
+        scanner = self.scan(["REQ1", "REF123"])
+        self.assertEqual(("REQ1", None), scanner.find_ref("REQ1", self.paths[0][0]))
+        with self.assertRaises(DoorstopError):
+            scanner.find_ref("REF123", self.paths[2][0])
+
+    def test_find_ref_not_found(self):
+        """Verify a missing reference raises an error."""
+        scanner = self.scan(["REQ2"])
+        with self.assertRaises(DoorstopError):
+            scanner.find_ref("REQ2", None)
+
+    def test_find_ref_uses_scanner(self):
+        """Verify ReferenceFinder uses locations from a scanner."""
+        scanner = self.scan(["REQ1"])
+        self.tree.vcs._path_cache = []  # pylint: disable=W0212
+        path, line = ReferenceFinder.find_ref("REQ1", self.tree, None, scanner)
+        self.assertEqual(("a.txt", 2), (path, line))
+
+    def test_scan_index(self):
+        """Verify locations cached by an earlier scan are reused."""
+        index = cache.ReferenceCache(self.temp)
+        self.addCleanup(index.clear)
+        for path, _, _ in self.paths:
+            TestReferenceScanner._age(path)
+        keywords = {self.paths[2][0]: ["REF123"]}
+        expected = self.scan(["REQ1", "REQ10"], keywords)
+        ReferenceScanner(["REQ1", "REQ10"], keywords).scan(self.paths, index)
+        with patch("linecache.getlines", Mock(side_effect=AssertionError)):
+            scanner = ReferenceScanner(["REQ1", "REQ10"], keywords)
+            scanner.scan(self.paths, index)
+        self.assertEqual(expected.refs, scanner.refs)
+        self.assertEqual(expected.keywords, scanner.keywords)
+
+    @staticmethod
+    def _age(path, seconds=60):
+        """Make a file look like it was modified a while ago."""
+        mtime = os.stat(path).st_mtime_ns - seconds * 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_find_keyword(self):
+        """Verify keywords are found in their files."""
+        path = self.paths[2][0]
+        scanner = self.scan([], {path: ["REF123", "missing"]})
+        self.assertEqual(
+            ("b.txt", 2),
+            ReferenceFinder.find_file_reference(
+                "b.txt", self.temp, self.tree, None, "REF123", scanner
+            ),
+        )
+        with self.assertRaises(DoorstopError):
+            ReferenceFinder.find_file_reference(
+                "b.txt", self.temp, self.tree, None, "missing", scanner
+            )
+        with self.assertRaises(DoorstopError):
+            ReferenceFinder.find_file_reference(
+                "b.txt", self.temp, self.tree, path, "REF123", scanner
+            )
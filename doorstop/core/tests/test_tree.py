@@ -14,8 +14,17 @@ from unittest.mock import MagicMock, Mock, patch
 from doorstop.common import DoorstopError, DoorstopInfo, DoorstopWarning
 from doorstop.core.builder import build
 from doorstop.core.document import Document
-from doorstop.core.tests import EMPTY, FILES, SYS, MockDocumentSkip
+from doorstop.core.tests import (
+    EMPTY,
+    FILES,
+    SYS,
+    MockDocumentSkip,
+    MockItem,
+    MockSimpleDocument,
+)
 from doorstop.core.tree import Tree
+from doorstop.core.types import UID
+from doorstop.core.vcs.mockvcs import WorkingCopy
 
 
 @patch("doorstop.core.document.Document", MockDocumentSkip)
@@ -147,6 +156,19 @@ class TestTreeStrings(unittest.TestCase):
         self.assertEqual(3, len(tree))
         self.assertTrue(tree.validate())
 
+    def test_from_list_order(self):
+        """Verify children are ordered as placed by passes over the list."""
+        docs = []
+        for prefix, parent in (("A", None), ("D", "B"), ("B", "A"), ("C", "B")):
+            doc = MockDocumentSkip(EMPTY)
+            doc.prefix = prefix  # type: ignore
+            if parent:
+                doc.parent = parent  # type: ignore
+            docs.append(doc)
+        tree = Tree.from_list(docs)
+        self.assertEqual(["A", "B", "C", "D"], [d.prefix for d in tree.documents])
+        self.assertEqual([["B"], [], ["C", "D"], []], [d.children for d in docs])
+
     def test_from_list_no_root(self):
         """Verify an error occurs when the tree has no root."""
         a = MockDocumentSkip(EMPTY)
@@ -429,3 +451,151 @@ class TestTree(unittest.TestCase):
         self.assertEqual(0, len(self.tree))
         self.assertEqual(2, mock_delete.call_count)
         self.tree.delete()  # ensure a second delete is ignored
+
+
+class TestTreeLinkIndex(unittest.TestCase):
+    """Unit tests for the Tree class's reverse-link index."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self.parent_document = MockSimpleDocument()
+        self.child_document = MockSimpleDocument()
+        self.child_document.prefix = "TST"
+        self.child_document.parent = "RQ"
+        self.tree = Tree(self.parent_document, root=".")
+        self.tree.children = [Tree(self.child_document, parent=self.tree, root=".")]
+        self.tree._vcs = WorkingCopy(None)
+        self.parent_item = MockItem(
+            self.parent_document,
+            os.path.join("path", "to", "RQ001.yml"),
+            tree=self.tree,
+        )
+        self.child_item = MockItem(
+            self.child_document,
+            os.path.join("path", "to", "TST001.yml"),
+            tree=self.tree,
+            _file="links: [RQ001]\n",
+        )
+        self.other_item = MockItem(
+            self.child_document,
+            os.path.join("path", "to", "TST002.yml"),
+            tree=self.tree,
+        )
+        self.parent_document.set_items([self.parent_item])
+        self.child_document.set_items([self.child_item, self.other_item])
+
+    def test_child_items(self):
+        """Verify child items are found using the reverse-link index."""
+        self.assertEqual([self.child_item], self.parent_item.child_items)
+        self.assertEqual(["TST001"], self.parent_item.child_links)
+        self.assertEqual([self.child_document], self.parent_item.child_documents)
+        self.assertIsNotNone(self.tree._link_index)
+
+    def test_child_items_link(self):
+        """Verify the reverse-link index is updated when an item is linked."""
+        self.assertEqual([self.child_item], self.parent_item.child_items)
+        self.other_item.link("RQ001")
+        self.assertEqual(
+            [self.child_item, self.other_item], self.parent_item.child_items
+        )
+
+    def test_child_items_unlink(self):
+        """Verify the reverse-link index is updated when an item is unlinked."""
+        self.assertEqual([self.child_item], self.parent_item.child_items)
+        self.child_item.unlink("RQ001")
+        self.assertEqual([], self.parent_item.child_items)
+
+    def test_child_items_set_links(self):
+        """Verify the reverse-link index is updated when links are replaced."""
+        self.assertEqual([self.child_item], self.parent_item.child_items)
+        self.child_item.links = []
+        self.other_item.links = ["RQ001"]
+        self.assertEqual([self.other_item], self.parent_item.child_items)
+
+    def test_traceability(self):
+        """Verify traceability rows follow links down to items without children."""
+        self.assertEqual(
+            [(self.parent_item, self.child_item), (None, self.other_item)],
+            self.tree.get_traceability(),
+        )
+        self.other_item.link("RQ001")
+        self.other_item.active = False
+        self.assertEqual(
+            [(self.parent_item, self.child_item)], self.tree.get_traceability()
+        )
+
+    def test_traceability_cached(self):
+        """Verify traceability rows are reused until items change."""
+        rows = self.tree.get_traceability()
+        with patch.object(Tree, "_find_traceability") as mock_find:
+            self.assertEqual(rows, self.tree.get_traceability())
+            self.assertFalse(mock_find.called)
+        self.other_item.normative = False
+        self.assertEqual(
+            [(self.parent_item, self.child_item)], self.tree.get_traceability()
+        )
+        self.child_item.unlink("RQ001")
+        self.assertEqual(
+            [(self.parent_item, None), (None, self.child_item)],
+            self.tree.get_traceability(),
+        )
+
+    @patch("doorstop.settings.ADDREMOVE_FILES", False)
+    def test_child_items_delete(self):
+        """Verify the reverse-link index is updated when an item is deleted."""
+        self.assertEqual([self.child_item], self.parent_item.child_items)
+        self.child_item.delete(self.child_item.path)
+        self.assertEqual([], self.parent_item.child_items)
+
+
+class TestTreeItemIndex(unittest.TestCase):
+    """Unit tests for the Tree class's UID index."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        self.document = MockSimpleDocument()
+        self.tree = Tree(self.document, root=".")
+        self.tree._vcs = WorkingCopy(None)
+        self.item = MockItem(
+            self.document, os.path.join("path", "to", "RQ001.yml"), tree=self.tree
+        )
+        self.inactive_item = MockItem(
+            self.document,
+            os.path.join("path", "to", "RQ002.yml"),
+            tree=self.tree,
+            _file="active: false\n",
+        )
+        self.document.set_items([self.item, self.inactive_item])
+
+    @patch("doorstop.settings.CACHE_ITEMS", True)
+    def test_find_item(self):
+        """Verify the index is built on the first lookup."""
+        self.assertEqual(self.item, self.tree.find_item("rq001"))
+        self.assertTrue(self.tree._items_indexed)
+        self.assertEqual(self.inactive_item, self.tree._item_cache[UID("RQ002")])
+
+    @patch("doorstop.settings.CACHE_ITEMS", True)
+    def test_find_item_inactive(self):
+        """Verify inactive items are indexed but not returned."""
+        self.assertRaises(DoorstopError, self.tree.find_item, "RQ002")
+
+    @patch("doorstop.settings.CACHE_ITEMS", True)
+    def test_find_item_unknown(self):
+        """Verify unknown UIDs are cached without scanning documents."""
+        self.assertRaises(DoorstopError, self.tree.find_item, "RQ003")
+        self.assertIsNone(self.tree._item_cache[UID("RQ003")])
+        with patch.object(self.tree, "_index_items") as mock_index_items:
+            self.assertRaises(DoorstopError, self.tree.find_item, "RQ003")
+        mock_index_items.assert_not_called()
+
+    @patch("doorstop.settings.ADDREMOVE_FILES", False)
+    @patch("doorstop.settings.CACHE_ITEMS", True)
+    def test_delete_item(self):
+        """Verify an item is removed from the index when deleted."""
+        self.assertEqual(self.item, self.tree.find_item("RQ001"))
+        self.item.delete(self.item.path)
+        self.assertNotIn(UID("RQ001"), self.document._item_index)
+        self.assertIsNone(self.tree._item_cache[UID("RQ001")])
+        self.assertRaises(DoorstopError, self.tree.find_item, "RQ001")
@@ -32,6 +32,11 @@ class TestPrefix(unittest.TestCase):
         """Verify an exception is raised for a reserved word."""
         self.assertRaises(DoorstopError, Prefix, "ALL")
 
+    def test_init_interned(self):
+        """Verify equal prefixes share a single instance."""
+        self.assertIs(self.prefix1, Prefix("REQ (@/req)"))
+        self.assertIsNot(self.prefix1, Prefix("req"))
+
     def test_repr(self):
         """Verify prefixes can be represented."""
         self.assertEqual("Prefix('REQ')", repr(self.prefix1))
@@ -51,6 +56,12 @@ class TestPrefix(unittest.TestCase):
         self.assertNotEqual(None, self.prefix1)
         self.assertNotEqual("all", self.prefix1)
 
+    def test_hash(self):
+        """Verify prefixes hash like the strings they are equal to."""
+        self.assertEqual(hash("REQ"), hash(self.prefix1))
+        self.assertIn(self.prefix1, {"REQ": 1})
+        self.assertIn("REQ", {self.prefix1: 1})
+
     def test_sort(self):
         """Verify prefixes can be sorted."""
         prefixes = [Prefix("a"), Prefix("B"), Prefix("c")]
@@ -160,6 +171,11 @@ class TestUID(unittest.TestCase):
         self.assertEqual(UID("a", "-", "b"), UID("a", "-", "b"))
         self.assertNotEqual(UID("a", "-", "b"), UID("a", "-", "c"))
 
+    def test_hash(self):
+        """Verify UIDs that differ only in prefix case hash the same."""
+        self.assertEqual(hash(UID("REQ001")), hash(UID("req001")))
+        self.assertIn(UID("req1"), {self.uid1: 1})
+
     def test_le(self):
         """Verify UID's less operator."""
         self.assertTrue(UID("a", "-", 1, 0) < UID("a", "-", 2, 0))
@@ -1,20 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # SPDX-License-Identifier: LGPL-3.0-only
+# pylint: disable=C0302
 
 """Representation of a hierarchy of documents."""
 
+import logging
+import multiprocessing
+import os
 import sys
-from itertools import chain
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from doorstop import common, settings
-from doorstop.common import DoorstopError, DoorstopWarning
-from doorstop.core import vcs
-from doorstop.core.base import BaseValidatable
+from doorstop.common import DoorstopError, DoorstopInfo, DoorstopWarning
+from doorstop.core import cache, vcs
+from doorstop.core.base import BaseFileObject, BaseValidatable
 from doorstop.core.document import Document
-from doorstop.core.item import Item
+from doorstop.core.item import Item, _parse_item_file
+from doorstop.core.reference_finder import ReferenceScanner
 from doorstop.core.types import UID, Prefix
+from doorstop.core.validators.item_validator import ItemValidator
 
 UTF8 = "utf-8"
 CP437 = "cp437"
@@ -28,6 +35,10 @@ BOX = {
     "space": {UTF8: "    ", CP437: "    ", ASCII: "    "},
 }
 
+ISSUE_TYPES = {
+    cls.__name__: cls for cls in (DoorstopError, DoorstopWarning, DoorstopInfo)
+}
+
 log = common.logger(__name__)
 
 
@@ -54,42 +65,53 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
         """
         if not documents:
             return Tree(document=None, root=root)
-        unplaced = list(documents)
-        for document in list(unplaced):
-            if document.parent is None:
-                log.info("root of the tree: {}".format(document))
-                tree = Tree(document)
-                document.tree = tree
-                unplaced.remove(document)
-                break
-        else:
+        roots = [document for document in documents if document.parent is None]
+        if not roots:
             raise DoorstopError("no root document")
-
-        while unplaced:
-            count = len(unplaced)
-            for document in list(unplaced):
-                if document.parent is None:
-                    log.info("root of the tree: {}".format(document))
-                    message = "multiple root documents:\n- {}: {}\n- {}: {}".format(
-                        tree.document.prefix,
-                        tree.document.path,
-                        document.prefix,
-                        document.path,
-                    )
-                    raise DoorstopError(message)
-                try:
-                    tree._place(document)  # pylint: disable=W0212
-                except DoorstopError as error:
-                    log.debug(error)
+        log.info("root of the tree: {}".format(roots[0]))
+        if len(roots) > 1:
+            log.info("root of the tree: {}".format(roots[1]))
+            message = "multiple root documents:\n- {}: {}\n- {}: {}".format(
+                roots[0].prefix, roots[0].path, roots[1].prefix, roots[1].path
+            )
+            raise DoorstopError(message)
+        tree = Tree(roots[0])
+        roots[0].tree = tree
+
+        # Find the children of each parent prefix
+        positions = {id(document): index for index, document in enumerate(documents)}
+        children: Dict[str, List[Document]] = {}
+        for document in documents:
+            if document.parent:
+                children.setdefault(document.parent.lower(), []).append(document)
+
+        # Add children below their parents in the order they would be placed
+        # by repeated passes over the list, each placing the documents whose
+        # parent was already placed
+        passes = {id(roots[0]): 0}
+        nodes = [tree]
+        for node in nodes:  # breadth-first, so `nodes` grows while iterating
+            parent = node.document
+            parent_pass = passes[id(parent)]
+            placed = children.pop(parent.prefix.lower(), [])
+            for document in placed:
+                if parent_pass and positions[id(parent)] < positions[id(document)]:
+                    passes[id(document)] = parent_pass
                 else:
-                    log.info("added to tree: {}".format(document))
-                    document.tree = tree
-                    unplaced.remove(document)
+                    passes[id(document)] = parent_pass + 1
+            placed.sort(key=lambda d: (passes[id(d)], positions[id(d)]))
+            for document in placed:
+                log.info("added to tree: {}".format(document))
+                node.children.append(Tree(document, node))
+                document.tree = tree
+            parent.children = [child.prefix for child in placed]
+            nodes.extend(node.children)
 
-            if len(unplaced) == count:  # no more documents could be placed
-                log.debug("unplaced documents: {}".format(unplaced))
-                msg = "unplaced document: {}".format(unplaced[0])
-                raise DoorstopError(msg)
+        if len(nodes) < len(documents):  # some parents were never placed
+            unplaced = [d for d in documents if id(d) not in passes]
+            log.debug("unplaced documents: {}".format(unplaced))
+            msg = "unplaced document: {}".format(unplaced[0])
+            raise DoorstopError(msg)
 
         return tree
 
@@ -103,6 +125,10 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
         self._loaded = False
         self._item_cache: Dict[Union[str, UID], Item] = {}
         self._document_cache: Dict[str, Optional[Document]] = {}
+        self._link_index: Optional[Dict[UID, List[Item]]] = None
+        self._traceability: Optional[Tuple[Any, List[Item], Dict[Item, List]]] = None
+        self._items_indexed = False
+        self._reference_scanner: Optional[ReferenceScanner] = None
 
     def __repr__(self):
         return "<Tree {}>".format(self._draw_line())
@@ -138,6 +164,7 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
 
         """
         log.debug("trying to add {}...".format(document))
+        self._traceability = None
         if not self.document:  # tree is empty
             if document.parent:
                 msg = "unknown parent for {}: {}".format(document, document.parent)
@@ -145,23 +172,12 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
             self.document = document
 
         elif document.parent:  # tree has documents, document has parent
-            if document.parent.lower() == self.document.prefix.lower():
-                # Current document is the parent
-                node = Tree(document, self)
-                self.children.append(node)
-
-            else:
-                # Search for the parent
-                for child in self.children:
-                    try:
-                        child._place(document)  # pylint: disable=W0212
-                    except DoorstopError:
-                        pass  # the error is raised later
-                    else:
-                        break
-                else:
-                    msg = "unknown parent for {}: {}".format(document, document.parent)
-                    raise DoorstopError(msg)
+            node = self._find_node(document.parent)
+            if node is None:
+                msg = "unknown parent for {}: {}".format(document, document.parent)
+                raise DoorstopError(msg)
+            node.children.append(Tree(document, node))
+            node.document.children = [child.document.prefix for child in node.children]
 
         else:  # tree has documents, but no parent specified for document
             msg = "no parent specified for {}".format(document)
@@ -170,9 +186,22 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
             log.info("parent options: {}".format(prefixes))
             raise DoorstopError(msg)
 
-        for document2 in self:
-            children = self._get_prefix_of_children(document2)
-            document2.children = children
+    def _find_node(self, prefix):
+        """Find the first subtree (depth-first) whose document has a prefix.
+
+        :param prefix: document prefix to find (case-insensitive)
+
+        :return: matching :class:`~doorstop.core.tree.Tree` or None
+
+        """
+        prefix = prefix.lower()
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            if node.document.prefix.lower() == prefix:
+                return node
+            nodes.extend(reversed(node.children))
+        return None
 
     # attributes #############################################################
 
@@ -278,16 +307,8 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
 
         """
         uid = UID(value)
-        for document in self:
-            try:
-                document.find_item(uid)
-            except DoorstopError:
-                pass  # item not found in that document
-            else:
-                item = document.remove_item(uid, reorder=reorder)
-                return item
-
-        raise DoorstopError(UID.UNKNOWN_MESSAGE.format(k="", u=uid))
+        item = self.find_item(uid)
+        return item.document.remove_item(uid, reorder=reorder)
 
     def check_for_cycle(self, item, cid, path):
         """Check if a cyclic dependency would be created.
@@ -433,6 +454,8 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
         uid = UID(value)
         _kind = (" " + _kind) if _kind else _kind  # for logging messages
         log.debug("looking for{} item '{}'...".format(_kind, uid))
+        if settings.CACHE_ITEMS and not self._items_indexed:
+            self._index_items()
         try:
             item = self._item_cache[uid]
             if item:
@@ -444,20 +467,15 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
             else:
                 log.trace("found cached unknown: {}".format(uid))  # type: ignore
         except KeyError:
-            for document in self:
-                try:
-                    item = document.find_item(uid, _kind=_kind)
-                except DoorstopError:
-                    pass  # item not found in that document
-                else:
-                    log.trace("found item: {}".format(item))  # type: ignore
-                    if settings.CACHE_ITEMS:
-                        self._item_cache[uid] = item
-                        log.trace("cached item: {}".format(item))  # type: ignore
-                    if item.active:
-                        return item
+            if not settings.CACHE_ITEMS:
+                for document in self:
+                    try:
+                        item = document.find_item(uid, _kind=_kind)
+                    except DoorstopError:
+                        pass  # item not found in that document
                     else:
-                        log.trace("item is inactive: {}".format(item))  # type: ignore
+                        log.trace("found item: {}".format(item))  # type: ignore
+                        return item
 
             log.debug("could not find item: {}".format(uid))
             if settings.CACHE_ITEMS:
@@ -466,6 +484,95 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
 
         raise DoorstopError(UID.UNKNOWN_MESSAGE.format(k=_kind, u=uid))
 
+    def _index_items(self):
+        """Cache every item in the tree (including inactive items) by UID."""
+        log.debug("indexing items in the tree...")
+        for document in self:
+            for item in document:
+                if not self._item_cache.get(item.uid):
+                    self._item_cache[item.uid] = item
+        self._items_indexed = True
+
+    def _get_child_items(self, value):
+        """Get all items (including inactive items) that link to an UID.
+
+        :param value: item or UID
+
+        :return: list of :class:`~doorstop.core.item.Item`
+
+        """
+        uid = UID(value)
+        if self._link_index is None:
+            self._build_link_index()
+        return list(self._link_index.get(uid, []))  # type: ignore
+
+    def _build_link_index(self):
+        """Build the reverse-link index of parent UIDs to child items."""
+        log.debug("indexing links in the tree...")
+        index: Dict[UID, List[Item]] = {}
+        for document in self:
+            for item in document:
+                for uid in item.links:
+                    index.setdefault(uid, []).append(item)
+        self._link_index = index
+
+    def _index_links(self, item, added=(), removed=()):
+        """Update the reverse-link index after an item's links change.
+
+        :param item: :class:`~doorstop.core.item.Item` with changed links
+        :param added: UIDs the item now links to
+        :param removed: UIDs the item no longer links to
+
+        """
+        if added or removed:
+            self._traceability = None
+        if self._link_index is None:
+            return  # the index is built on first use
+        for uid in removed:
+            items = self._link_index.get(uid, [])
+            if item in items:
+                items.remove(item)
+        for uid in added:
+            items = self._link_index.setdefault(uid, [])
+            if item not in items:
+                items.append(item)
+
+    def _unindex_item(self, item):
+        """Remove a deleted item from the reverse-link index."""
+        self._traceability = None
+        if self._link_index is not None:
+            self._index_links(item, removed=item.links)
+
+    def _get_reference_scanner(self):
+        """Get the locations of all items' external references.
+
+        All references are searched for in one pass over the working copy
+        on first use, reusing the locations cached for unchanged files by
+        earlier runs. References added afterwards are searched for alone.
+
+        :return: :class:`~doorstop.core.reference_finder.ReferenceScanner`
+
+        """
+        if self._reference_scanner is None:
+            refs = set()
+            keywords: Dict[str, Set[str]] = {}
+            for document in self:
+                for item in document:
+                    if item.ref:
+                        refs.add(item.ref)
+                    for reference in item.references or []:
+                        if "keyword" in reference:
+                            path = os.path.join(item.root, reference["path"])
+                            path = os.path.normpath(path)
+                            keywords.setdefault(path, set()).add(reference["keyword"])
+            scanner = ReferenceScanner(refs, keywords)
+            index = None
+            if settings.CACHE_REFERENCES:
+                index = cache.get_references(self.root)
+            scanner.scan(self.vcs.paths, index=index)
+            self._reference_scanner = scanner
+        return self._reference_scanner
+
     def get_issues(self, skip=None, document_hook=None, item_hook=None):
         """Yield all the tree's issues.
 
@@ -483,108 +590,309 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
         # Check for documents
         if not documents:
             yield DoorstopWarning("no documents")
+        unchanged_writes = BaseFileObject.unchanged_writes
+        stamps = Item.stamp_hits, Item.stamp_misses
+        # Reuse the issues of items unaffected by changes since the last run
+        issues = None
+        incremental = settings.VALIDATE_INCREMENTAL and documents
+        if incremental:
+            key = self._get_validation_key(skip)
+            states = self._get_item_states()
+            issues = self._get_recorded_issues(key, states)
+        # Check items in worker processes
+        if settings.VALIDATE_JOBS > 1 and not settings.REORDER:
+            issues = {} if issues is None else issues
+            self._check_items_parallel(documents, skip, issues)
         # Check each document
         for document in documents:
             for issue in chain(
                 hook(document=document, tree=self),
-                document.get_issues(skip=skip, item_hook=item_hook),
+                document.get_issues(skip=skip, item_hook=item_hook, _issues=issues),
             ):
                 # Prepend the document's prefix to yielded exceptions
                 if isinstance(issue, Exception):
                     yield type(issue)("{}: {}".format(document.prefix, issue))
+        # Record the issues found for the next run
+        if incremental:
+            self._record_issues(key, states, issues)
+        unchanged_writes = BaseFileObject.unchanged_writes - unchanged_writes
+        if unchanged_writes:
+            log.info("skipped writing {} unchanged files".format(unchanged_writes))
+        hits = Item.stamp_hits - stamps[0]
+        misses = Item.stamp_misses - stamps[1]
+        if hits + misses:
+            log.debug(
+                "item stamps: {} hits, {} misses ({:.0%} hit rate)".format(
+                    hits, misses, hits / (hits + misses)
+                )
+            )
 
-    def get_traceability(self):
-        """Return sorted rows of traceability slices.
+    def _check_items_parallel(self, documents, skip, issues):
+        """Check items in a process pool and commit their changes in order.
 
-        :return: list of list of :class:`~doorstop.core.item.Item` or `None`
+        Workers check items without writing to their files. Afterwards, the
+        changes are applied and files are saved in the order a serial
+        validation would have saved them, stopping at the first item that
+        raised an error.
 
-        """
+        :param documents: documents to check
+        :param skip: list of document prefixes to skip
+        :param issues: dictionary of item UID to list of issues to fill in
 
-        def by_uid(row):
-            row2 = []
-            for item in row:
-                if item:
-                    row2.append("0" + str(item.uid))
-                else:
-                    row2.append("1")  # force `None` to sort after items
-            return row2
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            log.debug("checking items serially without `fork` support")
+            return
+        skip = [] if skip is None else skip
+        items = [
+            item
+            for document in documents
+            if document.prefix not in skip
+            for item in document.items
+            if item.uid not in issues
+        ]
+        if len(items) < 2:
+            return
+        jobs = settings.VALIDATE_JOBS
+        log.info("checking {} items with {} jobs...".format(len(items), jobs))
+        if settings.CHECK_REF and settings.CACHE_PATHS:
+            self._get_reference_scanner()  # share the references with the workers
+        chunksize = max(1, len(items) // (jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_check_worker,
+            initargs=(items,),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _check_item, range(len(items)), repeat(skip), chunksize=chunksize
+                )
+            )
+        # pylint: disable=W0212
+        for item, (events, data, text, error) in zip(items, results):
+            item._update_link_index(data["links"])
+            item._data = data
+            item._invalidate()
+            if text is not None:
+                item.save(_text=text)
+            issues[item.uid] = _replay_issues(events, error)
+            if error:
+                break
 
-        # Create mapping of document prefix to slice index
-        mapping = {}
-        for index, document in enumerate(self.documents):
-            mapping[document.prefix] = index
+    @staticmethod
+    def _get_validation_key(skip):
+        """Get values identifying the settings that affect item issues."""
+        return [
+            sorted(str(prefix) for prefix in skip or []),
+            settings.REFORMAT,
+            settings.CHECK_REF,
+            settings.CHECK_CHILD_LINKS,
+            settings.CHECK_CHILD_LINKS_STRICT,
+            settings.CHECK_SUSPECT_LINKS,
+            settings.CHECK_REVIEW_STATUS,
+            settings.REVIEW_NEW_ITEMS,
+            settings.STAMP_NEW_LINKS,
+            common.verbosity >= common.STR_VERBOSITY,  # issues include paths
+        ]
+
+    def _get_item_states(self):
+        """Get the state of every item that its issues depend on.
+
+        :return: dictionary of item UID to a dictionary of the item's
+            fingerprint, file modification time and size, and links
 
-        # Collect all rows
-        rows = set()
-        for index, document in enumerate(self.documents):
+        """
+        states: Dict[UID, Dict[str, Any]] = {}
+        for document in self:
+            context = [
+                document._data,  # pylint: disable=W0212
+                document.extended_reviewed,
+                sorted(str(prefix) for prefix in document.children),
+                sorted(str(d.prefix) for d in self if d.parent == document.prefix),
+            ]
             for item in document:
-                if item.active:
-                    for row in self._iter_rows(item, mapping):
-                        rows.add(row)
-
-        # Sort rows
-        return sorted(rows, key=by_uid)
-
-    def _get_prefix_of_children(self, document):
-        """Return the prefixes of the children of this document."""
-        for child in self.children:
-            if child.document == document:
-                children = [c.document.prefix for c in child.children]
-                return children
-        children = [c.document.prefix for c in self.children]
-        return children
-
-    def _iter_rows(
-        self, item, mapping, parent=True, child=True, row=None
-    ):  # pylint: disable=R0913
-        """Generate all traceability row slices.
+                try:
+                    stat = os.stat(item.path)
+                    data = item.data
+                except (OSError, DoorstopError):
+                    # the item's own validation reports the error
+                    states[item.uid] = {"fingerprint": None, "links": []}
+                    continue
+                states[item.uid] = {
+                    "fingerprint": cache.fingerprint(context, str(item.uid), data),
+                    "file": [stat.st_mtime_ns, stat.st_size],
+                    "links": [str(uid) for uid in item.links],
+                    "external": bool(item.ref or item.references),
+                }
+        return states
+
+    def _get_recorded_issues(self, key, states):
+        """Get the issues recorded for items unaffected by changes.
+
+        An item is affected when it changed, or when an item it links to
+        or an item linking to it was added, changed, or deleted.
+
+        :param key: values identifying the validation settings
+        :param states: current state of every item
 
-        :param item: base :class:`~doorstop.core.item.Item` for slicing
-        :param mapping: `dict` of document prefix to slice index
-        :param parent: indicate recursion is in the parent direction
-        :param child: indicates recursion is in the child direction
-        :param row: currently generated row
+        :return: dictionary of item UID to list of issues
 
         """
+        entries = cache.get_validation(self.root).get_entries(key)
+        changed = {UID(value) for value in entries} - set(states)
+        for uid, state in states.items():
+            entry = entries.get(str(uid))
+            if state["fingerprint"] is None or not entry:
+                changed.add(uid)
+            elif any(entry[name] != state[name] for name in ("fingerprint", "file")):
+                changed.add(uid)
+        dirty = set(changed)
+        for uid in changed:
+            # Parents check their child links, children check their links
+            old = entries.get(str(uid), {}).get("links", [])
+            new = states[uid]["links"] if uid in states else []
+            dirty.update(UID(value) for value in chain(old, new))
+            dirty.update(item.uid for item in self._get_child_items(uid))
+        issues = {}
+        for uid, state in states.items():
+            entry = entries.get(str(uid), {})
+            if uid in dirty or "issues" not in entry:
+                continue
+            if state["external"] and settings.CHECK_REF:
+                continue  # referenced files are not tracked
+            issues[uid] = [ISSUE_TYPES[name](msg) for name, msg in entry["issues"]]
+        log.info(
+            "reusing issues for {} of {} items...".format(len(issues), len(states))
+        )
+        return issues
+
+    def _record_issues(self, key, states, issues):
+        """Record the issues found in items for the next run.
 
-        class Row(list):
-            """List type that tracks upper and lower boundaries."""
+        :param key: values identifying the validation settings
+        :param states: state of every item before validation
+        :param issues: dictionary of item UID to list of issues
 
-            def __init__(self, *args, parent=False, child=False, **kwargs):
-                super().__init__(*args, **kwargs)
-                # Flags to indicate upper and lower bounds have been hit
-                self.parent = parent
-                self.child = child
+        """
+        entries = {}
+        for uid, state in self._get_item_states().items():
+            previous = states.get(uid)
+            if state["fingerprint"] is None or not previous:
+                continue
+            if previous["fingerprint"] != state["fingerprint"]:
+                continue  # changed during validation so checked again next run
+            entry = dict(state)
+            names = [type(issue).__name__ for issue in issues.get(uid, [])]
+            if uid in issues and all(name in ISSUE_TYPES for name in names):
+                entry["issues"] = [
+                    [name, str(issue)] for name, issue in zip(names, issues[uid])
+                ]
+            entries[str(uid)] = entry
+        cache.get_validation(self.root).set_entries(key, entries)
 
-        if item.normative:
-            # Start the next row or copy from recursion
-            if row is None:
-                row = Row([None] * len(mapping))
+    def get_traceability(self):
+        """Return sorted rows of traceability slices.
+
+        :return: list of list of :class:`~doorstop.core.item.Item` or `None`
+
+        """
+        return list(self.iter_traceability())
+
+    def iter_traceability(self):
+        """Yield sorted rows of traceability slices.
+
+        Each row places a chain of normative items in the columns of their
+        documents, from an active item without links down to an item
+        without children. Rows are yielded as they are found, so only the
+        items starting chains and the children of each item are kept
+        (until an item or document in the tree changes).
+
+        :return: generator of tuples of :class:`~doorstop.core.item.Item`
+            or `None`
+
+        """
+        if self._traceability is None:
+            self._traceability = self._find_traceability()
+        else:
+            log.debug("reusing the traceability links found earlier")
+        mapping, roots, children = self._traceability
+        row: List[Optional[Item]] = [None] * len(mapping)
+
+        def iter_rows(item):
+            column = mapping[item.document]
+            row[column] = item
+            if children[item]:
+                for child in children[item]:
+                    yield from iter_rows(child)
             else:
-                row = Row(row, parent=row.parent, child=row.child)
-
-            # Add the current item to the row
-            row[mapping[item.document.prefix]] = item
-
-            # Recurse to the next parent/child item
-            if parent:
-                items = item.parent_items
-                for item2 in items:
-                    yield from self._iter_rows(item2, mapping, child=False, row=row)
-                if not items:
-                    row.parent = True
-            if child:
-                items = item.child_items
-                for item2 in items:
-                    yield from self._iter_rows(item2, mapping, parent=False, row=row)
-                if not items:
-                    row.child = True
-
-            # Yield the row if both boundaries have been hit
-            if row.parent and row.child:
                 yield tuple(row)
+            row[column] = None
+
+        for item in roots:
+            yield from iter_rows(item)
 
-    def load(self, reload=False):
+    def _find_traceability(self):
+        """Find the items starting traceability chains and their children.
+
+        Rows sort by the UIDs in their columns, with `None` last. Documents
+        are listed before their descendants and an item's children are in
+        descendant documents, so rows are in order when both the items
+        starting chains and each item's children are sorted by column and
+        UID.
+
+        :return: mapping of document to column, list of items starting
+            chains, mapping of each item in a chain to its children in
+            chains (empty for items ending chains)
+
+        """
+        log.debug("finding traceability links...")
+        mapping = {}
+        for index, document in enumerate(self.documents):
+            mapping[document] = index
+        keys: Dict[Item, Tuple[int, str]] = {}
+        children: Dict[Item, List[Item]] = {}
+
+        def key(item):
+            if item not in keys:
+                keys[item] = (mapping[item.document], str(item.uid))
+            return keys[item]
+
+        def in_chain(item):
+            """Find an item's children and whether it is part of any chain."""
+            if item in children:
+                return True
+            if item in keys:
+                return False  # already found to not end in any chain
+            key(item)
+            prefix = item.document.prefix
+            found = [
+                child
+                for child in self._get_child_items(item.uid)
+                if child.document.parent == prefix
+            ]
+            if found:
+                # Inactive and non-normative children end their chains
+                found = [
+                    child
+                    for child in found
+                    if child.active and child.normative and in_chain(child)
+                ]
+                if not found:
+                    return False
+            children[item] = sorted(found, key=key)
+            return True
+
+        roots = [
+            item
+            for document in self.documents
+            for item in document
+            if item.active and item.normative and not item.links and in_chain(item)
+        ]
+        roots.sort(key=key)
+        return mapping, roots, children
+
+    def load(self, reload=False, jobs=None):
         """Load the tree's documents and items.
 
         Unlike the :class:`~doorstop.core.document.Document` and
@@ -593,15 +901,70 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
         content in large trees where lazy loading may cause long delays
         late in processing.
 
+        :param reload: reload documents and items that are already loaded
+        :param jobs: number of processes used to parse item files
+
         """
         if self._loaded and not reload:
             return
         log.info("loading the tree...")
-        for document in self:
-            document.load(reload=True)
+        if jobs and jobs > 1:
+            self._load_parallel(jobs)
+        else:
+            for document in self:
+                document.load(reload=True)
         # Set meta attributes
         self._loaded = True
 
+    def _load_parallel(self, jobs):
+        """Load the tree's items by parsing their files in a process pool.
+
+        Documents are scanned in the same order as a serial load, so
+        items keep their order and the first error a serial load would
+        have raised is the one raised here.
+
+        """
+        items: List[Item] = []
+        error = None
+        for document in self:
+            try:
+                document.load(reload=True, _parse_items=False)
+            except Exception as exc:  # pylint: disable=broad-except
+                error = exc  # raised after the items before it are loaded
+                break
+            items.extend(document._items)  # pylint: disable=W0212
+        # pylint: disable=W0212
+        cached = [item._get_parsed(item.path) for item in items]
+        pending = [item for item, data in zip(items, cached) if data is None]
+        if pending:
+            log.info("parsing {} items with {} jobs...".format(len(pending), jobs))
+            paths = [item.path for item in pending]
+            itemformats = [item.itemformat for item in pending]
+            chunksize = max(1, len(pending) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = executor.map(
+                    _parse_item_file, paths, itemformats, chunksize=chunksize
+                )
+                self._load_items(items, cached, results)
+        else:
+            self._load_items(items, cached, iter(()))
+        if error:
+            raise error
+
+    @staticmethod
+    def _load_items(items, cached, results):
+        """Store parsed data on items in order, reporting the first failure."""
+        # pylint: disable=W0212
+        for item, data in zip(items, cached):
+            try:
+                if data is None:
+                    text, data = next(results)
+                    item._cache_parsed(item.path, text, data)
+                item._load_data(data)
+            except Exception:
+                log.error("Unable to load: %s", item)
+                raise
+
     def draw(self, encoding=None, html_links=False):
         """Get the tree structure as text.
 
@@ -672,3 +1035,64 @@ class Tree(BaseValidatable):  # pylint: disable=R0902
             document.delete()
         self.document = None
         self.children = []
+
+
+_check_items: List[Item] = []  # items shared with forked worker processes
+_check_events: List[Any] = []  # log records and issues of the item being checked
+_check_saved: List[str] = []  # text the item being checked would be saved with
+
+
+def _record_log(_logger, record):
+    """Collect a log record in a worker process to replay it in order."""
+    record.msg = record.getMessage()
+    record.args = None
+    record.exc_info = None
+    _check_events.append(record)
+
+
+def _init_check_worker(items):
+    """Store the items to check in a forked worker process."""
+    global _check_items  # pylint: disable=global-statement
+    _check_items = items
+    logging.Logger.handle = _record_log  # type: ignore
+    Item.save = _save_check_item  # type: ignore
+
+
+def _save_check_item(item, _text=None):
+    """Collect the text an item would be saved with in a worker process."""
+    _check_saved.append(item._format())  # pylint: disable=W0212
+
+
+def _check_item(index, skip):
+    """Check an item in a worker process without saving it.
+
+    :param index: index of the item in the shared list
+    :param skip: list of document prefixes to skip
+
+    :return: list of log records and issues, the item's data afterwards,
+        the text the item would have been saved with or None, and the
+        error raised or None
+
+    """
+    item = _check_items[index]
+    del _check_saved[:]
+    del _check_events[:]
+    error = None
+    try:
+        for issue in ItemValidator().get_issues(item, skip=skip):
+            _check_events.append(issue)
+    except Exception as exc:  # pylint: disable=broad-except
+        error = exc  # raised when the serial position of the item is reached
+    text = _check_saved[-1] if _check_saved else None
+    return list(_check_events), item._data, text, error  # pylint: disable=W0212
+
+
+def _replay_issues(events, error):
+    """Replay a worker's log records and yield its issues in order."""
+    for event in events:
+        if isinstance(event, logging.LogRecord):
+            logging.getLogger(event.name).handle(event)
+        else:
+            yield event
+    if error:
+        raise error
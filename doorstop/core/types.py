@@ -6,7 +6,7 @@ import hashlib
 import os
 import re
 from base64 import urlsafe_b64encode
-from typing import Union
+from typing import Dict, Optional, Union
 
 import yaml
 
@@ -19,15 +19,24 @@ log = common.logger(__name__)
 class Prefix(str):
     """Unique document prefixes."""
 
+    __slots__ = ()
+
     UNKNOWN_MESSAGE = "no document with prefix: {}"
 
+    _interned: Dict[str, "Prefix"] = {}  # prefixes shared by every reference
+
     def __new__(cls, value=""):
         if isinstance(value, Prefix):
             return value
         else:
             if str(value).lower() in settings.RESERVED_WORDS:
                 raise DoorstopError("cannot use reserved word: %s" % value)
-            obj = super().__new__(cls, Prefix.load_prefix(value))  # type: ignore
+            text = Prefix.load_prefix(value)
+            obj = Prefix._interned.get(text) if cls is Prefix else None
+            if obj is None:
+                obj = super().__new__(cls, text)  # type: ignore
+                if cls is Prefix:
+                    Prefix._interned[text] = obj
             return obj
 
     def __repr__(self):
@@ -62,6 +71,8 @@ class Prefix(str):
 class UID:
     """Unique item ID built from document prefix and number."""
 
+    __slots__ = ("stamp", "value", "_prefix", "_number", "_name", "_exc")
+
     UNKNOWN_MESSAGE = "no{k} item with UID: {u}"  # k='parent'|'child', u=UID
 
     def __new__(cls, *args, **kwargs):  # pylint: disable=W0613
@@ -134,7 +145,8 @@ class UID:
         return self.value
 
     def __hash__(self):
-        return hash((self._prefix, self._number, self._name))
+        prefix = self._prefix.lower() if self._prefix else self._prefix
+        return hash((prefix, self._number, self._name))
 
     def __eq__(self, other):
         if not other:
@@ -267,18 +279,28 @@ class _Literal(str):
     def representer(dumper, data):
         """Return a custom dumper that formats str in the literal style."""
         return dumper.represent_scalar(
-            "tag:yaml.org,2002:str", data, style="|" if data else ""
+            "tag:yaml.org,2002:str", str(data), style="|" if data else ""
         )
 
 
 yaml.add_representer(_Literal, _Literal.representer)
+if getattr(yaml, "__with_libyaml__", False):
+    yaml.add_representer(_Literal, _Literal.representer, Dumper=yaml.CDumper)
 
 
 class Text(str):
     """Markdown text paragraph."""
 
+    __slots__ = ()
+
+    _empty: Optional["Text"] = None  # empty text shared by every default
+
     def __new__(cls, value=""):
         assert not isinstance(value, Text)
+        if not value and cls is Text:
+            if Text._empty is None:
+                Text._empty = super(Text, cls).__new__(cls, "")
+            return Text._empty
         obj = super(Text, cls).__new__(cls, Text.load_text(value))  # type: ignore
         return obj
 
@@ -324,6 +346,8 @@ class Level:
     identifying "heading" levels when written to file.
     """
 
+    __slots__ = ("_parts", "heading")
+
     def __init__(self, value=None, heading=None):
         """Initialize an item level from a sequence of numbers.
 
@@ -550,6 +574,8 @@ class Stamp:
 
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, *values):
         if not values:
             self.value = None
@@ -8,6 +8,7 @@ import os
 from doorstop import common
 from doorstop.common import DoorstopError
 from doorstop.core.vcs import git, mercurial, mockvcs, subversion, veracity
+from doorstop.core.vcs.base import batch
 
 DEFAULT = mockvcs.WorkingCopy
 DIRECTORIES = {
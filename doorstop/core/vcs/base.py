@@ -4,25 +4,53 @@
 
 import fnmatch
 import os
+import re
 import subprocess
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Pattern, Tuple
 
 from doorstop import common, settings
 
 log = common.logger(__name__)
 
+_batching = 0  # depth of batches applying to all working copies
+_pending: List["BaseWorkingCopy"] = []  # working copies with queued paths
+
 
 class BaseWorkingCopy(metaclass=ABCMeta):
-    """Abstract base class for VCS working copies."""
+    """Abstract base class for VCS working copies.
+
+    Operations on files can be batched by using a working copy as a
+    context manager or by running commands inside :func:`batch`. Batched
+    paths are passed to as few commands as possible when the outermost
+    context exits or before committing.
+
+    """
 
     DIRECTORY: Optional[str] = None  # special hidden directory for the working copy
     IGNORES: Tuple = ()  # hidden filenames containing ignore patterns
+    BATCH_SIZE = 100  # maximum number of paths passed to one command
 
     def __init__(self, path):
         self.path = path
         self._ignores_cache: Optional[List[str]] = None
         self._path_cache: Optional[List[Tuple[str, str, str]]] = None
+        self._path_index: Optional[Tuple[List, Dict, Dict]] = None
+        self._ignore_regexes: Optional[
+            Tuple[List[str], Pattern[str], Pattern[str]]
+        ] = None
+        self._depth = 0
+        self._queue: List[Tuple[Tuple, bool, Dict[str, None]]] = []
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *_):
+        self._depth -= 1
+        if not self._depth and not _batching:
+            self.flush()
 
     @staticmethod
     def relpath(path):
@@ -41,6 +69,39 @@ class BaseWorkingCopy(metaclass=ABCMeta):
         except FileNotFoundError:
             raise common.DoorstopError("Command not found: {}".format(args[0]))
 
+    def call_paths(self, *args, path, options=(), existing=True):
+        """Call a command on a path now or queue it when batching.
+
+        Consecutive queued calls of the same command are combined into
+        commands with the options followed by up to `BATCH_SIZE` paths.
+
+        :param args: command and arguments preceding the path
+        :param path: path to pass to the command
+        :param options: arguments following the path
+        :param existing: skip the path when flushing if it no longer exists
+
+        """
+        if not (self._depth or _batching):
+            self.call(*args, path, *options)
+            return
+        command = args + tuple(options)
+        if not self._queue or self._queue[-1][0] != command:
+            self._queue.append((command, existing, {}))
+        self._queue[-1][2][path] = None
+        if self not in _pending:
+            _pending.append(self)
+
+    def flush(self):
+        """Run all queued commands."""
+        queue, self._queue = self._queue, []
+        if self in _pending:
+            _pending.remove(self)
+        for command, existing, queued in queue:
+            paths = [path for path in queued if not existing or os.path.exists(path)]
+            log.debug("running {} for {} paths...".format(command[0], len(paths)))
+            for index in range(0, len(paths), self.BATCH_SIZE):
+                self.call(*command, *paths[index : index + self.BATCH_SIZE])
+
     @abstractmethod
     def lock(self, path):  # pragma: no cover (abstract method)
         """Pull, update, and lock a file for editing."""
@@ -84,25 +145,127 @@ class BaseWorkingCopy(metaclass=ABCMeta):
     @property
     def paths(self):
         """Yield non-ignored paths in the working copy."""
+        yield from self._get_paths()
+
+    def _get_paths(self):
+        """Get a list of non-ignored paths in the working copy."""
         if self._path_cache is None or not settings.CACHE_PATHS:
             log.debug("reading and caching all file paths...")
-            self._path_cache = []
-            for dirpath, _, filenames in os.walk(self.path):
-                for filename in filenames:
-                    path = os.path.join(dirpath, filename)
-                    relpath = os.path.relpath(path, self.path)
-                    # Skip ignored paths
-                    if self.ignored(relpath):
-                        continue
-                    # Skip hidden paths
-                    if os.path.sep + "." in os.path.sep + relpath:
-                        continue
-                    self._path_cache.append((path, filename, relpath))
-        yield from self._path_cache
+            self._path_cache = self._list_paths()
+        return self._path_cache
+
+    def _list_paths(self):
+        """Walk the working copy for non-ignored paths."""
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(self.path):
+            reldir = os.path.relpath(dirpath, self.path)
+            reldir = "" if reldir == os.curdir else reldir
+            # Skip hidden and ignored directories
+            dirnames[:] = [
+                dirname
+                for dirname in dirnames
+                if not dirname.startswith(".")
+                and not self.ignored_dir(os.path.join(reldir, dirname))
+            ]
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                relpath = os.path.join(reldir, filename)
+                # Skip ignored paths
+                if self.ignored(relpath):
+                    continue
+                # Skip hidden paths
+                if filename.startswith("."):
+                    continue
+                paths.append((path, filename, relpath))
+        return paths
+
+    def _get_path_index(self):
+        """Get the positions of non-ignored paths by path and by filename."""
+        paths = self._get_paths()
+        if self._path_index is None or self._path_index[0] is not paths:
+            log.debug("indexing all file paths...")
+            by_path: Dict[str, int] = {}
+            by_filename: Dict[str, List[int]] = {}
+            for position, (path, filename, _) in enumerate(paths):
+                by_path.setdefault(path, position)
+                by_filename.setdefault(filename, []).append(position)
+            self._path_index = (paths, by_path, by_filename)
+        return self._path_index
+
+    def find_path(self, path):
+        """Get the entry in `paths` for a path if it is not ignored.
+
+        :param path: path to a file in the working copy
+
+        :return: path, filename, and relative path or None
+
+        """
+        paths, by_path, _ = self._get_path_index()
+        position = by_path.get(path)
+        return None if position is None else paths[position]
+
+    def find_filename(self, filename):
+        """Get the entries in `paths` of non-ignored files with a name.
+
+        :param filename: name of the files
+
+        :return: list of position in `paths`, path, and relative path
+
+        """
+        paths, _, by_filename = self._get_path_index()
+        return [
+            (position, paths[position][0], paths[position][2])
+            for position in by_filename.get(filename, [])
+        ]
 
     def ignored(self, path):
         """Determine if a path matches an ignored pattern."""
-        for pattern in self.ignores:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-        return False
+        return bool(self._get_ignore_regexes()[0].match(os.path.normcase(path)))
+
+    def ignored_dir(self, path):
+        """Determine if every path in a directory matches an ignored pattern."""
+        path = os.path.normcase(os.path.join(path, ""))
+        return bool(self._get_ignore_regexes()[1].match(path))
+
+    def _get_ignore_regexes(self):
+        """Get regexes matching any ignored path and any ignored directory.
+
+        A directory is ignored when it matches a pattern ending in `*`, as
+        every path in it then matches the same pattern.
+
+        """
+        if self._ignores_cache is None:
+            self._ignores_cache = list(self.ignores)  # read the ignore patterns
+        patterns = self._ignores_cache
+        regexes = self._ignore_regexes
+        if regexes is None or regexes[0] is not patterns:
+            patterns_dir = [pattern for pattern in patterns if pattern.endswith("*")]
+            regexes = (
+                patterns,
+                _compile_patterns(patterns),
+                _compile_patterns(patterns_dir),
+            )
+            self._ignore_regexes = regexes
+        return regexes[1:]
+
+
+def _compile_patterns(patterns):
+    """Compile a single regex matching any of several glob patterns."""
+    if not patterns:
+        return re.compile("(?!)")
+    regexes = (fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    return re.compile("|".join(regexes))
+
+
+@contextmanager
+def batch():
+    """Batch the operations of all working copies until exiting."""
+    global _batching  # pylint: disable=global-statement
+    _batching += 1
+    try:
+        yield
+    finally:
+        _batching -= 1
+        if not _batching:
+            while _pending:
+                _pending[0].flush()
@@ -2,6 +2,10 @@
 
 """Plug-in module to store requirements in a Git repository."""
 
+import os
+import subprocess
+from typing import Optional, Set
+
 from doorstop import common
 from doorstop.core.vcs.base import BaseWorkingCopy
 
@@ -14,20 +18,103 @@ class WorkingCopy(BaseWorkingCopy):
     DIRECTORY = ".git"
     IGNORES = (".gitignore",)
 
+    def __init__(self, path):
+        super().__init__(path)
+        self._ignored_dirs: Optional[Set[str]] = None
+        self._ignored_dirs_unavailable = False
+
     def lock(self, path):
         log.debug("`git` does not support locking: %s", path)
         self.call("git", "pull")
 
     def edit(self, path):
-        self.call("git", "add", self.relpath(path))
+        self.call_paths("git", "add", path=self.relpath(path))
 
     def add(self, path):
-        self.call("git", "add", self.relpath(path))
+        self.call_paths("git", "add", path=self.relpath(path))
 
     def delete(self, path):
-        self.call("git", "rm", self.relpath(path), "--force", "--quiet")
+        self.call_paths(
+            "git",
+            "rm",
+            path=self.relpath(path),
+            options=("--force", "--quiet", "--ignore-unmatch"),
+            existing=False,
+        )
 
     def commit(self, message=None):
+        self.flush()
         message = message or input("Commit message: ")
         self.call("git", "commit", "--all", "--message", message)
         self.call("git", "push")
+
+    def _list_paths(self):
+        """List tracked and untracked, non-ignored paths from Git's index."""
+        try:
+            output = self.call(
+                "git",
+                "-C",
+                self.path,
+                "ls-files",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+                "-z",
+                return_stdout=True,
+            )
+        except (
+            common.DoorstopError,
+            subprocess.CalledProcessError,
+            UnicodeDecodeError,
+        ) as exc:
+            log.debug("unable to list files with `git`: {}".format(exc))
+            return super()._list_paths()
+        paths = []
+        for name in output.split("\0"):
+            relpath = os.path.normpath(name) if name else None
+            # Skip hidden paths
+            if not relpath or (os.path.sep + ".") in (os.path.sep + relpath):
+                continue
+            path = os.path.join(self.path, relpath)
+            # Skip deleted files and submodules
+            if not os.path.isfile(path):
+                continue
+            paths.append((path, os.path.basename(relpath), relpath))
+        return paths
+
+    def ignored_dir(self, path):
+        """Determine if Git ignores a directory and everything in it."""
+        if self._ignored_dirs is None and not self._ignored_dirs_unavailable:
+            self._ignored_dirs = self._list_ignored_dirs()
+            self._ignored_dirs_unavailable = self._ignored_dirs is None
+        if self._ignored_dirs is None:
+            return super().ignored_dir(path)
+        return os.path.normcase(os.path.normpath(path)) in self._ignored_dirs
+
+    def _list_ignored_dirs(self):
+        """List untracked directories that Git ignores as a whole."""
+        try:
+            output = self.call(
+                "git",
+                "-C",
+                self.path,
+                "ls-files",
+                "--others",
+                "--ignored",
+                "--exclude-standard",
+                "--directory",
+                "-z",
+                return_stdout=True,
+            )
+        except (
+            common.DoorstopError,
+            subprocess.CalledProcessError,
+            UnicodeDecodeError,
+        ) as exc:
+            log.debug("unable to list ignored directories with `git`: {}".format(exc))
+            return None
+        return {
+            os.path.normcase(os.path.normpath(name))
+            for name in output.split("\0")
+            if name.endswith("/")
+        }
@@ -19,15 +19,16 @@ class WorkingCopy(BaseWorkingCopy):
         self.call("hg", "pull", "-u")
 
     def edit(self, path):
-        self.call("hg", "add", path)
+        self.call_paths("hg", "add", path=path)
 
     def add(self, path):
-        self.call("hg", "add", path)
+        self.call_paths("hg", "add", path=path)
 
     def delete(self, path):
-        self.call("hg", "remove", path, "--force")
+        self.call_paths("hg", "remove", path=path, options=("--force",), existing=False)
 
     def commit(self, message=None):
+        self.flush()
         message = message or input("Commit message: ")
         self.call("hg", "commit", "--message", message)
         self.call("hg", "push")
@@ -22,14 +22,20 @@ class WorkingCopy(BaseWorkingCopy):
         log.debug("$ simulated lock on: {}...".format(path))
 
     def edit(self, path):
-        log.debug("$ simulated edit on: {}...".format(path))
+        self.call_paths("edit", path=path)
 
     def add(self, path):
-        log.debug("$ simulated add on: {}...".format(path))
+        self.call_paths("add", path=path)
 
     def delete(self, path):
         os.remove(path)
         log.debug("$ Deleted {}...".format(path))
 
     def commit(self, message=None):
+        self.flush()
         log.debug("$ simulated commit")
+
+    @staticmethod
+    def call(*args, return_stdout=False):
+        log.debug("$ simulated {} on: {}...".format(args[0], ", ".join(args[1:])))
+        return "" if return_stdout else 0
@@ -24,12 +24,13 @@ class WorkingCopy(BaseWorkingCopy):
         log.debug("`svn` adds all changes")
 
     def add(self, path):
-        self.call("svn", "add", path)
+        self.call_paths("svn", "add", path=path)
 
     def delete(self, path):
-        self.call("svn", "delete", path)
+        self.call_paths("svn", "delete", path=path, existing=False)
 
     def commit(self, message=None):
+        self.flush()
         message = message or input("Commit message: ")
         self.call("svn", "commit", "--message", message)
 
@@ -4,7 +4,7 @@
 
 import os
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from doorstop.core.tests import ROOT
 from doorstop.core.vcs.base import BaseWorkingCopy
@@ -56,3 +56,52 @@ class TestSampleWorkingCopy(unittest.TestCase):
         self.assertNotEqual(
             [], [x for x in paths if x.startswith(os.path.join("doorstop", ""))]
         )
+
+    def test_find_path(self):
+        """Verify non-ignored paths can be looked up."""
+        self.wc._path_cache = [  # pylint: disable=W0212
+            ("a/file.txt", "file.txt", "file.txt"),
+            ("a/b/file.txt", "file.txt", "b/file.txt"),
+        ]
+        self.assertEqual(
+            ("a/b/file.txt", "file.txt", "b/file.txt"),
+            self.wc.find_path("a/b/file.txt"),
+        )
+        self.assertIsNone(self.wc.find_path("a/ignored.txt"))
+
+    def test_find_filename(self):
+        """Verify non-ignored files can be looked up by name in order."""
+        self.wc._path_cache = [  # pylint: disable=W0212
+            ("a/file.txt", "file.txt", "file.txt"),
+            ("a/other.txt", "other.txt", "other.txt"),
+            ("a/b/file.txt", "file.txt", "b/file.txt"),
+        ]
+        self.assertEqual(
+            [(0, "a/file.txt", "file.txt"), (2, "a/b/file.txt", "b/file.txt")],
+            self.wc.find_filename("file.txt"),
+        )
+        self.assertEqual([], self.wc.find_filename("missing.txt"))
+
+    @patch("os.environ", {})
+    def test_find_path_ignored(self):
+        """Verify ignored and hidden paths are not found."""
+        wc = SampleWorkingCopy(ROOT)
+        path = os.path.join(ROOT, "doorstop", "__init__.py")
+        self.assertEqual(path, wc.find_path(path)[0])
+        self.assertIsNone(wc.find_path(os.path.join(ROOT, ".git", "HEAD")))
+
+    @patch("os.environ", {})
+    def test_paths_pruned(self):
+        """Verify hidden and ignored directories are not walked."""
+        walk = [(ROOT, [".git", "build", "doorstop"], ["ignored.txt", "setup.py"])]
+        wc = SampleWorkingCopy(ROOT)
+        with patch("os.walk", Mock(return_value=walk)):
+            paths = [relpath for _, _, relpath in wc.paths]
+        self.assertEqual(["setup.py"], paths)
+        self.assertEqual(["doorstop"], walk[0][1])
+
+    def test_ignored_changed_patterns(self):
+        """Verify new ignore patterns are used once they are replaced."""
+        self.assertFalse(self.wc.ignored("path/to/file.txt"))
+        self.wc._ignores_cache = ["*file*"]  # pylint: disable=W0212
+        self.assertTrue(self.wc.ignored("path/to/file.txt"))
@@ -2,10 +2,12 @@
 
 """Unit tests for the doorstop.vcs plugin modules."""
 
+import os
 import unittest
 from unittest.mock import Mock, call, patch
 
 from doorstop.common import DoorstopError
+from doorstop.core import vcs
 from doorstop.core.vcs import load
 
 
@@ -16,6 +18,7 @@ class BaseTestCase:
 
     path = "path/to/mock/file.txt"
     dirpath = "path/to/mock/directory/"
+    path2 = "path/to/mock/file2.txt"
     message = "A commit message"
 
     def setUp(self):
@@ -75,7 +78,9 @@ class TestGit(BaseTestCase, unittest.TestCase):
     def test_delete(self, mock_call):
         """Verify Git can delete files."""
         self.delete()
-        calls = [call(("git", "rm", self.path, "--force", "--quiet"))]
+        calls = [
+            call(("git", "rm", self.path, "--force", "--quiet", "--ignore-unmatch"))
+        ]
         mock_call.assert_has_calls(calls)
 
     def test_commit(self, mock_call):
@@ -87,6 +92,97 @@ class TestGit(BaseTestCase, unittest.TestCase):
         ]
         mock_call.assert_has_calls(calls)
 
+    @patch("os.path.exists", Mock(return_value=True))
+    def test_batch(self, mock_call):
+        """Verify Git combines batched paths into one command."""
+        with self.wc:
+            self.wc.edit(self.path)
+            self.wc.add(self.path2)
+            self.wc.edit(self.path)
+            self.assertFalse(mock_call.called)
+        calls = [call(("git", "add", self.path, self.path2))]
+        self.assertEqual(calls, mock_call.call_args_list)
+
+    @patch("os.path.exists", Mock(return_value=True))
+    def test_batch_order(self, mock_call):
+        """Verify Git runs batched commands in order."""
+        with vcs.batch():
+            self.wc.add(self.path)
+            self.wc.delete(self.path)
+            self.wc.add(self.path2)
+        calls = [
+            call(("git", "add", self.path)),
+            call(("git", "rm", "--force", "--quiet", "--ignore-unmatch", self.path)),
+            call(("git", "add", self.path2)),
+        ]
+        self.assertEqual(calls, mock_call.call_args_list)
+
+    @patch("os.path.exists", Mock(return_value=True))
+    def test_batch_size(self, mock_call):
+        """Verify Git splits large batches across commands."""
+        paths = ["path/to/file{}.txt".format(number) for number in range(150)]
+        with self.wc:
+            for path in paths:
+                self.wc.add(path)
+        calls = [
+            call(("git", "add", *paths[:100])),
+            call(("git", "add", *paths[100:])),
+        ]
+        self.assertEqual(calls, mock_call.call_args_list)
+
+    def test_batch_missing(self, mock_call):
+        """Verify Git skips batched paths deleted before flushing."""
+        with self.wc:
+            self.wc.add(self.path)
+        self.assertFalse(mock_call.called)
+
+    @patch("os.path.exists", Mock(return_value=True))
+    def test_batch_commit(self, mock_call):
+        """Verify Git runs batched commands before committing."""
+        with self.wc:
+            self.wc.add(self.path)
+            self.commit()
+        calls = [
+            call(("git", "add", self.path)),
+            call(("git", "commit", "--all", "--message", self.message)),
+            call(("git", "push")),
+        ]
+        self.assertEqual(calls, mock_call.call_args_list)
+
+    @patch("os.path.isfile", Mock(side_effect=lambda path: "deleted" not in path))
+    def test_paths(self, _):
+        """Verify Git lists paths from its index."""
+        output = b"a.txt\0.hidden/b.txt\0dir/c.txt\0deleted.txt\0"
+        with patch("subprocess.check_output", Mock(return_value=output)) as mock_ls:
+            paths = [relpath for _, _, relpath in self.wc.paths]
+        self.assertEqual(["a.txt", os.path.join("dir", "c.txt")], paths)
+        args = mock_ls.call_args[0][0]
+        self.assertEqual(("git", "-C", ".", "ls-files"), args[:4])
+
+    @patch("subprocess.check_output", Mock(side_effect=FileNotFoundError))
+    def test_paths_fallback(self, _):
+        """Verify Git walks the working copy when `git` cannot list paths."""
+        with patch("os.walk", Mock(return_value=[(".", [], ["a.txt"])])):
+            paths = list(self.wc.paths)
+        self.assertEqual([(os.path.join(".", "a.txt"), "a.txt", "a.txt")], paths)
+
+    def test_ignored_dir(self, _):
+        """Verify Git lists the directories it ignores once."""
+        output = b"build/\0dir/dist/\0a.log\0"
+        with patch("subprocess.check_output", Mock(return_value=output)) as mock_ls:
+            self.assertTrue(self.wc.ignored_dir("build"))
+            self.assertTrue(self.wc.ignored_dir(os.path.join("dir", "dist")))
+            self.assertFalse(self.wc.ignored_dir("dir"))
+            self.assertFalse(self.wc.ignored_dir("a.log"))
+        self.assertEqual(1, mock_ls.call_count)
+
+    @patch("subprocess.check_output", Mock(side_effect=FileNotFoundError))
+    def test_ignored_dir_fallback(self, _):
+        """Verify Git uses ignore patterns when `git` cannot list directories."""
+        self.wc._ignores_cache = ["*build*"]  # pylint: disable=W0212
+        self.assertTrue(self.wc.ignored_dir("build"))
+        self.assertFalse(self.wc.ignored_dir("dir"))
+
 
 @patch("subprocess.call")
 class TestSubversion(BaseTestCase, unittest.TestCase):
@@ -23,12 +23,13 @@ class WorkingCopy(BaseWorkingCopy):
         log.info("`vv` adds all changes")
 
     def add(self, path):
-        self.call("vv", "add", path)
+        self.call_paths("vv", "add", path=path)
 
     def delete(self, path):
-        self.call("vv", "remove", path)
+        self.call_paths("vv", "remove", path=path, existing=False)
 
     def commit(self, message=None):
+        self.flush()
         message = message or input("Commit message: ")
         self.call("vv", "commit", "--message", message)
         self.call("vv", "push")
@@ -38,6 +38,8 @@ CHECK_SUSPECT_LINKS = True  # check stamps on links
 CHECK_REVIEW_STATUS = True  # check stamps on items
 WARN_ALL = False  # display info-level issues as warnings
 ERROR_ALL = False  # display warning-level issues as errors
+VALIDATE_INCREMENTAL = False  # only re-validate items changed since the last run
+VALIDATE_JOBS = 1  # number of processes used to check items
 
 # Review settings
 REVIEW_NEW_ITEMS = True  # automatically review new items during validation
@@ -54,16 +56,27 @@ ENABLE_HEADERS = True  # use headers if defined
 WRITE_LINESEPERATOR = os.linesep
 
 # Document settings
+DOCUMENT_ROOTS: list = []  # paths in the project to search for documents (all if empty)
+DOCUMENT_EXCLUDES: list = []  # glob patterns of directories to skip searching
 DOC_REPO = "https://gitlab.sc.ascendingnode.tech:8443/pearl-systems/pearl_requirements"
 PROJECT = 'Pearl Requirements'
 
 # Version control settings
 ADDREMOVE_FILES = True  # automatically add/remove new/changed files
 
+# YAML settings
+USE_LIBYAML = True  # parse and dump YAML with libyaml's C bindings when installed
+LOAD_PARTIAL = True  # convert items' text attributes on first use instead of on load
+
 # Caching settings
 CACHE_ITEMS = True  # cache items in documents and trees
 CACHE_DOCUMENTS = True  # cache documents in trees
 CACHE_PATHS = True  # cache file/directory paths and contents
+CACHE_PARSED = False  # cache parsed files on disk between runs (enabled by the CLI)
+CACHE_PARSED_HASH = False  # also compare file contents to validate cached data
+CACHE_PARSED_SIZE = 64 * 1024 * 1024  # maximum size of cached data in bytes
+CACHE_REFERENCES = False  # cache reference locations on disk (enabled by the CLI)
+CACHE_MANIFEST = False  # cache document and item paths on disk (enabled by the CLI)
 
 # Server settings
 SERVER_HOST = None  # '' = server not specified, None = no server in use